@@ -3,15 +3,32 @@ Jira Flask Application
 
 A Flask-based REST API for managing and analyzing Jira issues.
 """
-from flask import Flask
+from flask import Flask, request
 from flask_cors import CORS
 from app.config import Config
 from app.routes.auth import auth_bp
 from app.routes.issues import issues_bp
 from app.routes.search import search_bp
 from app.routes.update import update_bp
-import logging
-import os
+from app.routes.audit import audit_bp
+from app.routes.webhooks import webhooks_bp
+from app.routes.export import export_bp
+from app.routes.fields import fields_bp
+from app.routes.worklogs import worklogs_bp
+from app.routes.metrics import metrics_bp
+from app.services.metrics_service import HTTP_REQUEST_DURATION
+from app.services.tracing_service import start_trace, current_trace, end_trace
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline_service import (
+    DeadlineExceeded,
+    start_deadline,
+    current_deadline,
+    end_deadline,
+    parse_client_deadline
+)
+from app.utils.logging_setup import configure_logging
+import json
+import time
 
 
 def create_app(config_class=Config):
@@ -22,20 +39,81 @@ def create_app(config_class=Config):
     # Enable CORS for Angular frontend
     CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
     
-    # Configure logging
-    log_file = os.getenv("LOG_FILE", "/shared/app.log")
-    logging.basicConfig(
-        level=logging.DEBUG,
-        filename=log_file,
-        filemode="a",
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    # Configure logging (queue-based, written by a background thread)
+    configure_logging(config_class)
     
     # Register blueprints
     app.register_blueprint(auth_bp, url_prefix="/api")
     app.register_blueprint(issues_bp, url_prefix="/api")
     app.register_blueprint(search_bp, url_prefix="/api")
     app.register_blueprint(update_bp, url_prefix="/api")
+    app.register_blueprint(audit_bp, url_prefix="/api")
+    app.register_blueprint(webhooks_bp, url_prefix="/api")
+    app.register_blueprint(export_bp, url_prefix="/api")
+    app.register_blueprint(fields_bp, url_prefix="/api")
+    app.register_blueprint(worklogs_bp, url_prefix="/api")
+    app.register_blueprint(metrics_bp)
+    
+    # Jira unavailable and nothing cached to fall back on: fail fast
+    @app.errorhandler(CircuitOpenError)
+    def _circuit_open(error):
+        return (
+            {"message": "Jira is temporarily unavailable. Please retry shortly."},
+            503,
+            {"Retry-After": str(max(1, int(error.retry_in)))}
+        )
+    
+    @app.errorhandler(DeadlineExceeded)
+    def _deadline_exceeded(error):
+        return {"message": "The request timed out waiting for Jira.", "error": str(error)}, 504
+    
+    # Per-route latency metrics and per-request Jira call tracing
+    @app.before_request
+    def _start_timer():
+        request.environ["app.start_time"] = time.perf_counter()
+        if request.path.startswith("/api/"):
+            start_trace()
+            start_deadline(parse_client_deadline(
+                request.headers.get("X-Request-Deadline-Ms"),
+                app.config["REQUEST_DEADLINE_SECONDS"],
+                app.config["REQUEST_DEADLINE_MAX_SECONDS"]
+            ))
+    
+    @app.after_request
+    def _record_latency(response):
+        started = request.environ.get("app.start_time")
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else "unmatched"
+            HTTP_REQUEST_DURATION.observe(
+                route, request.method, response.status_code,
+                value=time.perf_counter() - started
+            )
+        
+        deadline = current_deadline()
+        if deadline is not None and deadline.partial:
+            response.headers["X-Partial-Response"] = ",".join(sorted(deadline.partial))
+        
+        trace = current_trace()
+        if trace is not None:
+            response.headers["Server-Timing"] = trace.server_timing()
+            debug_requested = (
+                app.config.get("TRACE_DEBUG")
+                or request.headers.get("X-Debug-Timing") == "1"
+                or request.args.get("debug_timing") == "1"
+            )
+            if debug_requested and response.is_json and response.status_code != 304:
+                body = response.get_json(silent=True)
+                if isinstance(body, dict):
+                    body["_timing"] = trace.to_dict()
+                    response.set_data(json.dumps(body))
+        return response
+    
+    @app.teardown_request
+    def _end_request_context(error=None):
+        # Runs even when after_request is skipped (unhandled errors), so a
+        # reused worker thread never inherits this request's trace or deadline
+        end_deadline()
+        end_trace()
     
     return app
 
@@ -0,0 +1,70 @@
+"""
+Command-line tools for the Jira labeling backend.
+
+Usage:
+    python -m app.cli export 10456 --format csv --gzip -o filter-10456.csv.gz
+    python -m app.cli export 10456 --fields summary,status,customfield_10097 > issues.ndjson
+
+Credentials are read from JIRA_EMAIL and JIRA_API_TOKEN (or --email and
+--api-token); the instance defaults to JIRA_INSTANCE from the configuration.
+"""
+import argparse
+import logging
+import os
+import sys
+from app.config import Config
+from app.services.export_service import FORMATS, ExportError, export_stream, open_filter_export, parse_fields
+
+
+def _export(args):
+    email = args.email or os.getenv("JIRA_EMAIL")
+    api_token = args.api_token or os.getenv("JIRA_API_TOKEN")
+    if not email or not api_token:
+        print("JIRA_EMAIL and JIRA_API_TOKEN (or --email/--api-token) are required", file=sys.stderr)
+        return 2
+
+    fields = parse_fields(args.fields)
+    try:
+        issues = open_filter_export(args.filter_id, fields, email, api_token, args.instance)
+    except ExportError as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+
+    compress = args.gzip or (args.output or "").endswith(".gz")
+    out = open(args.output, "wb") if args.output and args.output != "-" else sys.stdout.buffer
+    try:
+        for chunk in export_stream(issues, fields, fmt=args.format, compress=compress):
+            out.write(chunk)
+    except ExportError as e:
+        print(f"Export aborted: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+        else:
+            out.flush()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Jira labeling backend tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="stream a saved filter's issues as NDJSON or CSV")
+    export.add_argument("filter_id")
+    export.add_argument("--format", choices=sorted(FORMATS), default="ndjson")
+    export.add_argument("--fields", help=f"comma-separated Jira fields (default: {Config.EXPORT_DEFAULT_FIELDS})")
+    export.add_argument("--gzip", action="store_true", help="gzip the output (implied by a .gz output name)")
+    export.add_argument("-o", "--output", help="output file (default: stdout)")
+    export.add_argument("--instance", default=Config.JIRA_INSTANCE)
+    export.add_argument("--email")
+    export.add_argument("--api-token")
+    export.set_defaults(handler=_export)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING"), stream=sys.stderr)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,112 @@ class Config:
     
     # Jira configuration
     JIRA_INSTANCE = os.environ.get("JIRA_INSTANCE", "infosim.atlassian.net")
+    JIRA_SCHEME = os.environ.get("JIRA_SCHEME", "https")  # "http" only for local fakes (benchmarks)
     
     # File paths
     SESSION_FILE = os.getenv("SESSION_FILE", "/shared/session_data.json")
     LOG_FILE = os.getenv("LOG_FILE", "/shared/app.log")
-    UPDATED_ISSUES_LOG = os.getenv("UPDATED_ISSUES_LOG", "/shared/updated_issues.log")
+    
+    # Audit log (SQLite, written in batches by a background thread)
+    AUDIT_DB = os.getenv("AUDIT_DB", "/shared/audit_log.db")
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "100"))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1.0"))
+    # Users (comma separated emails) who may read other users' audit entries
+    AUDIT_ADMIN_EMAILS = os.getenv("AUDIT_ADMIN_EMAILS", "")
+    
+    # Background side effects (watcher add) run after the response is sent
+    JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+    JOB_QUEUE_MAX_BACKLOG = int(os.getenv("JOB_QUEUE_MAX_BACKLOG", "1000"))
+    JOB_MAX_RETRIES = int(os.getenv("JOB_MAX_RETRIES", "3"))
+    JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "1.0"))
+    
+    # Write-behind updates: journaled locally, coalesced and flushed in the background.
+    # Enabled globally here or per request with {"write_behind": true}.
+    WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "False").lower() == "true"
+    WRITE_BEHIND_DB = os.getenv("WRITE_BEHIND_DB", "/shared/write_behind.db")
+    WRITE_BEHIND_COALESCE_SECONDS = float(os.getenv("WRITE_BEHIND_COALESCE_SECONDS", "5"))
+    WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv("WRITE_BEHIND_MAX_ATTEMPTS", "5"))
+    
+    # Cache for Jira data (see app/services/cache_service.py)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # memory | sqlite | redis | none
+    CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "/shared/cache.db")
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "60"))
+    CACHE_STALE_SECONDS = int(os.getenv("CACHE_STALE_SECONDS", "600"))
+    CACHE_ISSUE_TTL = int(os.getenv("CACHE_ISSUE_TTL", "60"))
+    CACHE_FILTER_TTL = int(os.getenv("CACHE_FILTER_TTL", "300"))
+    CACHE_COUNT_TTL = int(os.getenv("CACHE_COUNT_TTL", "30"))
+    CACHE_WORKLOG_TTL = int(os.getenv("CACHE_WORKLOG_TTL", "300"))
+    CACHE_FIELD_OPTIONS_TTL = int(os.getenv("CACHE_FIELD_OPTIONS_TTL", "3600"))
+    
+    # Shared, per-user fair thread pool for parallel Jira calls
+    FAIR_EXECUTOR_WORKERS = int(os.getenv("FAIR_EXECUTOR_WORKERS", "32"))
+    
+    # Hierarchy traversal budget (requests may tighten it with query parameters).
+    # Link type lists are comma separated; issues beyond HIERARCHY_COLLAPSE_DEPTH
+    # hops are returned as keys only (-1: off)
+    HIERARCHY_MAX_DEPTH = int(os.getenv("HIERARCHY_MAX_DEPTH", "10"))
+    HIERARCHY_MAX_NODES = int(os.getenv("HIERARCHY_MAX_NODES", "500"))
+    HIERARCHY_ALLOW_LINK_TYPES = os.getenv("HIERARCHY_ALLOW_LINK_TYPES", "")
+    HIERARCHY_DENY_LINK_TYPES = os.getenv("HIERARCHY_DENY_LINK_TYPES", "")
+    HIERARCHY_COLLAPSE_DEPTH = int(os.getenv("HIERARCHY_COLLAPSE_DEPTH", "-1"))
+    
+    # Next-issue lookup: order used when a filter has no ORDER BY, and how long
+    # labeled issues stay excluded while Jira's search index catches up
+    JQL_DEFAULT_ORDER_BY = os.getenv("JQL_DEFAULT_ORDER_BY", "key ASC")
+    RECENTLY_LABELED_SECONDS = int(os.getenv("RECENTLY_LABELED_SECONDS", "300"))
+    
+    # Filter export (/api/filters/<id>/export, python -m app.cli export)
+    EXPORT_DEFAULT_FIELDS = os.getenv(
+        "EXPORT_DEFAULT_FIELDS",
+        "summary,status,assignee,updated,customfield_10097,customfield_10384"
+    )
+    
+    # Local full-text index for /api/filters/<id>/search (SQLite FTS5)
+    SEARCH_INDEX_DB = os.getenv("SEARCH_INDEX_DB", "/shared/search_index.db")
+    SEARCH_INDEX_REFRESH_SECONDS = int(os.getenv("SEARCH_INDEX_REFRESH_SECONDS", "60"))
+    SEARCH_INDEX_REBUILD_SECONDS = int(os.getenv("SEARCH_INDEX_REBUILD_SECONDS", "3600"))
+    # How long a first search waits for the index to be built before answering 202 "indexing"
+    SEARCH_INDEX_INLINE_WAIT_SECONDS = float(os.getenv("SEARCH_INDEX_INLINE_WAIT_SECONDS", "3"))
+    SEARCH_INDEX_SYNC_DEADLINE_SECONDS = float(os.getenv("SEARCH_INDEX_SYNC_DEADLINE_SECONDS", "300"))
+    
+    # Worklog treemap: issues kept per research project before folding into "Other"
+    TREEMAP_TOP_N = int(os.getenv("TREEMAP_TOP_N", "10"))
+    # Longest from/to window accepted by /api/worklogs
+    WORKLOG_MAX_RANGE_DAYS = int(os.getenv("WORKLOG_MAX_RANGE_DAYS", "366"))
+    
+    # Research project suggestions (nearest neighbours over labeled issues)
+    SUGGEST_TOP_K = int(os.getenv("SUGGEST_TOP_K", "3"))
+    SUGGEST_NEIGHBOURS = int(os.getenv("SUGGEST_NEIGHBOURS", "15"))
+    SUGGEST_MAX_TRAINING_ISSUES = int(os.getenv("SUGGEST_MAX_TRAINING_ISSUES", "5000"))
+    SUGGEST_REFRESH_SECONDS = int(os.getenv("SUGGEST_REFRESH_SECONDS", "600"))
+    SUGGEST_SYNC_DEADLINE_SECONDS = float(os.getenv("SUGGEST_SYNC_DEADLINE_SECONDS", "300"))
+    
+    # Jira circuit breaker and retry budget (per Jira instance)
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+    CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
+    JIRA_MAX_RETRY_SLEEP = float(os.getenv("JIRA_MAX_RETRY_SLEEP", "10"))
+    
+    # End-to-end deadline per API request; clients may set their own budget
+    # with the X-Request-Deadline-Ms header, up to REQUEST_DEADLINE_MAX_SECONDS
+    REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "25"))
+    REQUEST_DEADLINE_MAX_SECONDS = float(os.getenv("REQUEST_DEADLINE_MAX_SECONDS", "120"))
+    JOB_DEADLINE_SECONDS = float(os.getenv("JOB_DEADLINE_SECONDS", "30"))
+    
+    # Jira webhooks (/api/webhooks/jira); the endpoint is disabled when unset
+    JIRA_WEBHOOK_SECRET = os.getenv("JIRA_WEBHOOK_SECRET", "")
+    
+    # Logging (records are written by a background thread, see app/utils/logging_setup.py)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS = os.getenv("LOG_LEVELS", "urllib3=WARNING")  # e.g. "app.services.jira_service=DEBUG"
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    
+    # Always attach the Jira call breakdown ("_timing") to JSON API responses.
+    # Per request it can be enabled with the X-Debug-Timing: 1 header or ?debug_timing=1.
+    TRACE_DEBUG = os.getenv("TRACE_DEBUG", "False").lower() == "true"
     
     # Jira custom field IDs
     CUSTOM_FIELD_RESEARCH_PROJECT = "customfield_10097"
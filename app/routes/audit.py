@@ -0,0 +1,48 @@
+"""
+Audit routes for querying the labeling audit log.
+"""
+from flask import Blueprint, request, session, jsonify
+from app.config import Config
+from app.services.session_service import load_session
+from app.services.audit_service import get_audit_log
+import logging
+
+audit_bp = Blueprint("audit", __name__)
+logger = logging.getLogger(__name__)
+
+
+def _is_audit_admin(email):
+    admins = {e.strip().lower() for e in Config.AUDIT_ADMIN_EMAILS.split(",") if e.strip()}
+    return email.strip().lower() in admins
+
+
+@audit_bp.route("/audit", methods=["GET"])
+def get_audit_entries():
+    """
+    Query labeling actions by issue key and/or user (who labeled what, when).
+    Users see their own entries; only AUDIT_ADMIN_EMAILS may ask for another
+    user's, or for everyone's with user=*.
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    try:
+        limit = min(int(request.args.get("limit", "100")), 1000)
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    
+    email = session["jira_email"]
+    user = request.args.get("user") or email
+    if user.lower() != email.lower() and not _is_audit_admin(email):
+        logger.warning("[AUDIT] %s denied audit entries of %s", email, user)
+        return jsonify({"message": "Forbidden"}), 403
+    
+    entries = get_audit_log().query(
+        issue_key=request.args.get("issue_key"),
+        user=None if user == "*" else user,
+        since=request.args.get("since"),
+        limit=limit
+    )
+    return jsonify({"entries": entries, "count": len(entries)}), 200
@@ -3,6 +3,8 @@ Authentication routes for Jira login API.
 """
 from flask import Blueprint, request, session, jsonify
 from app.services.session_service import save_session, load_session
+from app.services.jira_service import get_myself
+from app.services.write_behind import get_write_buffer, write_buffer_active
 from app.config import Config
 import logging
 
@@ -12,22 +14,44 @@ logger = logging.getLogger(__name__)
 
 @auth_bp.route("/login", methods=["POST"])
 def login():
-    """Handle user login and store credentials in session."""
+    """
+    Validate credentials against Jira, resolve the user's identity once
+    and store both in the session.
+    """
     data = request.get_json()
     
     if not data or not data.get("email") or not data.get("api_token"):
         return jsonify({"message": "Email and API token are required"}), 400
     
+    jira_instance = data.get("jira_instance") or Config.JIRA_INSTANCE
+    identity, status_code = get_myself(data["email"], data["api_token"], jira_instance)
+    
+    if identity is None:
+        if status_code in (401, 403):
+            return jsonify({"message": "Invalid Jira email or API token"}), 401
+        return jsonify({"message": "Could not verify credentials with Jira"}), 502
+    
+    session.clear()
     session["jira_email"] = data["email"]
     session["jira_api_token"] = data["api_token"]
-    session["jira_instance"] = data.get("jira_instance", Config.JIRA_INSTANCE)
+    session["jira_instance"] = jira_instance
+    session["jira_account_id"] = identity["account_id"]
+    session["jira_display_name"] = identity["display_name"]
+    session["jira_timezone"] = identity["timezone"]
     save_session()
     
-    logger.debug(f"Session after login: {dict(session)}")
+    if write_buffer_active():
+        # Resume journaled writes left over from a previous run
+        get_write_buffer().register_credentials(jira_instance, data["email"], data["api_token"])
+    
+    logger.debug("Session after login: keys=%s", list(session.keys()))
     
     return jsonify({
         "message": "Login successful",
-        "jira_instance": session["jira_instance"]
+        "jira_instance": session["jira_instance"],
+        "account_id": identity["account_id"],
+        "display_name": identity["display_name"],
+        "timezone": identity["timezone"]
     }), 200
 
 
@@ -45,7 +69,10 @@ def get_session():
     if "jira_email" in session:
         return jsonify({
             "authenticated": True,
-            "jira_instance": session.get("jira_instance")
+            "jira_instance": session.get("jira_instance"),
+            "account_id": session.get("jira_account_id"),
+            "display_name": session.get("jira_display_name"),
+            "timezone": session.get("jira_timezone")
         }), 200
     return jsonify({"authenticated": False}), 200
 
@@ -0,0 +1,67 @@
+"""
+Export routes for downloading a saved filter's issues.
+"""
+from flask import Blueprint, Response, request, session, jsonify, stream_with_context
+from app.services.session_service import load_session
+from app.services.export_service import (
+    FORMATS,
+    ExportError,
+    export_stream,
+    open_filter_export,
+    parse_fields
+)
+import logging
+
+export_bp = Blueprint("export", __name__)
+logger = logging.getLogger(__name__)
+
+
+def _abort_on_error(chunks, filter_id):
+    """
+    Log an export that fails after streaming started. The error is re-raised
+    so the server drops the connection without the final chunk and the
+    client sees an incomplete download instead of a silently short file.
+    """
+    try:
+        yield from chunks
+    except ExportError as e:
+        logger.error("[EXPORT] Export of filter %s aborted: %s", filter_id, e)
+        raise
+
+
+@export_bp.route("/filters/<filter_id>/export", methods=["GET"])
+def export_filter(filter_id):
+    """
+    Stream all issues of a saved filter as NDJSON or CSV.
+    Query parameters: format=ndjson|csv, fields=summary,status,..., gzip=1
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    fmt = request.args.get("format", "ndjson").lower()
+    if fmt not in FORMATS:
+        return jsonify({"message": f"format must be one of {', '.join(FORMATS)}"}), 400
+    compress = request.args.get("gzip", "").lower() in ("1", "true", "yes")
+    fields = parse_fields(request.args.get("fields"))
+    
+    try:
+        issues = open_filter_export(
+            filter_id,
+            fields,
+            session["jira_email"],
+            session["jira_api_token"],
+            session["jira_instance"]
+        )
+    except ExportError as e:
+        return jsonify({"message": str(e)}), e.status_code
+    
+    filename = f"filter-{filter_id}.{fmt}" + (".gz" if compress else "")
+    logger.info("[EXPORT] Streaming filter %s as %s (gzip=%s, fields=%s)", filter_id, fmt, compress, fields)
+    # gzip is delivered as a .gz file, not Content-Encoding, so clients keep it compressed
+    return Response(
+        stream_with_context(_abort_on_error(export_stream(issues, fields, fmt=fmt, compress=compress), filter_id)),
+        mimetype="application/gzip" if compress else FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
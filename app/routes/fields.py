@@ -0,0 +1,33 @@
+"""
+Field routes for the allowed values of the labeling custom fields.
+"""
+from flask import Blueprint, request, session, jsonify
+from app.services.session_service import load_session
+from app.services.field_service import get_update_options
+import logging
+
+fields_bp = Blueprint("fields", __name__)
+logger = logging.getLogger(__name__)
+
+
+@fields_bp.route("/fields/options", methods=["GET"])
+def field_options():
+    """
+    Allowed research project and chargeable options (cached).
+    Pass issue_key=KEY to fall back to that issue's edit metadata when
+    field contexts are not readable with the user's permissions.
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    options = get_update_options(
+        session["jira_email"],
+        session["jira_api_token"],
+        session["jira_instance"],
+        issue_key=request.args.get("issue_key")
+    )
+    if all(field["options"] is None for field in options.values()):
+        return jsonify({"message": "Could not load field options from Jira.", "fields": options}), 502
+    return jsonify({"fields": options}), 200
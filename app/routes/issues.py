@@ -1,18 +1,126 @@
 """
 Issue management routes for viewing Jira issues API.
 """
-from flask import Blueprint, request, session, jsonify
+from flask import Blueprint, request, session, jsonify, make_response
 from app.services.session_service import load_session
 from app.services.jira_service import (
-    get_issue_hierarchy
+    HierarchyLimits,
+    get_issue_hierarchy,
+    get_issue_versions
 )
+from app.services.cache_service import get_cache, cache_key
+from app.services.deadline_service import is_partial
+from app.services.suggestion_service import get_suggestion_engine
 from app.config import Config
+import hashlib
+import json
 import logging
 
 issues_bp = Blueprint("issues", __name__)
 logger = logging.getLogger(__name__)
 
 
+def build_issue_response(issues_info, total_issues, truncation=None):
+    """Build the /api/fetch_issue payload for an issue hierarchy."""
+    truncation = dict(truncation or {})
+    return {
+        "issues": issues_info,
+        "collapsed": truncation.pop("collapsed", []),
+        "truncation": truncation,
+        "total_issues": total_issues,
+        "assignee_name": issues_info[0].get("assignee_name", "Unassigned"),
+        "task_time_spent": issues_info[0].get("timespent", 0),
+        "suggestions": get_suggestion_engine().suggest(
+            issues_info[0],
+            session["jira_email"],
+            session["jira_api_token"],
+            session["jira_instance"]
+        )
+    }
+
+
+def hierarchy_etag(versions, total_issues, limits_key="", suggestions=None):
+    """
+    Strong ETag for a fetch_issue payload: a hash of the hierarchy's issue
+    keys with their `updated` timestamps, plus the total_issues counter
+    echoed in the response, the traversal limits it was built with and the
+    root issue's suggested projects in rank order. Scores are left out: they
+    drift slightly with every label anyone adds, which would defeat 304s.
+    """
+    digest = hashlib.sha256()
+    for key in sorted(versions):
+        digest.update(f"{key}={versions[key]}\n".encode("utf-8"))
+    digest.update(f"total={total_issues}\nlimits={limits_key}\n".encode("utf-8"))
+    digest.update(json.dumps([s["research_project"] for s in suggestions or []]).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _int_arg(name):
+    """Optional non-negative integer query parameter; raises ValueError if invalid."""
+    value = request.args.get(name)
+    if value is None or value == "":
+        return None
+    number = int(value)
+    if number < 0:
+        raise ValueError(name)
+    return number
+
+
+def hierarchy_limits_from_request():
+    """
+    Traversal limits from the query string: max_depth, max_nodes,
+    collapse_depth, link_types and exclude_link_types (comma separated).
+    Values can only tighten the configured HIERARCHY_* limits.
+    Raises ValueError for malformed values.
+    """
+    return HierarchyLimits(
+        max_depth=_int_arg("max_depth"),
+        max_nodes=_int_arg("max_nodes"),
+        allow_link_types=request.args.get("link_types"),
+        deny_link_types=request.args.get("exclude_link_types"),
+        collapse_depth=_int_arg("collapse_depth")
+    )
+
+
+def _not_modified(issue_key, total_issues, limits):
+    """
+    Return the ETag if the client's If-None-Match is still current, else None.
+    Checks the hierarchy's keys from the last full fetch with one bulk
+    search for `updated` instead of walking the hierarchy again.
+    """
+    if not request.if_none_match:
+        return None, None
+    
+    keys = get_cache().get_stale(
+        cache_key("hierarchy_keys", session["jira_instance"], session["jira_email"], issue_key, limits.key())
+    )
+    if not keys:
+        return None, None
+    
+    versions = get_issue_versions(
+        keys,
+        session["jira_email"],
+        session["jira_api_token"],
+        session["jira_instance"]
+    )
+    if versions is None or set(versions) != set(keys):
+        return None, versions
+    
+    # Suggestions for the unchanged root come from its cached node (memoised, no Jira call)
+    root = get_cache().get_stale(cache_key("issue", session["jira_instance"], session["jira_email"], issue_key))
+    if root is None or root["issue"].get("updated") != versions.get(issue_key):
+        return None, versions
+    suggestions = get_suggestion_engine().suggest(
+        root["issue"],
+        session["jira_email"],
+        session["jira_api_token"],
+        session["jira_instance"]
+    )
+    
+    etag = hierarchy_etag(versions, total_issues, limits.key(), suggestions)
+    return (etag if request.if_none_match.contains(etag) else None), versions
+
+
 @issues_bp.route("/fetch_issue", methods=["GET"])
 def fetch_issue():
     """Fetch and return a Jira issue with its hierarchy and statistics as JSON."""
@@ -25,31 +133,63 @@ def fetch_issue():
     if not issue_key:
         return jsonify({"message": "issue_key parameter is required"}), 400
     
-    logger.debug(f"Fetching issue: {issue_key}")
+    logger.debug("Fetching issue: %s", issue_key)
+    
+    total_issues_param = request.args.get("total_issues", "1")
+    total_issues = int(total_issues_param)
+    logger.debug(
+        "[ROUTE] fetch_issue - Received total_issues param: '%s', converted to: %d",
+        total_issues_param, total_issues
+    )
+    
+    try:
+        limits = hierarchy_limits_from_request()
+    except ValueError:
+        return jsonify({
+            "message": "max_depth, max_nodes and collapse_depth must be non-negative integers"
+        }), 400
+    
+    etag, versions = _not_modified(issue_key, total_issues, limits)
+    if etag:
+        logger.debug("[ROUTE] fetch_issue - %s not modified", issue_key)
+        response = make_response("", 304)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
     
-    issues_info = get_issue_hierarchy(
+    issues_info, truncation = get_issue_hierarchy(
         issue_key,
         session["jira_email"],
         session["jira_api_token"],
-        session["jira_instance"]
+        session["jira_instance"],
+        known_versions=versions,
+        limits=limits
     )
     
     if not issues_info:
         return jsonify({"message": "Issue not found or unauthorized access"}), 404
     
-    assignee_name = issues_info[0].get("assignee_name", "Unassigned")
-    task_time_spent = issues_info[0].get("timespent", 0)
+    if is_partial("hierarchy"):
+        # Deadline hit or an issue failed to load mid-traversal: return what we have, never cache or tag it
+        response_data = build_issue_response(issues_info, total_issues, truncation)
+        response_data["partial"] = True
+        return jsonify(response_data), 200
     
-    total_issues_param = request.args.get("total_issues", "1")
-    total_issues = int(total_issues_param)
-    logger.info(f"[ROUTE] fetch_issue - Received total_issues param: '{total_issues_param}', converted to: {total_issues}")
+    get_cache().set(
+        cache_key("hierarchy_keys", session["jira_instance"], session["jira_email"], issue_key, limits.key()),
+        [issue["key"] for issue in issues_info],
+        ttl=Config.CACHE_ISSUE_TTL
+    )
     
-    response_data = {
-        "issues": issues_info,
-        "total_issues": total_issues,
-        "assignee_name": assignee_name,
-        "task_time_spent": task_time_spent
-    }
-    logger.info(f"[ROUTE] fetch_issue - Returning total_issues in response: {total_issues}")
-    return jsonify(response_data), 200
+    response_data = build_issue_response(issues_info, total_issues, truncation)
+    logger.debug("[ROUTE] fetch_issue - Returning total_issues in response: %d", total_issues)
+    response = jsonify(response_data)
+    response.set_etag(hierarchy_etag(
+        {issue["key"]: issue.get("updated") for issue in issues_info},
+        total_issues,
+        limits.key(),
+        response_data["suggestions"]
+    ))
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response, 200
 
@@ -0,0 +1,13 @@
+"""
+Metrics route exposing Prometheus text format.
+"""
+from flask import Blueprint, Response
+from app.services.metrics_service import registry
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Expose Jira call, retry, pool and route metrics for scraping."""
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
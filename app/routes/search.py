@@ -3,10 +3,12 @@ Search routes for finding Jira issues by filter API.
 """
 from flask import Blueprint, request, session, jsonify
 from app.services.session_service import load_session
+from app.services.deadline_service import remaining
 from app.services.jira_service import search_issue_by_filter
+from app.services.search_index import IndexSyncError, get_search_index
 from app.config import Config
+import time
 import logging
-import json
 
 search_bp = Blueprint("search", __name__)
 logger = logging.getLogger(__name__)
@@ -31,14 +33,14 @@ def search_issue():
         session["jira_instance"]
     )
     
-    logger.info(f"[ROUTE] search_issue - Received issue_key={issue_key}, total_issues={total_issues}")
+    logger.info("[ROUTE] search_issue - Received issue_key=%s, total_issues=%s", issue_key, total_issues)
     
     if issue_key:
         response_data = {
             "issue_key": issue_key,
             "total_issues": total_issues
         }
-        logger.info(f"[ROUTE] search_issue - Returning response: {json.dumps(response_data)}")
+        logger.debug("[ROUTE] search_issue - Returning response: %s", response_data)
         return jsonify(response_data), 200
     else:
         return jsonify({
@@ -47,3 +49,59 @@ def search_issue():
             "total_issues": 0
         }), 404
 
+
+@search_bp.route("/filters/<filter_id>/search", methods=["GET"])
+def search_filter_index(filter_id):
+    """
+    Full-text search within a saved filter's issues (summary, description,
+    research project) using the local index. Query parameters: q, limit.
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"message": "q is required"}), 400
+    try:
+        limit = min(int(request.args.get("limit", "20")), 100)
+    except ValueError:
+        return jsonify({"message": "limit must be an integer"}), 400
+    
+    email = session["jira_email"]
+    api_token = session["jira_api_token"]
+    jira_instance = session["jira_instance"].strip()
+    index = get_search_index()
+    
+    state = index.state(jira_instance, email, filter_id)
+    if state is None:
+        # First search for this filter: build in the background, answer now if it is small
+        error = index.pop_error(jira_instance, email, filter_id)
+        if error is not None:
+            return jsonify({"message": str(error)}), error.status_code
+        if not index.request_sync(filter_id, email, api_token, jira_instance):
+            # Another filter is being indexed; this one is started by a later search
+            return jsonify({"message": "Indexing filter, try again shortly.", "indexing": True}), 202
+        wait = Config.SEARCH_INDEX_INLINE_WAIT_SECONDS
+        left = remaining()
+        if left is not None:
+            wait = max(0.0, min(wait, left - 1.0))
+        if not index.wait_for_sync(jira_instance, email, filter_id, wait):
+            return jsonify({"message": "Indexing filter, try again shortly.", "indexing": True}), 202
+        state = index.state(jira_instance, email, filter_id)
+        if state is None:
+            error = index.pop_error(jira_instance, email, filter_id) or IndexSyncError(
+                "Could not index filter from Jira."
+            )
+            return jsonify({"message": str(error)}), error.status_code
+    elif time.time() - state["synced_at"] > Config.SEARCH_INDEX_REFRESH_SECONDS:
+        index.request_sync(filter_id, email, api_token, jira_instance)
+    
+    results = index.search(jira_instance, email, filter_id, query, limit=limit)
+    return jsonify({
+        "results": results,
+        "count": len(results),
+        "indexed_issues": state["issues"],
+        "synced_at": state["synced_at"]
+    }), 200
@@ -3,22 +3,54 @@ Update routes for modifying Jira issues.
 """
 from flask import Blueprint, request, session, jsonify
 from app.services.session_service import load_session
+from app.services.audit_service import record_update
+from app.services.job_queue import submit_job
+from app.services.write_behind import get_write_buffer, write_buffer_active, COMMITTED
+from app.services.tracing_service import bind_context
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline_service import DeadlineExceeded, is_partial
+from app.services.field_service import validate_update
+from app.services.suggestion_service import get_suggestion_engine
 from app.services.jira_service import (
     update_issue,
     search_issue_by_filter,
-    add_watcher
+    add_watcher,
+    get_issue_hierarchy,
+    remember_labeled
 )
+from app.routes.issues import build_issue_response
 from app.config import Config
+from concurrent.futures import ThreadPoolExecutor
 import logging
-import json
 
 update_bp = Blueprint("update", __name__)
 logger = logging.getLogger(__name__)
 
 
+def _find_next_issue(filter_id, email, api_token, jira_instance, exclude_keys, with_hierarchy):
+    """Look up the next issue and, optionally, its hierarchy."""
+    next_issue_key, total_issues = search_issue_by_filter(
+        filter_id,
+        email,
+        api_token,
+        jira_instance,
+        exclude_issue_key=exclude_keys  # Exclude the current issue to get the next one
+    )
+    hierarchy = truncation = None
+    if next_issue_key and with_hierarchy:
+        hierarchy, truncation = get_issue_hierarchy(next_issue_key, email, api_token, jira_instance)
+    return next_issue_key, total_issues, hierarchy, truncation
+
+
 @update_bp.route("/update_issue", methods=["POST"])
 def update_issue_route():
-    """Update a Jira issue with research project and chargeable status."""
+    """
+    Update a Jira issue with research project and chargeable status.
+    
+    With {"advance": true} the next issue and its hierarchy are fetched while
+    the update is in progress and returned inline as "next_issue_data" (same
+    format as /api/fetch_issue), saving the follow-up fetch_issue round trip.
+    """
     if "jira_email" not in session:
         return jsonify({"message": "Unauthorized"}), 401
     
@@ -32,59 +64,147 @@ def update_issue_route():
     if not issue_key or not research_project:
         return jsonify({"message": "Missing required fields."}), 400
     
+    write_behind = bool(data.get("write_behind", Config.WRITE_BEHIND_ENABLED))
+    advance = bool(data.get("advance", False))
     logger.debug(
-        f"Updating Issue {issue_key}: "
-        f"Research Project -> {research_project}, Chargeable -> {chargeable}"
-    )
-    
-    success, response_data = update_issue(
-        issue_key,
-        research_project,
-        chargeable,
-        session["jira_email"],
-        session["jira_api_token"],
-        session["jira_instance"]
+        "Updating Issue %s: Research Project -> %s, Chargeable -> %s (write_behind=%s, advance=%s)",
+        issue_key, research_project, chargeable, write_behind, advance
     )
     
-    if not success:
-        return jsonify(response_data), response_data.get("status_code", 500)
+    email = session["jira_email"]
+    api_token = session["jira_api_token"]
+    jira_instance = session["jira_instance"]
+    filter_id = session.get("filter_id", Config.DEFAULT_FILTER_ID)
     
-    # Add current user as watcher
-    add_watcher(
-        issue_key,
-        session["jira_email"],
-        session["jira_api_token"],
-        session["jira_instance"]
+    # Reject values Jira would refuse before journaling or sending the PUT
+    invalid = validate_update(
+        {"research_project": research_project, "chargeable": chargeable},
+        email, api_token, jira_instance, issue_key=issue_key
     )
+    if invalid:
+        return jsonify(invalid), 400
     
-    # Get next issue (exclude the current issue that was just updated)
-    filter_id = session.get("filter_id", Config.DEFAULT_FILTER_ID)
-    logger.info(f"[ROUTE] update_issue - Getting next issue with filter_id={filter_id}, excluding {issue_key}")
-    next_issue_key, total_issues = search_issue_by_filter(
-        filter_id,
-        session["jira_email"],
-        session["jira_api_token"],
-        session["jira_instance"],
-        exclude_issue_key=issue_key  # Exclude the current issue to get the next one
-    )
+    next_issue_future = None
+    executor = None
+    try:
+        if write_behind:
+            # Journal the update; it is flushed to Jira in the background
+            buffer = get_write_buffer()
+            buffer.register_credentials(jira_instance, email, api_token)
+            write_status = buffer.accept(jira_instance, issue_key, email, research_project, chargeable)
+            # Issues still pending in Jira keep matching the filter
+            exclude_keys = buffer.pending_keys(jira_instance, email)
+        else:
+            if write_buffer_active():
+                # A direct update supersedes any journaled write for this issue
+                get_write_buffer().cancel(jira_instance, issue_key)
+            
+            exclude_keys = [issue_key]
+            if advance:
+                # Look up the next issue (and its hierarchy) while the PUT is in flight
+                executor = ThreadPoolExecutor(max_workers=1)
+                next_issue_future = executor.submit(
+                    bind_context(_find_next_issue),
+                    filter_id, email, api_token, jira_instance, exclude_keys, True
+                )
+            
+            success, response_data = update_issue(
+                issue_key, research_project, chargeable, email, api_token, jira_instance, filter_id=filter_id
+            )
+            
+            if not success:
+                return jsonify(response_data), response_data.get("status_code", 500)
+            write_status = COMMITTED
+        
+        # Record the update in the audit log (queued, written in the background)
+        record_update(email, jira_instance, issue_key, research_project, chargeable, filter_id=filter_id)
+        remember_labeled(jira_instance, email, filter_id, issue_key)
+        get_suggestion_engine().learn(issue_key, research_project, email, api_token, jira_instance)
+        
+        # Add current user as watcher after the response is sent
+        submit_job(
+            "add_watcher",
+            add_watcher,
+            issue_key,
+            email,
+            api_token,
+            jira_instance,
+            account_id=session.get("jira_account_id")
+        )
+        
+        logger.info(
+            "[ROUTE] update_issue - Getting next issue with filter_id=%s, excluding %s",
+            filter_id, exclude_keys
+        )
+        try:
+            if next_issue_future is not None:
+                next_issue_key, total_issues, hierarchy, truncation = next_issue_future.result()
+            else:
+                next_issue_key, total_issues, hierarchy, truncation = _find_next_issue(
+                    filter_id, email, api_token, jira_instance, exclude_keys, advance
+                )
+        except (DeadlineExceeded, CircuitOpenError) as e:
+            # The update itself went through; only the next-issue lookup failed
+            logger.warning("[ROUTE] update_issue - Next issue lookup failed: %s", e)
+            return jsonify({
+                "message": "Issue updated, but the next issue could not be loaded in time.",
+                "next_issue": None,
+                "write_status": write_status,
+                "partial": True
+            }), 200
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
     
-    logger.info(f"[ROUTE] update_issue - Received next_issue_key={next_issue_key}, total_issues={total_issues}")
+    logger.info(
+        "[ROUTE] update_issue - Received next_issue_key=%s, total_issues=%s",
+        next_issue_key, total_issues
+    )
     
     if next_issue_key:
-        # Log the update
-        with open(Config.UPDATED_ISSUES_LOG, "a") as f:
-            f.write(f"Updated Issue: {issue_key}\n")
-        
         response_data = {
             "message": "Issue updated successfully.",
             "next_issue": next_issue_key,
-            "total_issues": total_issues
+            "total_issues": total_issues,
+            "write_status": write_status
         }
-        logger.info(f"[ROUTE] update_issue - Returning response: {json.dumps(response_data)}")
+        if advance:
+            # A hierarchy cut short by the deadline is left for fetch_issue to load
+            response_data["next_issue_data"] = (
+                build_issue_response(hierarchy, total_issues, truncation)
+                if hierarchy and not is_partial("hierarchy") else None
+            )
+        logger.debug("[ROUTE] update_issue - Returning next_issue=%s", next_issue_key)
         return jsonify(response_data), 200
     else:
         return jsonify({
             "message": "Issue updated, but no more issues found.",
-            "next_issue": None
+            "next_issue": None,
+            "write_status": write_status
         }), 200
 
+
+@update_bp.route("/update_status", methods=["GET"])
+def update_status():
+    """
+    Report write-behind status (pending, committed, failed) per issue.
+    Pass issue_keys=KEY1,KEY2 or omit it for the current user's recent writes.
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    if not write_buffer_active():
+        return jsonify({"issues": {}}), 200
+    
+    buffer = get_write_buffer()
+    buffer.register_credentials(session["jira_instance"], session["jira_email"], session["jira_api_token"])
+    issue_keys = [k.strip() for k in request.args.get("issue_keys", "").split(",") if k.strip()]
+    statuses = buffer.status(
+        session["jira_instance"],
+        issue_keys=issue_keys or None,
+        user=None if issue_keys else session["jira_email"]
+    )
+    return jsonify({"issues": statuses}), 200
+
@@ -0,0 +1,33 @@
+"""
+Webhook routes for Jira push notifications (cache invalidation).
+"""
+from flask import Blueprint, request, jsonify
+from app.services.webhook_service import verify_signature, handle_event
+from app.config import Config
+import logging
+
+webhooks_bp = Blueprint("webhooks", __name__)
+logger = logging.getLogger(__name__)
+
+
+@webhooks_bp.route("/webhooks/jira", methods=["POST"])
+def jira_webhook():
+    """Receive Jira issue/worklog events and refresh the affected cache entries."""
+    if not Config.JIRA_WEBHOOK_SECRET:
+        return jsonify({"message": "Webhooks are not configured"}), 404
+    
+    body = request.get_data()
+    if not verify_signature(
+        body,
+        signature=request.headers.get("X-Hub-Signature"),
+        token=request.headers.get("X-Webhook-Secret") or request.args.get("secret")
+    ):
+        logger.warning("[WEBHOOK] Rejected request with invalid signature from %s", request.remote_addr)
+        return jsonify({"message": "Invalid webhook signature"}), 401
+    
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"message": "Invalid JSON payload"}), 400
+    
+    handled, summary = handle_event(payload)
+    return jsonify({"handled": handled, "event": payload.get("webhookEvent"), **summary}), 200
@@ -0,0 +1,79 @@
+"""
+Worklog routes for time spent over arbitrary date windows.
+"""
+from flask import Blueprint, request, session, jsonify
+from app.services.session_service import load_session
+from app.services.worklog_service import get_ledger, summarize
+from app.config import Config
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import requests
+import logging
+
+worklogs_bp = Blueprint("worklogs", __name__)
+logger = logging.getLogger(__name__)
+
+
+def _today():
+    """Today in the user's Jira time zone (worklog days are local days)."""
+    try:
+        return datetime.now(ZoneInfo(session.get("jira_timezone") or "UTC")).date()
+    except (ZoneInfoNotFoundError, ValueError):
+        return date.today()
+
+
+def _parse_layout(value):
+    """"800x600" -> (800.0, 600.0); None if absent, ValueError if malformed."""
+    if not value:
+        return None
+    width, height = (float(part) for part in value.lower().split("x"))
+    if width <= 0 or height <= 0:
+        raise ValueError(value)
+    return width, height
+
+
+@worklogs_bp.route("/worklogs", methods=["GET"])
+def get_worklogs():
+    """
+    Hours logged by the current user between from and to (YYYY-MM-DD,
+    inclusive; default the last 14 days): totals per research project, per
+    day (heatmap) and a treemap of the top issues per project.
+    Optional: top_n=<issues per project>, layout=<width>x<height>.
+    """
+    if "jira_email" not in session:
+        return jsonify({"message": "Unauthorized"}), 401
+    
+    load_session()
+    
+    account_id = session.get("jira_account_id")
+    if not account_id:
+        return jsonify({"message": "No Jira account for this session, please log in again."}), 401
+    
+    today = _today()
+    try:
+        end = date.fromisoformat(request.args["to"]) if request.args.get("to") else today
+        start = date.fromisoformat(request.args["from"]) if request.args.get("from") else end - timedelta(days=13)
+        top_n = int(request.args["top_n"]) if request.args.get("top_n") else None
+        layout = _parse_layout(request.args.get("layout"))
+    except ValueError:
+        return jsonify({"message": "from/to must be YYYY-MM-DD, top_n an integer and layout WIDTHxHEIGHT"}), 400
+    if start > end:
+        return jsonify({"message": "from must not be after to"}), 400
+    if (end - start).days + 1 > Config.WORKLOG_MAX_RANGE_DAYS:
+        return jsonify({"message": f"The window is limited to {Config.WORKLOG_MAX_RANGE_DAYS} days"}), 400
+    
+    try:
+        ledger = get_ledger(
+            account_id, start, end,
+            session["jira_email"],
+            session["jira_api_token"],
+            session["jira_instance"],
+            today=today
+        )
+    except requests.exceptions.RequestException as e:
+        logger.error("[WORKLOGS] Failed to load worklogs for %s: %s", account_id, e)
+        ledger = None
+    if ledger is None:
+        return jsonify({"message": "Could not load worklogs from Jira."}), 502
+    
+    return jsonify(summarize(ledger, start, end, top_n=top_n, layout=layout)), 200
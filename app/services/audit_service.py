@@ -0,0 +1,218 @@
+"""
+Structured, append-only audit log for labeling actions.
+
+Entries are queued by request threads and written in batches by a single
+background thread into a SQLite database (one commit per batch). The table
+is indexed by issue key and by user so "who labeled what, when" queries do
+not scan the whole log.
+"""
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    user TEXT NOT NULL,
+    jira_instance TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    action TEXT NOT NULL,
+    research_project TEXT,
+    chargeable TEXT,
+    filter_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_issue ON audit_log (issue_key, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_log (user, ts);
+"""
+
+_COLUMNS = (
+    "ts", "user", "jira_instance", "issue_key", "action",
+    "research_project", "chargeable", "filter_id"
+)
+
+
+class AuditLog:
+    """Buffered SQLite audit log with a background writer thread."""
+
+    def __init__(self, db_path, batch_size=100, flush_interval=1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _ensure_writer(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def record(self, user, jira_instance, issue_key, action, research_project=None,
+               chargeable=None, filter_id=None):
+        """Queue an audit entry; returns immediately."""
+        self._ensure_writer()
+        self._queue.put((
+            datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            user or "",
+            jira_instance or "",
+            issue_key,
+            action,
+            research_project,
+            chargeable or None,
+            filter_id
+        ))
+
+    def _drain(self, first):
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+        return batch
+
+    def _write(self, conn, batch):
+        rows = [row for row in batch if row is not None]
+        if not rows:
+            return
+        try:
+            conn.executemany(
+                f"INSERT INTO audit_log ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                rows
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to write %d audit entries: %s", len(rows), e)
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = self._drain(item)
+                self._write(conn, batch)
+                for _ in batch:
+                    self._queue.task_done()
+                if None in batch:
+                    return
+                # Give concurrent updates a moment to join the next batch
+                time.sleep(self.flush_interval if self._queue.empty() else 0)
+        finally:
+            conn.close()
+
+    def flush(self, timeout=None):
+        """Block until all queued entries have been written."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        deadline = time.monotonic() + timeout if timeout else None
+        while self._queue.unfinished_tasks:
+            if deadline and time.monotonic() > deadline:
+                return
+            time.sleep(0.01)
+
+    def close(self):
+        """Write remaining entries and stop the writer thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def query(self, issue_key=None, user=None, since=None, limit=100):
+        """Return audit entries (newest first) filtered by issue key and/or user."""
+        clauses = []
+        params = []
+        if issue_key:
+            clauses.append("issue_key = ?")
+            params.append(issue_key)
+        if user:
+            clauses.append("user = ?")
+            params.append(user)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(int(limit))
+
+        conn = self._connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM audit_log {where} "
+                f"ORDER BY ts DESC, id DESC LIMIT ?",
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+
+_audit_log = None
+_audit_lock = threading.Lock()
+
+
+def get_audit_log():
+    """Return the process-wide audit log, creating it on first use."""
+    global _audit_log
+    if _audit_log is None:
+        with _audit_lock:
+            if _audit_log is None:
+                _audit_log = AuditLog(
+                    Config.AUDIT_DB,
+                    batch_size=Config.AUDIT_BATCH_SIZE,
+                    flush_interval=Config.AUDIT_FLUSH_INTERVAL
+                )
+    return _audit_log
+
+
+def record_update(user, jira_instance, issue_key, research_project, chargeable, filter_id=None):
+    """Record a successful research project / chargeable update."""
+    try:
+        get_audit_log().record(
+            user, jira_instance, issue_key, "update",
+            research_project=research_project,
+            chargeable=chargeable,
+            filter_id=filter_id
+        )
+    except Exception as e:
+        logger.error("Failed to record audit entry for %s: %s", issue_key, e)
+
+
+def _close_audit_log():
+    if _audit_log is not None:
+        _audit_log.close()
+
+
+atexit.register(_close_audit_log)
@@ -0,0 +1,360 @@
+"""
+Pluggable cache for Jira data shared between requests, workers and replicas.
+
+Backends (Config.CACHE_BACKEND):
+    memory  - per-process LRU (default)
+    sqlite  - SQLite file, e.g. on /shared, shared by all workers on a host
+    redis   - any Redis-protocol server (needs the optional `redis` package)
+    none    - caching disabled
+
+Values must be JSON-serializable. Entries carry a logical expiry (the TTL)
+but are kept physically for CACHE_STALE_SECONDS longer so callers can fall
+back to stale data when Jira is unavailable (see get_stale).
+Keys are namespaced per Jira instance and user with cache_key();
+invalidate() drops an entry for every user (e.g. from a Jira webhook).
+"""
+import fnmatch
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from app.config import Config
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by namespace and result (hit, miss, stale).",
+    ("namespace", "result")
+)
+
+
+def _escape(part):
+    # Instances carry a scheme and maybe a port, so keep ':' for separating fields
+    return str(part).replace("%", "%25").replace(":", "%3A")
+
+
+def cache_key(namespace, jira_instance, user, *parts):
+    """Build a cache key namespaced per Jira instance and user."""
+    suffix = ":".join(str(part) for part in parts)
+    return f"jira:{_escape(jira_instance)}:{_escape(user or '-')}:{namespace}:{suffix}"
+
+
+def namespace_of(key):
+    """Namespace field of a key built by cache_key ("other" for foreign keys)."""
+    parts = key.split(":", 4)
+    return parts[3] if len(parts) > 3 else "other"
+
+
+class CacheBackend:
+    """Common interface; subclasses store (value, logical_expiry) envelopes."""
+
+    def __init__(self, default_ttl=60, stale_seconds=600):
+        self.default_ttl = default_ttl
+        self.stale_seconds = stale_seconds
+
+    # Backend primitives -----------------------------------------------------
+
+    def _load(self, key):
+        """Return the raw envelope dict or None."""
+        raise NotImplementedError
+
+    def _store(self, key, envelope, physical_ttl):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def incr(self, key):
+        """Atomically increment an integer counter (no expiry) and return it."""
+        raise NotImplementedError
+
+    def counter(self, key):
+        """Return the current value of a counter created by incr() (0 if unset)."""
+        envelope = self._load(key)
+        return int(envelope["v"]) if envelope is not None else 0
+
+    def clear(self):
+        raise NotImplementedError
+
+    def keys_matching(self, pattern):
+        """Return keys matching a glob pattern (`*` wildcards)."""
+        raise NotImplementedError
+
+    # Public API ---------------------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return a fresh value or default."""
+        envelope = self._load(key)
+        namespace = namespace_of(key)
+        if envelope is None:
+            CACHE_REQUESTS.inc(namespace, "miss")
+            return default
+        if envelope["exp"] < time.time():
+            CACHE_REQUESTS.inc(namespace, "stale")
+            return default
+        CACHE_REQUESTS.inc(namespace, "hit")
+        return envelope["v"]
+
+    def get_stale(self, key, default=None):
+        """Return a value even if its TTL has passed (within the stale window)."""
+        envelope = self._load(key)
+        return default if envelope is None else envelope["v"]
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        envelope = {"v": value, "exp": time.time() + ttl}
+        self._store(key, envelope, ttl + self.stale_seconds)
+
+    def scan(self, namespace, jira_instance, *parts):
+        """Keys of a namespace for all users; "*" in parts matches anything."""
+        return self.keys_matching(cache_key(namespace, jira_instance, "*", *parts))
+
+    def invalidate(self, namespace, jira_instance, *parts):
+        """Delete an entry for all users and return how many were removed."""
+        keys = self.scan(namespace, jira_instance, *parts)
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+
+class NullCache(CacheBackend):
+    """Cache that stores nothing (CACHE_BACKEND=none)."""
+
+    def _load(self, key):
+        return None
+
+    def _store(self, key, envelope, physical_ttl):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def incr(self, key):
+        return 0
+
+    def counter(self, key):
+        return 0
+
+    def clear(self):
+        pass
+
+    def keys_matching(self, pattern):
+        return []
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache bounded by entry count."""
+
+    def __init__(self, max_entries=10000, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            envelope, physical_expiry = item
+            if physical_expiry is not None and physical_expiry < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return envelope
+
+    def _store(self, key, envelope, physical_ttl):
+        with self._lock:
+            self._data[key] = (envelope, time.time() + physical_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key):
+        with self._lock:
+            envelope, _ = self._data.get(key, ({"v": 0, "exp": float("inf")}, None))
+            envelope = {"v": int(envelope["v"]) + 1, "exp": float("inf")}
+            self._data[key] = (envelope, None)
+            self._data.move_to_end(key)
+            return envelope["v"]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def keys_matching(self, pattern):
+        with self._lock:
+            return [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]
+
+
+class SQLiteCache(CacheBackend):
+    """
+    SQLite-backed cache shared by all worker processes on a host.
+    Eviction is least-recently-written (reads do not update accessed_at).
+    """
+
+    def __init__(self, path, max_entries=50000, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+        conn.commit()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def _load(self, key):
+        row = self._conn().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return json.loads(value)
+
+    def _store(self, key, envelope, physical_ttl):
+        now = time.time()
+        self._write(key, json.dumps(envelope), now + physical_ttl, now)
+
+    def _write(self, key, value, expires_at, now):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, now)
+        )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+        count = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache WHERE expires_at IS NOT NULL ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def delete(self, key):
+        self._conn().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def incr(self, key):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            value = int(json.loads(row[0])["v"]) + 1 if row else 1
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, NULL, ?)",
+                (key, json.dumps({"v": value, "exp": float("inf")}), time.time())
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def clear(self):
+        self._conn().execute("DELETE FROM cache")
+
+    def keys_matching(self, pattern):
+        rows = self._conn().execute("SELECT key FROM cache WHERE key GLOB ?", (pattern,)).fetchall()
+        return [row[0] for row in rows]
+
+
+class RedisCache(CacheBackend):
+    """Redis-protocol backend; eviction is left to the server's maxmemory policy."""
+
+    def __init__(self, url, **kwargs):
+        super().__init__(**kwargs)
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            ) from e
+        self._client = redis.Redis.from_url(url)
+
+    def _load(self, key):
+        raw = self._client.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def _store(self, key, envelope, physical_ttl):
+        self._client.set(key, json.dumps(envelope), ex=max(1, int(physical_ttl)))
+
+    def delete(self, key):
+        self._client.delete(key)
+
+    def incr(self, key):
+        return int(self._client.incr(key))
+
+    def counter(self, key):
+        raw = self._client.get(key)
+        return int(raw) if raw is not None else 0
+
+    def clear(self):
+        for key in self._client.scan_iter("jira:*"):
+            self._client.delete(key)
+
+    def keys_matching(self, pattern):
+        return [
+            key.decode() if isinstance(key, bytes) else key
+            for key in self._client.scan_iter(pattern)
+        ]
+
+
+def create_cache(backend=None):
+    """Instantiate the cache backend selected in Config."""
+    backend = (backend or Config.CACHE_BACKEND).lower()
+    options = {"default_ttl": Config.CACHE_DEFAULT_TTL, "stale_seconds": Config.CACHE_STALE_SECONDS}
+    if backend == "none":
+        return NullCache(**options)
+    if backend == "sqlite":
+        return SQLiteCache(Config.CACHE_SQLITE_PATH, max_entries=Config.CACHE_MAX_ENTRIES, **options)
+    if backend == "redis":
+        return RedisCache(Config.CACHE_REDIS_URL, **options)
+    if backend != "memory":
+        logger.warning("Unknown CACHE_BACKEND %r, using memory", backend)
+    return MemoryCache(max_entries=Config.CACHE_MAX_ENTRIES, **options)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide cache backend, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = create_cache()
+    return _cache
@@ -0,0 +1,138 @@
+"""
+Per-Jira-instance circuit breaker for outgoing API calls.
+
+closed     - requests flow; consecutive failures (5xx, 429, network errors)
+             are counted and CIRCUIT_FAILURE_THRESHOLD of them open the circuit
+open       - requests fail fast with CircuitOpenError for CIRCUIT_RESET_SECONDS
+half_open  - a limited number of probe requests are let through; a success
+             closes the circuit, a failure opens it again
+
+While a circuit is open callers serve stale cached data where they have it
+(see jira_service) instead of tying up request threads in retries.
+"""
+import logging
+import threading
+import time
+import requests
+from app.config import Config
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+CIRCUIT_STATE = registry.gauge(
+    "jira_circuit_state",
+    "Circuit breaker state per Jira instance (0 closed, 1 half-open, 2 open).",
+    ("instance",)
+)
+CIRCUIT_REJECTIONS = registry.counter(
+    "jira_circuit_rejections_total",
+    "Jira calls rejected without being sent because the circuit was open.",
+    ("instance",)
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling Jira while the instance's circuit is open."""
+
+    def __init__(self, instance, retry_in):
+        super().__init__(f"Jira instance {instance} is unavailable (circuit open, retry in {retry_in:.0f}s)")
+        self.instance = instance
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one Jira instance."""
+
+    def __init__(self, instance, failure_threshold=5, reset_timeout=30.0, half_open_probes=1):
+        self.instance = instance
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        CIRCUIT_STATE.set(instance, value=_STATE_VALUES[CLOSED])
+
+    def _transition(self, state):
+        if state != self.state:
+            logger.warning("Circuit for %s: %s -> %s", self.instance, self.state, state)
+            self.state = state
+            CIRCUIT_STATE.set(self.instance, value=_STATE_VALUES[state])
+
+    def retry_in(self):
+        """Seconds until an open circuit admits a probe (0 if not open)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_request(self):
+        """Admit a request or raise CircuitOpenError. Returns True for half-open probes."""
+        with self._lock:
+            if self.state == OPEN:
+                elapsed = time.monotonic() - self._opened_at
+                if elapsed < self.reset_timeout:
+                    CIRCUIT_REJECTIONS.inc(self.instance)
+                    raise CircuitOpenError(self.instance, self.reset_timeout - elapsed)
+                self._transition(HALF_OPEN)
+                self._probes_in_flight = 0
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    CIRCUIT_REJECTIONS.inc(self.instance)
+                    raise CircuitOpenError(self.instance, self.reset_timeout)
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probes_in_flight = 0
+            self._transition(CLOSED)
+
+    def release(self):
+        """Give back a half-open probe slot without judging Jira (e.g. we gave up first)."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+                self._transition(OPEN)
+
+    def is_open(self):
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self._opened_at < self.reset_timeout
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(instance):
+    """Return the circuit breaker for a Jira instance (host[:port])."""
+    breaker = _breakers.get(instance)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(instance)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    instance,
+                    failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+                    reset_timeout=Config.CIRCUIT_RESET_SECONDS,
+                    half_open_probes=Config.CIRCUIT_HALF_OPEN_PROBES
+                )
+                _breakers[instance] = breaker
+    return breaker
@@ -0,0 +1,121 @@
+"""
+Per-request deadline budgets for Jira calls.
+
+Each API request gets a deadline (REQUEST_DEADLINE_SECONDS, or shorter if
+the client sends X-Request-Deadline-Ms). The deadline lives in a context
+variable like the request trace, so work handed to thread pools with
+bind_context() shares it. _make_request shrinks its socket timeout to the
+remaining budget, skips retries that no longer fit and raises
+DeadlineExceeded once the budget is spent. Callers that can return part of
+a result (e.g. the issue hierarchy) do so and mark the deadline partial.
+"""
+import contextlib
+import contextvars
+import time
+import requests
+
+# Below this much remaining budget a Jira call is not worth starting
+MIN_CALL_BUDGET = 0.05
+
+_current_deadline = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(requests.exceptions.RequestException):
+    """Raised instead of calling Jira when the request's budget is spent."""
+
+
+class Deadline:
+    """Absolute deadline for one API request (monotonic clock)."""
+
+    def __init__(self, seconds):
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.partial = set()
+
+    def remaining(self):
+        return self.expires_at - time.monotonic()
+
+    def expired(self):
+        return self.remaining() < MIN_CALL_BUDGET
+
+    def mark_partial(self, reason):
+        """Record that a result was cut short to meet the deadline."""
+        self.partial.add(reason)
+
+
+def start_deadline(seconds):
+    """Bind a new deadline to the current context and return it."""
+    deadline = Deadline(seconds)
+    _current_deadline.set(deadline)
+    return deadline
+
+
+def current_deadline():
+    return _current_deadline.get()
+
+
+def end_deadline():
+    """Detach and return the current deadline."""
+    deadline = _current_deadline.get()
+    _current_deadline.set(None)
+    return deadline
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds):
+    """Run a block (e.g. a background job) under its own deadline."""
+    token = _current_deadline.set(Deadline(seconds))
+    try:
+        yield _current_deadline.get()
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining():
+    """Seconds left in the current deadline, or None if there is none."""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+def deadline_expired():
+    """True if the current context has a deadline with no usable budget left."""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired()
+
+
+def check_deadline(what="Jira call"):
+    """Raise DeadlineExceeded if the current deadline has no usable budget left."""
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceeded(f"Request deadline of {deadline.budget:.1f}s exceeded before {what}")
+
+
+def clamp_timeout(timeout):
+    """Shrink a per-call timeout to the remaining budget."""
+    left = remaining()
+    return timeout if left is None else max(MIN_CALL_BUDGET, min(timeout, left))
+
+
+def mark_partial(reason):
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.mark_partial(reason)
+
+
+def is_partial(reason=None):
+    """True if the current request returned partial results (for reason, if given)."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return False
+    return reason in deadline.partial if reason else bool(deadline.partial)
+
+
+def parse_client_deadline(header_value, default_seconds, max_seconds):
+    """Budget in seconds from an X-Request-Deadline-Ms header, capped at max_seconds."""
+    if not header_value:
+        return default_seconds
+    try:
+        seconds = int(header_value) / 1000.0
+    except ValueError:
+        return default_seconds
+    return max(MIN_CALL_BUDGET, min(seconds, max_seconds))
@@ -0,0 +1,171 @@
+"""
+Streaming export of a saved filter's issues.
+
+Pages through /rest/api/3/search/jql with nextPageToken (no 1000-issue
+ceiling) and turns each page into rows as it arrives, so memory stays flat
+regardless of the filter size. Rows are rendered as NDJSON or CSV and can
+be gzip-compressed on the fly. Used by /api/filters/<id>/export and by
+`python -m app.cli export`.
+"""
+import csv
+import io
+import json
+import logging
+import zlib
+import requests
+from app.config import Config
+from app.services.jira_service import (
+    extract_plain_text_from_description,
+    get_jql_from_filter,
+    search_page
+)
+from app.utils.jql import build_filter_jql
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+# Jira returns at most 100 issues per page when fields are requested
+PAGE_SIZE = 100
+
+
+class ExportError(Exception):
+    """The export could not be started or completed (filter missing, Jira error)."""
+
+    def __init__(self, message, status_code=502):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def parse_fields(value):
+    """Field list from a comma-separated string, defaulting to EXPORT_DEFAULT_FIELDS."""
+    fields = [f.strip() for f in (value or Config.EXPORT_DEFAULT_FIELDS).split(",") if f.strip()]
+    return [f for f in fields if f != "key"]
+
+
+def _next_page(jql, fields, email, api_token, jira_instance, next_page_token):
+    try:
+        success, data = search_page(
+            jql, fields, email, api_token, jira_instance,
+            next_page_token=next_page_token, max_results=PAGE_SIZE
+        )
+    except requests.exceptions.RequestException as e:
+        # Timeouts, open circuits and deadlines surface as export failures, not tracebacks
+        raise ExportError(f"Jira search failed: {e}", status_code=502) from e
+    if not success:
+        raise ExportError(
+            f"Jira search failed with {data['status_code']}: {data['jira_response'][:200]}",
+            status_code=400 if data["status_code"] == 400 else 502
+        )
+    return data
+
+
+def open_filter_export(filter_id, fields, email, api_token, jira_instance):
+    """
+    Resolve the filter and fetch its first page, then return an iterator
+    over all issues (later pages are fetched lazily while iterating).
+    Raises ExportError before anything is streamed if the export cannot start.
+    """
+    jira_instance = jira_instance.strip()
+    try:
+        jql = get_jql_from_filter(filter_id, email, api_token, jira_instance)
+    except requests.exceptions.RequestException as e:
+        raise ExportError(f"Could not load saved filter with ID {filter_id}: {e}", status_code=502) from e
+    if not jql:
+        raise ExportError(f"Could not load saved filter with ID {filter_id}.", status_code=404)
+
+    jql = build_filter_jql(jql, default_order_by=Config.JQL_DEFAULT_ORDER_BY)
+    first_page = _next_page(jql, fields, email, api_token, jira_instance, None)
+
+    def issues():
+        page = first_page
+        exported = 0
+        while True:
+            for issue in page.get("issues", []):
+                exported += 1
+                yield issue
+            token = page.get("nextPageToken")
+            if page.get("isLast", True) or not token:
+                break
+            page = _next_page(jql, fields, email, api_token, jira_instance, token)
+        logger.info("[EXPORT] Filter %s: exported %d issues", filter_id, exported)
+
+    return issues()
+
+
+def _flatten(value):
+    """Render a Jira field value as a plain scalar for CSV/NDJSON rows."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            return extract_plain_text_from_description(value)
+        child = value.get("child")
+        if "value" in value and isinstance(child, dict) and "value" in child:
+            # Cascading select: "Parent / Child"
+            return f"{value['value']} / {child['value']}"
+        for attr in ("value", "displayName", "name", "key", "id"):
+            if attr in value:
+                return value[attr]
+        return json.dumps(value, sort_keys=True)
+    if isinstance(value, list):
+        return ";".join(str(_flatten(item)) for item in value)
+    return value
+
+
+def issue_rows(issues, fields):
+    """Yield {"key": ..., field: flat value, ...} rows for exported issues."""
+    for issue in issues:
+        issue_fields = issue.get("fields", {})
+        row = {"key": issue.get("key")}
+        for field in fields:
+            row[field] = _flatten(issue_fields.get(field))
+        yield row
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def csv_lines(rows, fields):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["key"] + list(fields), extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+def encode(chunks, compress=False, flush_bytes=64 * 1024):
+    """UTF-8 encode text chunks, optionally gzip-compressing them on the fly."""
+    if not compress:
+        for chunk in chunks:
+            yield chunk.encode("utf-8")
+        return
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    pending = 0
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        pending += len(chunk)
+        if data:
+            yield data
+        if pending >= flush_bytes:
+            # Keep the client's download moving for highly compressible rows
+            yield compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+    yield compressor.flush()
+
+
+def export_stream(issues, fields, fmt="ndjson", compress=False):
+    """Byte chunks for an export in the given format."""
+    rows = issue_rows(issues, fields)
+    lines = csv_lines(rows, fields) if fmt == "csv" else ndjson_lines(rows)
+    return encode(lines, compress=compress)
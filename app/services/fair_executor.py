@@ -0,0 +1,134 @@
+"""
+Process-wide bounded executor for Jira fan-out with per-user fair queuing.
+
+All parallel Jira calls (issue hierarchy, worklogs) share one pool of
+FAIR_EXECUTOR_WORKERS threads instead of a ThreadPoolExecutor per API
+request. Each user has their own FIFO queue and idle workers serve the
+queues round-robin, so a user with a 500-issue fan-out gets one worker
+slot per turn like everyone else and cannot starve a single-issue fetch.
+
+Tasks must not block on other tasks of this executor (no nested fan-out),
+otherwise the bounded pool can deadlock.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from app.config import Config
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+QUEUE_WAIT = registry.histogram(
+    "fair_executor_queue_wait_seconds",
+    "Time tasks spent queued in the shared Jira executor before starting.",
+    ("pool",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+QUEUED_TASKS = registry.gauge(
+    "fair_executor_queued_tasks",
+    "Tasks waiting in the shared Jira executor."
+)
+WAITING_USERS = registry.gauge(
+    "fair_executor_waiting_users",
+    "Users with at least one task waiting in the shared Jira executor."
+)
+BUSY_WORKERS = registry.gauge(
+    "fair_executor_busy_workers",
+    "Shared Jira executor threads currently running a task."
+)
+
+
+class FairShareExecutor:
+    """Bounded thread pool that round-robins between per-user task queues."""
+
+    def __init__(self, max_workers=32, name="jira"):
+        self.max_workers = max_workers
+        self.name = name
+        self._queues = OrderedDict()  # user -> deque of tasks, in round-robin order
+        self._queued = 0
+        self._idle = 0
+        self._threads = []
+        self._cond = threading.Condition()
+
+    def submit(self, user, fn, *args, pool="default", **kwargs):
+        """Queue fn(*args, **kwargs) on behalf of user; returns a Future."""
+        future = Future()
+        task = (future, fn, args, kwargs, pool, time.perf_counter())
+        with self._cond:
+            user_queue = self._queues.get(user)
+            if user_queue is None:
+                user_queue = self._queues[user] = deque()
+            user_queue.append(task)
+            self._queued += 1
+            QUEUED_TASKS.set(value=self._queued)
+            WAITING_USERS.set(value=len(self._queues))
+            if self._idle < self._queued and len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._cond.notify()
+        return future
+
+    def queued(self):
+        with self._cond:
+            return self._queued
+
+    def _start_worker(self):
+        thread = threading.Thread(
+            target=self._run, name=f"{self.name}-worker-{len(self._threads)}", daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_task(self):
+        """Pop the next task round-robin; caller holds the lock."""
+        user, user_queue = next(iter(self._queues.items()))
+        task = user_queue.popleft()
+        if user_queue:
+            # Rotate the user to the back so others go first next time
+            self._queues.move_to_end(user)
+        else:
+            del self._queues[user]
+        self._queued -= 1
+        QUEUED_TASKS.set(value=self._queued)
+        WAITING_USERS.set(value=len(self._queues))
+        return task
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queued:
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                future, fn, args, kwargs, pool, enqueued = self._next_task()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            QUEUE_WAIT.observe(pool, value=time.perf_counter() - enqueued)
+            BUSY_WORKERS.inc()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                BUSY_WORKERS.dec()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide fair-share executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = FairShareExecutor(max_workers=Config.FAIR_EXECUTOR_WORKERS)
+    return _executor
+
+
+def submit(user, fn, *args, pool="default", **kwargs):
+    """Submit a task to the shared executor on behalf of user."""
+    return get_executor().submit(user, fn, *args, pool=pool, **kwargs)
@@ -0,0 +1,59 @@
+"""
+Allowed values of the custom fields written by update_issue.
+
+The research project and chargeable options are loaded from Jira once and
+cached (see jira_service.get_field_options), served to the UI through
+/api/fields/options and used to reject invalid updates locally instead of
+after a PUT round trip. When the options cannot be loaded, validation is
+skipped and Jira remains the judge.
+"""
+import logging
+from app.config import Config
+from app.services.jira_service import get_field_options
+
+logger = logging.getLogger(__name__)
+
+# Update parameter -> (custom field, attribute of the option that update_issue sends)
+UPDATE_FIELDS = {
+    "research_project": (Config.CUSTOM_FIELD_RESEARCH_PROJECT, "value"),
+    "chargeable": (Config.CUSTOM_FIELD_CHARGEABLE, "id")
+}
+
+
+def get_update_options(email, api_token, jira_instance, issue_key=None):
+    """
+    Options per update parameter:
+    {"research_project": {"field_id": ..., "options": [...] or None}, ...}
+    """
+    return {
+        name: {
+            "field_id": field_id,
+            "options": get_field_options(field_id, email, api_token, jira_instance, issue_key=issue_key)
+        }
+        for name, (field_id, _) in UPDATE_FIELDS.items()
+    }
+
+
+def validate_update(values, email, api_token, jira_instance, issue_key=None):
+    """
+    Check update values ({"research_project": ..., "chargeable": ...}) against
+    the enabled options. Empty values are not checked.
+    Returns None if valid, otherwise an error dict with the allowed values.
+    """
+    for name, value in values.items():
+        if not value or name not in UPDATE_FIELDS:
+            continue
+        field_id, attribute = UPDATE_FIELDS[name]
+        options = get_field_options(field_id, email, api_token, jira_instance, issue_key=issue_key)
+        if options is None:
+            logger.debug("Options of %s unavailable, leaving validation of %s to Jira", field_id, name)
+            continue
+        allowed = [option[attribute] for option in options if not option.get("disabled")]
+        if str(value) not in allowed:
+            logger.info("Rejected %s=%r for %s: not an allowed option of %s", name, value, issue_key, field_id)
+            return {
+                "message": f"Invalid {name.replace('_', ' ')}: {value!r} is not an allowed option.",
+                "field": name,
+                "allowed": allowed
+            }
+    return None
@@ -3,29 +3,100 @@ Jira API service layer for interacting with Jira REST API.
 """
 import requests
 from requests.auth import HTTPBasicAuth
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import matplotlib
 matplotlib.use("Agg")  # Force Matplotlib to use a non-GUI backend
 import matplotlib.pyplot as plt
 from collections import defaultdict
+import heapq
 import io
 import base64
-import json
 import logging
-from urllib.parse import quote
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, urlsplit
 from app.config import Config
+from app.services.metrics_service import (
+    HIERARCHY_TRUNCATIONS,
+    JIRA_REQUEST_DURATION,
+    JIRA_RESPONSES,
+    JIRA_RETRIES,
+    endpoint_family,
+    status_class,
+    track_pool_task
+)
+from app.services.tracing_service import bind_context, record_span
+from app.services.fair_executor import submit as submit_fair
+from app.services.single_flight import single_flight
+from app.utils.jql import ISSUE_KEY, MAX_KEYS_PER_CLAUSE, build_filter_jql, format_keys
+from app.utils.treemap import squarify
+from app.services.cache_service import CACHE_REQUESTS, get_cache, cache_key, namespace_of
+from app.services.circuit_breaker import CircuitOpenError, get_breaker
+from app.services.job_queue import PermanentJobError
+from app.services.deadline_service import (
+    MIN_CALL_BUDGET,
+    DeadlineExceeded,
+    check_deadline,
+    clamp_timeout,
+    deadline_expired,
+    mark_partial,
+    remaining
+)
 
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Jira returns at most 100 issues per search page when fields are requested
+VERSION_BATCH_SIZE = 100
+
+
+def _api_base(jira_instance):
+    """Return the REST API v3 base URL for a Jira instance."""
+    return f"{Config.JIRA_SCHEME}://{jira_instance}/rest/api/3"
+
+
+def _retry_delay(retry_count, max_retries, slept, delay):
+    """Return the delay to sleep before the next attempt, or None to stop retrying."""
+    if retry_count >= max_retries:
+        return None
+    if slept + delay > Config.JIRA_MAX_RETRY_SLEEP:
+        return None
+    left = remaining()
+    if left is not None and delay + MIN_CALL_BUDGET > left:
+        # The retry would not fit in the request's deadline
+        return None
+    return delay
+
+
+def _retry_after(value, default):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
 
 def _make_request(url, method="GET", auth=None, headers=None, json=None, timeout=30, max_retries=3):
     """
     Helper to make HTTP requests with retry logic and exponential backoff.
     Honors Retry-After header for 429 errors.
+    
+    Calls go through the instance's circuit breaker: while it is open this
+    raises CircuitOpenError (a RequestException) without contacting Jira.
+    Total backoff per call is capped at JIRA_MAX_RETRY_SLEEP seconds, and
+    each attempt's timeout is shrunk to the request deadline (see
+    deadline_service); DeadlineExceeded is raised once it has passed.
     """
     # Sanitize auth if provided
     if auth:
@@ -33,52 +104,127 @@ def _make_request(url, method="GET", auth=None, headers=None, json=None, timeout
     
     # Mask token for logging: "ATATT...last4"
     token_masked = "None"
-    if auth and auth.password:
+    if auth and auth.password and logger.isEnabledFor(logging.DEBUG):
         p = auth.password
         token_masked = f"{p[:5]}...{p[-4:]}" if len(p) > 10 else "***"
     
-    logger.debug(f"[_make_request] {method} {url}")
-    logger.debug(f"[_make_request] Auth User: {auth.username if auth else 'None'}, Token: {token_masked}")
+    logger.debug("[_make_request] %s %s", method, url)
+    logger.debug("[_make_request] Auth User: %s, Token: %s", auth.username if auth else "None", token_masked)
 
+    family = endpoint_family(url)
+    breaker = get_breaker(urlsplit(url).netloc)
     retry_count = 0
+    slept = 0.0
     response = None
-    while retry_count <= max_retries:
-        try:
-            if method == "GET":
-                response = requests.get(url, auth=auth, headers=headers, timeout=timeout)
-            elif method == "POST":
-                response = requests.post(url, auth=auth, headers=headers, json=json, timeout=timeout)
-            elif method == "PUT":
-                response = requests.put(url, auth=auth, headers=headers, json=json, timeout=timeout)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+    call_started = time.perf_counter()
+    try:
+        while retry_count <= max_retries:
+            try:
+                check_deadline(f"{method} {family}")
+                breaker.before_request()
+            except (CircuitOpenError, DeadlineExceeded):
+                if response is not None:
+                    # Out of budget while we were retrying: hand back the last failure
+                    return response
+                raise
+            
+            attempt_timeout = clamp_timeout(timeout)
+            started = time.perf_counter()
+            # Whether this attempt has reported to the breaker (or given back its probe slot)
+            settled = False
+            try:
+                if method == "GET":
+                    response = requests.get(url, auth=auth, headers=headers, timeout=attempt_timeout)
+                elif method == "POST":
+                    response = requests.post(url, auth=auth, headers=headers, json=json, timeout=attempt_timeout)
+                elif method == "PUT":
+                    response = requests.put(url, auth=auth, headers=headers, json=json, timeout=attempt_timeout)
+                else:
+                    raise ValueError(f"Unsupported method: {method}")
 
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 2 * (retry_count + 1)))
-                logger.warning(f"Rate limited (429). Retrying in {retry_after}s... (Attempt {retry_count + 1}/{max_retries})")
-                time.sleep(retry_after)
-                retry_count += 1
-                continue
+                JIRA_REQUEST_DURATION.observe(family, method, value=time.perf_counter() - started)
+                JIRA_RESPONSES.inc(family, status_class(response.status_code))
+
+                if response.status_code == 429:
+                    breaker.record_failure()
+                    settled = True
+                    delay = _retry_delay(
+                        retry_count, max_retries, slept,
+                        _retry_after(response.headers.get("Retry-After"), 2 * (retry_count + 1))
+                    )
+                    if delay is None:
+                        break
+                    logger.warning(
+                        "Rate limited (429). Retrying in %ss... (Attempt %d/%d)",
+                        delay, retry_count + 1, max_retries
+                    )
+                    JIRA_RETRIES.inc(family, "429")
+                    time.sleep(delay)
+                    slept += delay
+                    retry_count += 1
+                    continue
+
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                    settled = True
+                    delay = _retry_delay(retry_count, max_retries, slept, 2 ** retry_count)
+                    if delay is None:
+                        break
+                    logger.warning(
+                        "Server error (%s). Retrying in %ss... (Attempt %d/%d)",
+                        response.status_code, delay, retry_count + 1, max_retries
+                    )
+                    JIRA_RETRIES.inc(family, "5xx")
+                    time.sleep(delay)
+                    slept += delay
+                    retry_count += 1
+                    continue
 
-            if response.status_code >= 500:
-                backoff = 2 ** retry_count
-                logger.warning(f"Server error ({response.status_code}). Retrying in {backoff}s... (Attempt {retry_count + 1}/{max_retries})")
-                time.sleep(backoff)
+                breaker.record_success()
+                settled = True
+                return response
+
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                JIRA_REQUEST_DURATION.observe(family, method, value=time.perf_counter() - started)
+                JIRA_RESPONSES.inc(family, "error")
+                if attempt_timeout < timeout and isinstance(e, requests.exceptions.Timeout):
+                    # Timed out on our shortened deadline, not Jira's fault
+                    breaker.release()
+                else:
+                    breaker.record_failure()
+                settled = True
+                delay = _retry_delay(retry_count, max_retries, slept, 2 ** retry_count)
+                if delay is None:
+                    check_deadline(f"{method} {family}")
+                    raise
+                JIRA_RETRIES.inc(family, "network")
+                logger.warning(
+                    "Network error: %s. Retrying in %ss... (Attempt %d/%d)",
+                    e, delay, retry_count + 1, max_retries
+                )
+                time.sleep(delay)
+                slept += delay
                 retry_count += 1
-                continue
+            finally:
+                if not settled:
+                    # Any other error (bad encoding, redirect loop, ...): never keep a half-open probe slot
+                    breaker.release()
 
-            return response
+        # If we fall through, return the last response or raise if no response
+        if response is None:
+            raise requests.exceptions.RequestException("Max retries exceeded without response")
+        return response
+    finally:
+        record_span(family, method, url, response, retry_count, time.perf_counter() - call_started)
 
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            backoff = 2 ** retry_count
-            logger.warning(f"Network error: {e}. Retrying in {backoff}s... (Attempt {retry_count + 1}/{max_retries})")
-            time.sleep(backoff)
-            retry_count += 1
 
-    # If we fall through, return the last response or raise if no response
-    if response is None:
-        raise requests.exceptions.RequestException("Max retries exceeded without response")
-    return response
+def _serve_stale(key):
+    """Return an expired cache entry (if still kept) while Jira is failing."""
+    value = get_cache().get_stale(key)
+    if value is not None:
+        CACHE_REQUESTS.inc(namespace_of(key), "stale_served")
+        logger.warning("Jira unavailable, serving stale cache entry %s", key)
+    return value
 
 
 def get_issue_links(issue_data):
@@ -96,153 +242,197 @@ def get_issue_links(issue_data):
             if "inwardIssue" in link:
                 issue_links.append({
                     "key": link["inwardIssue"]["key"],
-                    "link_type": f"Inward: {link['type']['inward']}"
+                    "link_type": f"Inward: {link['type']['inward']}",
+                    "type_name": link["type"].get("name")
                 })
             if "outwardIssue" in link:
                 issue_links.append({
                     "key": link["outwardIssue"]["key"],
-                    "link_type": f"Outward: {link['type']['outward']}"
+                    "link_type": f"Outward: {link['type']['outward']}",
+                    "type_name": link["type"].get("name")
                 })
     
     return issue_links
 
 
+def research_project_of(issue):
+    """Research project name of a search result issue."""
+    project_data = issue.get("fields", {}).get(Config.CUSTOM_FIELD_RESEARCH_PROJECT, {})
+    return (
+        project_data.get("value", "Unknown Project")
+        if isinstance(project_data, dict)
+        else str(project_data)
+    )
+
+
+def parse_worklog_started(started):
+    """Parse a worklog's `started` timestamp (keeps its UTC offset); None if invalid."""
+    if not started:
+        return None
+    try:
+        started_at = datetime.fromisoformat(started.replace("Z", "+00:00"))
+    except ValueError:
+        # Jira sends offsets without a colon (+0200), which Python < 3.11 rejects
+        try:
+            started_at = datetime.strptime(started, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except ValueError:
+            logger.warning("[WORKLOGS] Failed to parse worklog date %s", started)
+            return None
+    return started_at if started_at.tzinfo else started_at.replace(tzinfo=timezone.utc)
+
+
+def fetch_author_worklogs(author_id, since, email, api_token, jira_instance):
+    """
+    Fetch the issues an author logged work on since `since` (a JQL date such
+    as "-14d" or "2026-10-01") and the worklogs of each issue.
+    Returns (issues, worklogs_by_key), or None if the search failed.
+    Issues carry summary and research project; worklogs_by_key maps issue
+    keys to the issue's full worklog list (all authors, all dates).
+    """
+    jql = f'worklogAuthor = "{author_id}" AND worklogDate >= "{since}"'
+    fields = ["summary", Config.CUSTOM_FIELD_RESEARCH_PROJECT]
+    auth = HTTPBasicAuth(email, api_token)
+    headers = {"Accept": "application/json"}
+    
+    issues = []
+    token = None
+    while True:
+        success, data = search_page(jql, fields, email, api_token, jira_instance, next_page_token=token)
+        if not success:
+            logger.error("[WORKLOGS] Failed to find worklog issues, Status Code: %s", data["status_code"])
+            return None
+        issues.extend(data.get("issues", []))
+        token = data.get("nextPageToken")
+        if data.get("isLast", True) or not token:
+            break
+    logger.info("[WORKLOGS] Found %d issues with worklogs by %s since %s", len(issues), author_id, since)
+    
+    def fetch_issue_worklogs(issue_key):
+        try:
+            response = _make_request(f"{_api_base(jira_instance)}/issue/{issue_key}/worklog", headers=headers, auth=auth)
+            if response.status_code == 200:
+                return response.json().get("worklogs", [])
+        except requests.exceptions.RequestException as e:
+            logger.warning("Failed to fetch worklogs for %s: %s", issue_key, e)
+        return None
+    
+    # Fetch worklogs in parallel on the shared, per-user fair executor
+    fair_user = (jira_instance, email)
+    futures = {
+        submit_fair(
+            fair_user, track_pool_task("worklogs", bind_context(fetch_issue_worklogs)), issue["key"], pool="worklogs"
+        ): issue["key"]
+        for issue in issues
+    }
+    worklogs_by_key = {}
+    for future in as_completed(futures):
+        worklogs = future.result()
+        if worklogs is not None:
+            worklogs_by_key[futures[future]] = worklogs
+    return issues, worklogs_by_key
+
+
 def get_recent_worklogs(assignee_id, email, api_token, jira_instance):
     """
     Fetch all worklogs for a given assignee in the last 14 days.
     Returns tuple of (worklog_issues, worklog_data_dict).
+    Results are cached per user for CACHE_WORKLOG_TTL seconds.
     """
     jira_instance = jira_instance.strip()
     if not assignee_id:
         logger.warning("No valid assignee ID found, skipping worklog lookup.")
         return [], {}
     
-    logger.info(f"[WORKLOGS] Fetching worklogs for Assignee ID: {assignee_id}")
-    
-    jql_query = f"worklogAuthor = {assignee_id} AND worklogDate >= -14d"
-    url = f"https://{jira_instance}/rest/api/3/search/jql"
-    
-    auth = HTTPBasicAuth(email, api_token)
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "jql": jql_query,
-        "maxResults": 1000,  # Get up to 1000 issues with worklogs
-        "fields": ["summary", Config.CUSTOM_FIELD_RESEARCH_PROJECT]
-    }
+    worklog_cache_key = cache_key("worklogs", jira_instance, email, assignee_id)
+    cached = get_cache().get(worklog_cache_key)
+    if cached is not None:
+        return cached["issues"], cached["by_project"]
     
-    logger.info(f"[WORKLOGS] Making POST request to: {url}")
-    logger.info(f"[WORKLOGS] JQL query: {jql_query}")
+    logger.info("[WORKLOGS] Fetching worklogs for Assignee ID: %s", assignee_id)
     
-    response = _make_request(url, method="POST", headers=headers, auth=auth, json=payload)
+    try:
+        fetched = fetch_author_worklogs(assignee_id, "-14d", email, api_token, jira_instance)
+    except requests.exceptions.RequestException as e:
+        logger.error("[WORKLOGS] Failed to fetch worklogs: %s", e)
+        fetched = None
+    if fetched is None:
+        cached = _serve_stale(worklog_cache_key)
+        return (cached["issues"], cached["by_project"]) if cached is not None else ([], {})
+    issues, worklog_results = fetched
     
     worklog_data = {}
     worklog_issues = []
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=14)
     
-    logger.info(f"[WORKLOGS] Response status: {response.status_code}")
-    if response.status_code == 200:
-        data = response.json()
-        issues = data.get("issues", [])
-        logger.info(f"[WORKLOGS] Found {len(issues)} issues with worklogs")
+    for issue in issues:
+        issue_key = issue.get("key", "Unknown Issue")
+        project = research_project_of(issue)
         
-        # Internal helper to fetch worklogs for an issue
-        def fetch_issue_worklogs(issue):
-            issue_key = issue.get("key", "Unknown Issue")
-            try:
-                worklog_url = f"https://{jira_instance}/rest/api/3/issue/{issue_key}/worklog"
-                wl_resp = _make_request(worklog_url, headers=headers, auth=auth)
-                if wl_resp.status_code == 200:
-                    return issue_key, wl_resp.json()
-            except Exception as e:
-                logger.warning(f"Failed to fetch worklogs for {issue_key}: {e}")
-            return issue_key, None
-
-        # Fetch worklogs in parallel
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_issue = {executor.submit(fetch_issue_worklogs, issue): issue for issue in issues}
-            
-            worklog_results = {}
-            for future in as_completed(future_to_issue):
-                issue_key, result = future.result()
-                if result:
-                    worklog_results[issue_key] = result
-
-        for issue in issues:
-            issue_key = issue.get("key", "Unknown Issue")
-            project_data = issue.get("fields", {}).get(Config.CUSTOM_FIELD_RESEARCH_PROJECT, {})
-            project = (
-                project_data.get("value", "Unknown Project")
-                if isinstance(project_data, dict)
-                else str(project_data)
-            )
-            
-            total_time_spent = 0
-            if issue_key in worklog_results:
-                data_full = worklog_results[issue_key]
-                all_worklogs = data_full.get("worklogs", [])
-                
-                cutoff_date = datetime.now() - timedelta(days=14)
-                if cutoff_date.tzinfo is None:
-                    from datetime import timezone
-                    cutoff_date = cutoff_date.replace(tzinfo=timezone.utc)
-                
-                for wl in all_worklogs:
-                    wl_author_id = wl.get("author", {}).get("accountId", "")
-                    wl_started = wl.get("started", "")
-                    
-                    if wl_author_id == assignee_id and wl_started:
-                        try:
-                            wl_started_clean = wl_started.replace("Z", "+00:00")
-                            wl_date = datetime.fromisoformat(wl_started_clean)
-                            if wl_date.tzinfo is None:
-                                from datetime import timezone
-                                wl_date = wl_date.replace(tzinfo=timezone.utc)
-                            
-                            if wl_date >= cutoff_date:
-                                total_time_spent += wl.get("timeSpentSeconds", 0) / 3600
-                        except Exception as date_error:
-                            logger.warning(f"[WORKLOGS] Failed to parse worklog date {wl_started}: {date_error}")
-            
-            if total_time_spent > 0:
-                worklog_data[project] = worklog_data.get(project, 0) + total_time_spent
-                worklog_issues.append({
-                    "key": issue_key,
-                    "name": issue.get("fields", {}).get("summary", "No Title"),
-                    "research_project": project,
-                    "time_spent_hours": round(total_time_spent, 2)
-                })
+        total_time_spent = 0
+        for wl in worklog_results.get(issue_key, []):
+            wl_author_id = wl.get("author", {}).get("accountId", "")
+            wl_started = parse_worklog_started(wl.get("started", ""))
+            if wl_author_id == assignee_id and wl_started and wl_started >= cutoff_date:
+                total_time_spent += wl.get("timeSpentSeconds", 0) / 3600
         
-        logger.info(f"[WORKLOGS] Worklogs Retrieved: {worklog_data}, Total issues: {len(worklog_issues)}")
-    else:
-        logger.error(
-            f"[WORKLOGS] Failed to fetch worklogs, Status Code: {response.status_code}, "
-            f"Response: {response.text}"
-        )
+        if total_time_spent > 0:
+            worklog_data[project] = worklog_data.get(project, 0) + total_time_spent
+            worklog_issues.append({
+                "id": issue.get("id"),
+                "key": issue_key,
+                "name": issue.get("fields", {}).get("summary", "No Title"),
+                "research_project": project,
+                "time_spent_hours": round(total_time_spent, 2)
+            })
+    
+    logger.info("[WORKLOGS] Worklogs Retrieved for %d projects, Total issues: %d", len(worklog_data), len(worklog_issues))
+    logger.debug("[WORKLOGS] Worklog hours by project: %s", worklog_data)
+    get_cache().set(
+        worklog_cache_key,
+        {"issues": worklog_issues, "by_project": worklog_data},
+        ttl=Config.CACHE_WORKLOG_TTL
+    )
     
     return worklog_issues, worklog_data
 
 
-def prepare_treemap_data(worklog_issues, time_spent_by_project):
+def _issue_hours(issue):
+    return issue.get("time_spent_hours", 0)
+
+
+def _apply_layout(nodes, x, y, width, height):
+    """Attach squarified coordinates to nodes (sorted by value) and their children."""
+    for node, (node_x, node_y, node_w, node_h) in zip(
+        nodes, squarify([node["value"] for node in nodes], x, y, width, height)
+    ):
+        node["x"], node["y"] = round(node_x, 2), round(node_y, 2)
+        node["w"], node["h"] = round(node_w, 2), round(node_h, 2)
+        if node.get("children"):
+            _apply_layout(node["children"], node_x, node_y, node_w, node_h)
+
+
+def prepare_treemap_data(worklog_issues, time_spent_by_project, top_n=None, layout=None):
     """
     Prepare treemap data structure grouped by Research Project.
     Returns a hierarchical structure for treemap visualization.
+    
+    Only the top_n issues by hours (default TREEMAP_TOP_N) are kept per
+    project; the rest are folded into one "Other" node, so the payload size
+    does not grow with the number of issues. With layout=(width, height),
+    every node also gets squarified rectangle coordinates x, y, w, h.
     """
     if not time_spent_by_project or not worklog_issues:
         return None
     
+    top_n = Config.TREEMAP_TOP_N if top_n is None else top_n
+    
     # Sort projects by hours descending
     sorted_projects = sorted(time_spent_by_project.items(), key=lambda x: x[1], reverse=True)
     
     # Group worklog issues by project
-    project_issues = {}
+    project_issues = defaultdict(list)
     for issue in worklog_issues:
-        project = issue.get("research_project", "Unknown")
-        if project not in project_issues:
-            project_issues[project] = []
-        project_issues[project].append(issue)
+        project_issues[issue.get("research_project", "Unknown")].append(issue)
     
     # Build treemap data structure
     treemap_data = {
@@ -252,25 +442,49 @@ def prepare_treemap_data(worklog_issues, time_spent_by_project):
     
     for project, hours in sorted_projects:
         issues = project_issues.get(project, [])
-        # Sort issues within project by hours descending
-        issues_sorted = sorted(issues, key=lambda x: x.get("time_spent_hours", 0), reverse=True)
+        # Partial selection: O(n log top_n) instead of sorting every issue
+        top_issues = heapq.nlargest(top_n, issues, key=_issue_hours)
+        
+        children = [
+            {
+                "name": issue.get("name", issue.get("key", "Unknown")),
+                "key": issue.get("key", ""),
+                "value": _issue_hours(issue),
+                "hours": _issue_hours(issue)
+            }
+            for issue in top_issues
+        ]
+        rest = len(issues) - len(top_issues)
+        if rest > 0:
+            other_hours = round(
+                sum(_issue_hours(issue) for issue in issues) - sum(_issue_hours(issue) for issue in top_issues), 2
+            )
+            children.append({
+                "name": f"Other ({rest} issues)",
+                "key": "",
+                "value": other_hours,
+                "hours": other_hours,
+                "count": rest,
+                "other": True
+            })
         
         project_node = {
             "name": project,
             "value": round(hours, 2),
             "hours": round(hours, 2),
-            "children": [
-                {
-                    "name": issue.get("name", issue.get("key", "Unknown")),
-                    "key": issue.get("key", ""),
-                    "value": issue.get("time_spent_hours", 0),
-                    "hours": issue.get("time_spent_hours", 0)
-                }
-                for issue in issues_sorted
-            ]
+            "issue_count": len(issues),
+            "children": children
         }
         treemap_data["children"].append(project_node)
     
+    if layout:
+        width, height = layout
+        treemap_data.update({"x": 0, "y": 0, "w": width, "h": height})
+        # Children are squarified in value order; "Other" is placed by its size too
+        for project_node in treemap_data["children"]:
+            project_node["children"].sort(key=lambda node: node["value"], reverse=True)
+        _apply_layout(treemap_data["children"], 0, 0, width, height)
+    
     return treemap_data
 
 
@@ -295,119 +509,345 @@ def extract_plain_text_from_description(description_data):
     return " ".join(text_content).strip() or "No description available"
 
 
-def get_issue_hierarchy(issue_key, email, api_token, jira_instance):
+def build_issue_node(key, issue_data):
+    """Cacheable hierarchy node: the parsed issue plus its outgoing links."""
+    return {
+        "issue": _parse_issue(key, issue_data),
+        "links": get_issue_links(issue_data)
+    }
+
+
+def _parse_issue(key, issue_data):
+    """Extract the fields shown in the issue view from a Jira issue payload."""
+    issue_name = issue_data["fields"].get("summary", "No Title")
+    raw_description = issue_data["fields"].get("description", {})
+    issue_description = extract_plain_text_from_description(raw_description)
+    
+    assignee_data = issue_data["fields"].get("assignee")
+    assignee_name = (
+        assignee_data.get("displayName", "Unassigned")
+        if assignee_data
+        else "Unassigned"
+    )
+    assignee_id = (
+        assignee_data.get("accountId", None) if assignee_data else None
+    )
+    
+    worklogs = issue_data["fields"].get("worklog", {}).get("worklogs", [])
+    issue_timespent = sum(
+        wl.get("timeSpentSeconds", 0) / 3600 for wl in worklogs
+    )
+    
+    research_project_field = issue_data["fields"].get(Config.CUSTOM_FIELD_RESEARCH_PROJECT)
+    research_project = (
+        research_project_field.get("value")
+        if isinstance(research_project_field, dict)
+        else "N/A"
+    )
+    
+    logger.debug(
+        "Issue %s Assignee -> %s (%s), Time Spent -> %.2f hours, Research Project -> %s",
+        key, assignee_name, assignee_id, issue_timespent, research_project
+    )
+    
+    return {
+        "key": key,
+        "name": issue_name,
+        "description": issue_description,
+        "assignee_name": assignee_name,
+        "assignee_id": assignee_id,
+        "timespent": round(issue_timespent, 2),
+        "research_project": research_project,
+        "updated": issue_data["fields"].get("updated")
+    }
+
+
+class HierarchyLimits:
+    """
+    Traversal budget for get_issue_hierarchy.
+    
+    max_depth        - links are followed at most this many hops from the root
+    max_nodes        - at most this many issues are fetched and returned
+    allow_link_types - if set, only links whose type matches are followed
+    deny_link_types  - links whose type matches are never followed
+    collapse_depth   - issues more than this many hops away are not fetched
+                       but listed by key only (None: off)
+    
+    Link types match case-insensitively against the link type name
+    ("Blocks"), its direction text ("is blocked by") or the full label
+    ("Inward: is blocked by"); "Parent" matches parent links.
+    Defaults come from the HIERARCHY_* settings; requests may only tighten them.
+    """
+    
+    def __init__(self, max_depth=None, max_nodes=None, allow_link_types=None, deny_link_types=None,
+                 collapse_depth=None):
+        self.max_depth = max(0, min(
+            Config.HIERARCHY_MAX_DEPTH if max_depth is None else max_depth, Config.HIERARCHY_MAX_DEPTH
+        ))
+        self.max_nodes = max(1, min(
+            Config.HIERARCHY_MAX_NODES if max_nodes is None else max_nodes, Config.HIERARCHY_MAX_NODES
+        ))
+        # None: every link type not denied is followed
+        allowed = _link_type_set(Config.HIERARCHY_ALLOW_LINK_TYPES) or None
+        requested = _link_type_set(allow_link_types) or None
+        if allowed is not None and requested is not None:
+            self.allow_link_types = allowed & requested
+        else:
+            self.allow_link_types = allowed if requested is None else requested
+        self.deny_link_types = _link_type_set(Config.HIERARCHY_DENY_LINK_TYPES) | _link_type_set(deny_link_types)
+        collapse_depths = [
+            depth for depth in (collapse_depth, Config.HIERARCHY_COLLAPSE_DEPTH)
+            if depth is not None and depth >= 0
+        ]
+        self.collapse_depth = min(collapse_depths) if collapse_depths else None
+    
+    def key(self):
+        """Compact, stable description for cache keys, ETags and single-flight."""
+        return "d{}:n{}:a={}:x={}:c={}".format(
+            self.max_depth,
+            self.max_nodes,
+            "*" if self.allow_link_types is None else ",".join(sorted(self.allow_link_types)),
+            ",".join(sorted(self.deny_link_types)),
+            "" if self.collapse_depth is None else self.collapse_depth
+        )
+    
+    def follows(self, link):
+        """True if the traversal may follow this link (from get_issue_links)."""
+        if self.allow_link_types is None and not self.deny_link_types:
+            return True
+        names = {link["link_type"].lower(), link["link_type"].split(": ", 1)[-1].lower()}
+        if link.get("type_name"):
+            names.add(link["type_name"].lower())
+        if names & self.deny_link_types:
+            return False
+        return self.allow_link_types is None or bool(names & self.allow_link_types)
+
+
+def _link_type_set(value):
+    if isinstance(value, str):
+        value = value.split(",")
+    return {item.strip().lower() for item in (value or ()) if item and item.strip()}
+
+
+def get_issue_hierarchy(issue_key, email, api_token, jira_instance, known_versions=None, limits=None):
     """
-    Fetch a Jira issue and all its linked issues (hierarchy).
-    Returns a list of issue dictionaries.
-    Uses parallel fetching for better performance.
+    Fetch a Jira issue and all its linked issues (hierarchy), within the
+    traversal budget of limits (HierarchyLimits; the configured defaults if None).
+    Returns (issues, truncation): a list of issue dictionaries, root first,
+    each with its link `depth`, and a dict describing what the budget left out:
+    
+        truncated           - True if depth or node limits cut the hierarchy short
+        max_depth/max_nodes - the limits applied
+        depth_skipped       - linked issues beyond max_depth
+        nodes_skipped       - linked issues beyond max_nodes
+        link_types_skipped  - linked issues only reachable through excluded link types
+        collapsed           - [{"key", "link_type", "depth"}] for issues beyond
+                              collapse_depth, listed but not fetched
+    
+    Uses parallel fetching on the shared fair executor for better
+    performance; parsed issues are cached per user (CACHE_ISSUE_TTL) so
+    repeated views skip Jira. Concurrent identical calls share one traversal.
+    
+    Args:
+        known_versions: Optional {issue_key: updated} from get_issue_versions;
+            cached issues whose timestamp differs are re-fetched.
     """
     jira_instance = jira_instance.strip()
+    limits = limits or HierarchyLimits()
+    return single_flight(
+        "hierarchy", (jira_instance, email, issue_key, limits.key()),
+        _load_issue_hierarchy, issue_key, email, api_token, jira_instance, known_versions, limits
+    )
+
+
+def _load_issue_hierarchy(issue_key, email, api_token, jira_instance, known_versions, limits):
+    """Breadth-first hierarchy traversal behind get_issue_hierarchy."""
     auth = HTTPBasicAuth(email, api_token)
     headers = {"Accept": "application/json"}
+    cache = get_cache()
     
     issues = []
     visited_issues = set()
-    # Store issues to be processed: {key: link_type}
+    # Store issues to be processed: {key: link_type}, all at the same depth
     to_fetch = {issue_key: "Self"}
+    depth = 0
+    # Issues left out by the budget; keys reached another way are dropped at the end
+    depth_skipped = set()
+    nodes_skipped = set()
+    link_types_skipped = set()
+    collapsed = {}
+    
+    def add_node(link_type, node):
+        issues.append(dict(node["issue"], link_type=link_type, depth=depth))
+        # Get linked issues for the next level
+        for linked_issue in node["links"]:
+            l_key = linked_issue["key"]
+            if l_key in visited_issues:
+                continue
+            if not limits.follows(linked_issue):
+                link_types_skipped.add(l_key)
+            elif depth + 1 > limits.max_depth:
+                depth_skipped.add(l_key)
+            elif limits.collapse_depth is not None and depth + 1 > limits.collapse_depth:
+                if l_key in collapsed:
+                    continue
+                if len(collapsed) >= limits.max_nodes:
+                    nodes_skipped.add(l_key)
+                    continue
+                collapsed[l_key] = {"key": l_key, "link_type": linked_issue["link_type"], "depth": depth + 1}
+            else:
+                to_fetch[l_key] = linked_issue["link_type"]
     
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        while to_fetch:
-            # Prepare futures for the current batch
-            current_batch = list(to_fetch.items())
-            to_fetch = {}  # Clear for next level links
+    fair_user = (jira_instance, email)
+    while to_fetch:
+        # Prepare futures for the current batch
+        current_batch = list(to_fetch.items())
+        to_fetch = {}  # Clear for next level links
+        
+        futures = {}
+        nodes = {}
+        for key, link_type in current_batch:
+            if key in visited_issues:
+                continue
+            if len(visited_issues) >= limits.max_nodes:
+                nodes_skipped.add(key)
+                continue
+            visited_issues.add(key)
+            
+            node = cache.get(cache_key("issue", jira_instance, email, key))
+            if node is not None and known_versions and key in known_versions:
+                if node["issue"].get("updated") != known_versions[key]:
+                    node = None
+            if node is not None:
+                nodes[key] = node
+                continue
+            if deadline_expired():
+                # Out of time: return what we have instead of waiting on Jira
+                mark_partial("hierarchy")
+                continue
             
-            futures = {}
-            for key, link_type in current_batch:
-                if key in visited_issues:
+            url = f"{_api_base(jira_instance)}/issue/{key}?expand=renderedFields,worklog"
+            task = track_pool_task("hierarchy", bind_context(_make_request))
+            futures[submit_fair(fair_user, task, url, headers=headers, auth=auth, pool="hierarchy")] = key
+        
+        # Collect results as they complete
+        for future in as_completed(futures):
+            key = futures[future]
+            node_key = cache_key("issue", jira_instance, email, key)
+            try:
+                response = future.result()
+                if response.status_code != 200:
+                    logger.error(
+                        "Failed to fetch issue %s, Status Code: %s, Response: %s",
+                        key, response.status_code, response.text
+                    )
+                    if response.status_code >= 500 or response.status_code == 429:
+                        node = _serve_stale(node_key)
+                        if node is not None:
+                            nodes[key] = node
+                        else:
+                            # Left out by a transient failure: never cache or tag this hierarchy
+                            mark_partial("hierarchy")
                     continue
-                visited_issues.add(key)
                 
-                url = f"https://{jira_instance}/rest/api/3/issue/{key}?expand=renderedFields,worklog"
-                futures[executor.submit(_make_request, url, headers=headers, auth=auth)] = (key, link_type)
+                node = build_issue_node(key, response.json())
+                cache.set(node_key, node, ttl=Config.CACHE_ISSUE_TTL)
+                nodes[key] = node
             
-            # Process results as they complete
-            for future in as_completed(futures):
-                key, link_type = futures[future]
-                try:
-                    response = future.result()
-                    if response.status_code != 200:
-                        logger.error(
-                            f"Failed to fetch issue {key}, "
-                            f"Status Code: {response.status_code}, Response: {response.text}"
-                        )
-                        continue
-                    
-                    issue_data = response.json()
-                    
-                    # Extract issue fields
-                    issue_name = issue_data["fields"].get("summary", "No Title")
-                    raw_description = issue_data["fields"].get("description", {})
-                    issue_description = extract_plain_text_from_description(raw_description)
-                    
-                    assignee_data = issue_data["fields"].get("assignee")
-                    assignee_name = (
-                        assignee_data.get("displayName", "Unassigned")
-                        if assignee_data
-                        else "Unassigned"
-                    )
-                    assignee_id = (
-                        assignee_data.get("accountId", None) if assignee_data else None
-                    )
-                    
-                    logger.debug(
-                        f"Issue {key} Assignee Name -> {assignee_name}, "
-                        f"Assignee ID -> {assignee_id}"
-                    )
-                    
-                    worklogs = issue_data["fields"].get("worklog", {}).get("worklogs", [])
-                    issue_timespent = sum(
-                        wl.get("timeSpentSeconds", 0) / 3600 for wl in worklogs
-                    )
-                    
-                    logger.debug(
-                        f"Issue {key} Time Spent -> {round(issue_timespent, 2)} hours"
-                    )
-                    
-                    research_project_field = issue_data["fields"].get(Config.CUSTOM_FIELD_RESEARCH_PROJECT)
-                    research_project = (
-                        research_project_field.get("value")
-                        if isinstance(research_project_field, dict)
-                        else "N/A"
-                    )
-                    
-                    logger.debug(
-                        f"Issue {key} Research Project -> {research_project}"
-                    )
-                    
-                    issues.append({
-                        "key": key,
-                        "name": issue_name,
-                        "description": issue_description,
-                        "assignee_name": assignee_name,
-                        "assignee_id": assignee_id,
-                        "timespent": round(issue_timespent, 2),
-                        "research_project": research_project,
-                        "link_type": link_type
-                    })
-                    
-                    # Get linked issues for the next level
-                    issue_links = get_issue_links(issue_data)
-                    for linked_issue in issue_links:
-                        l_key = linked_issue["key"]
-                        if l_key not in visited_issues:
-                            to_fetch[l_key] = linked_issue["link_type"]
-                            
-                except Exception as e:
-                    logger.error(f"Error processing issue {key}: {e}")
-    
-    logger.debug(f"Completed issue hierarchy retrieval (Total issues: {len(issues)})")
-    return issues
+            except requests.exceptions.RequestException as e:
+                logger.error("Error fetching issue %s: %s", key, e)
+                node = _serve_stale(node_key)
+                if node is not None:
+                    nodes[key] = node
+                else:
+                    mark_partial("hierarchy")
+            except Exception as e:
+                logger.error("Error processing issue %s: %s", key, e)
+                mark_partial("hierarchy")
+        
+        # Expand in link order, so a truncated hierarchy is the same on every call
+        for key, link_type in current_batch:
+            if key in nodes:
+                add_node(link_type, nodes[key])
+        depth += 1
+    
+    truncation = {
+        "max_depth": limits.max_depth,
+        "max_nodes": limits.max_nodes,
+        "depth_skipped": len(depth_skipped - visited_issues),
+        "nodes_skipped": len(nodes_skipped - visited_issues),
+        "link_types_skipped": len(link_types_skipped - visited_issues - set(collapsed)),
+        "collapsed": [entry for key, entry in collapsed.items() if key not in visited_issues]
+    }
+    truncation["truncated"] = bool(truncation["depth_skipped"] or truncation["nodes_skipped"])
+    for reason in ("depth", "nodes"):
+        if truncation[f"{reason}_skipped"]:
+            HIERARCHY_TRUNCATIONS.inc(reason)
+    
+    logger.debug(
+        "Completed issue hierarchy retrieval (Total issues: %d, collapsed: %d, truncated: %s)",
+        len(issues), len(truncation["collapsed"]), truncation["truncated"]
+    )
+    return issues, truncation
+
+
+def get_issue_versions(issue_keys, email, api_token, jira_instance):
+    """
+    Fetch the `updated` timestamp of several issues with one search request
+    (one per VERSION_BATCH_SIZE keys).
+    Returns {issue_key: updated}, or None if the search failed. Issues that
+    no longer exist or are not visible are missing from the result.
+    """
+    jira_instance = jira_instance.strip()
+    issue_keys = list(issue_keys)
+    auth = HTTPBasicAuth(email, api_token)
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    }
+    search_url = f"{_api_base(jira_instance)}/search/jql"
+    
+    versions = {}
+    try:
+        for start in range(0, len(issue_keys), VERSION_BATCH_SIZE):
+            batch = issue_keys[start:start + VERSION_BATCH_SIZE]
+            payload = {
+                "jql": f"key in ({format_keys(batch)})",
+                "maxResults": len(batch),
+                "fields": ["updated"]
+            }
+            response = _make_request(search_url, method="POST", headers=headers, auth=auth, json=payload)
+            if response.status_code != 200:
+                logger.warning(
+                    "Could not fetch issue versions: %s, %s", response.status_code, response.text
+                )
+                return None
+            for issue in response.json().get("issues", []):
+                versions[issue["key"]] = issue.get("fields", {}).get("updated")
+    
+    except requests.exceptions.RequestException as e:
+        logger.warning("Could not fetch issue versions: %s", e)
+        return None
+    
+    return versions
 
 
 def get_jql_from_filter(filter_id, email, api_token, jira_instance):
-    """Get the JQL query from a saved Jira filter by filter ID."""
+    """Get the JQL query from a saved Jira filter by filter ID (cached)."""
     jira_instance = jira_instance.strip()
-    filter_url = f"https://{jira_instance}/rest/api/3/filter/{filter_id}"
+    key = cache_key("filter_jql", jira_instance, email, filter_id)
+    jql = get_cache().get(key)
+    if jql is not None:
+        return jql
+    return single_flight(
+        "filter_jql", (jira_instance, email, filter_id),
+        _fetch_filter_jql, filter_id, key, email, api_token, jira_instance
+    )
+
+
+def _fetch_filter_jql(filter_id, key, email, api_token, jira_instance):
+    """Load a filter's JQL from Jira into the cache (stale copy on failure)."""
+    filter_url = f"{_api_base(jira_instance)}/filter/{filter_id}"
     auth = HTTPBasicAuth(email, api_token)
     headers = {"Accept": "application/json"}
     
@@ -415,17 +855,244 @@ def get_jql_from_filter(filter_id, email, api_token, jira_instance):
         response = _make_request(filter_url, headers=headers, auth=auth)
         
         if response.status_code == 200:
-            return response.json().get("jql")
+            jql = response.json().get("jql")
+            if jql:
+                get_cache().set(key, jql, ttl=Config.CACHE_FILTER_TTL)
+            return jql
         else:
             logger.error(
-                f"Error fetching filter {filter_id}: "
-                f"{response.status_code}, {response.text}"
+                "Error fetching filter %s: %s, %s",
+                filter_id, response.status_code, response.text
             )
-            return None
+            return _serve_stale(key) if response.status_code >= 500 else None
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching filter {filter_id}: {e}")
+        logger.error("Error fetching filter %s: %s", filter_id, e)
+        jql = _serve_stale(key)
+        if jql is None and isinstance(e, (CircuitOpenError, DeadlineExceeded)):
+            raise
+        return jql
+
+
+def _option_tree(values):
+    """Nest cascading child options (which carry optionId) under their parents."""
+    options = []
+    by_id = {}
+    for value in values:
+        if value.get("optionId"):
+            continue
+        option = {"id": str(value.get("id")), "value": value.get("value"), "disabled": bool(value.get("disabled"))}
+        by_id[option["id"]] = option
+        options.append(option)
+    for value in values:
+        parent = by_id.get(str(value.get("optionId") or ""))
+        if parent is not None:
+            parent.setdefault("children", []).append({
+                "id": str(value.get("id")), "value": value.get("value"), "disabled": bool(value.get("disabled"))
+            })
+    return options
+
+
+def _paged_values(url, headers, auth):
+    """Collect "values" from a startAt-paginated Jira endpoint; None on error."""
+    values = []
+    start_at = 0
+    while True:
+        response = _make_request(f"{url}?startAt={start_at}&maxResults=100", headers=headers, auth=auth)
+        if response.status_code != 200:
+            logger.warning("Error fetching %s: %s", url, response.status_code)
+            return None
+        data = response.json()
+        page = data.get("values", [])
+        values.extend(page)
+        if data.get("isLast", True) or not page:
+            return values
+        start_at += len(page)
+
+
+def _field_options_from_editmeta(field_id, issue_key, headers, auth, jira_instance):
+    """Allowed values of a field from an issue's edit metadata (needs no admin rights)."""
+    response = _make_request(f"{_api_base(jira_instance)}/issue/{issue_key}/editmeta", headers=headers, auth=auth)
+    if response.status_code != 200:
+        logger.warning("Error fetching edit metadata of %s: %s", issue_key, response.status_code)
         return None
+    field = response.json().get("fields", {}).get(field_id)
+    if field is None:
+        return None
+    return [
+        {
+            "id": str(value.get("id")),
+            "value": value.get("value"),
+            "disabled": bool(value.get("disabled")),
+            **({"children": [
+                {"id": str(child.get("id")), "value": child.get("value"), "disabled": bool(child.get("disabled"))}
+                for child in value["children"]
+            ]} if value.get("children") else {})
+        }
+        for value in field.get("allowedValues", [])
+    ]
+
+
+def get_field_options(field_id, email, api_token, jira_instance, issue_key=None):
+    """
+    Allowed options of a select custom field (cached for CACHE_FIELD_OPTIONS_TTL).
+    Returns a list of {"id", "value", "disabled"[, "children"]} across all
+    field contexts, or None if they could not be loaded. Reading field
+    contexts needs Jira admin rights; without them the options are taken
+    from issue_key's edit metadata when an issue key is given.
+    
+    Context options are the same for everyone and cached per instance. Edit
+    metadata reflects the issue's project context and the user's
+    permissions, so those options are cached per user and project only.
+    """
+    jira_instance = jira_instance.strip()
+    key = cache_key("field_options", jira_instance, None, field_id)
+    options = get_cache().get(key)
+    if options is not None:
+        return options
+    project_key = None
+    if issue_key:
+        project_key = cache_key("field_options", jira_instance, email, field_id, issue_key.split("-", 1)[0])
+        options = get_cache().get(project_key)
+        if options is not None:
+            return options
+    
+    auth = HTTPBasicAuth(email, api_token)
+    headers = {"Accept": "application/json"}
+    field_url = f"{_api_base(jira_instance)}/field/{field_id}/context"
+    
+    try:
+        options = None
+        contexts = _paged_values(field_url, headers, auth)
+        if contexts is not None:
+            values = []
+            for context in contexts:
+                context_values = _paged_values(f"{field_url}/{context['id']}/option", headers, auth)
+                if context_values is None:
+                    values = None
+                    break
+                values.extend(context_values)
+            if values is not None:
+                # Options shared by several contexts are listed once
+                options = _option_tree(list({str(v.get("id")): v for v in values}.values()))
+        if options is None and issue_key:
+            options = _field_options_from_editmeta(field_id, issue_key, headers, auth, jira_instance)
+            if options is not None:
+                get_cache().set(project_key, options, ttl=Config.CACHE_FIELD_OPTIONS_TTL)
+                return options
+    except requests.exceptions.RequestException as e:
+        logger.error("Error fetching options of %s: %s", field_id, e)
+        return _stale_field_options(key, project_key)
+    
+    if options is None:
+        return _stale_field_options(key, project_key)
+    get_cache().set(key, options, ttl=Config.CACHE_FIELD_OPTIONS_TTL)
+    return options
+
+
+def _stale_field_options(key, project_key):
+    options = _serve_stale(key)
+    if options is None and project_key is not None:
+        options = _serve_stale(project_key)
+    return options
+
+
+def _filter_snapshot(filter_id, jql, search_url, headers, auth, email, jira_instance, max_results):
+    """
+    Return {"keys": [...], "is_last": bool} for the first max_results issues of
+    a filter, used for remaining counts. Cached for CACHE_COUNT_TTL seconds;
+    update_issue and Jira webhooks invalidate or patch the entry.
+    """
+    key = cache_key("filter_count", jira_instance, email, filter_id)
+    snapshot = get_cache().get(key)
+    if snapshot is not None:
+        return snapshot
+    
+    check_payload = {
+        "jql": jql,
+        "maxResults": max_results,
+        "fields": ["key"]
+    }
+    try:
+        check_response = _make_request(
+            search_url,
+            method="POST",
+            headers=headers,
+            auth=auth,
+            json=check_payload
+        )
+    except requests.exceptions.RequestException as e:
+        logger.warning("[SEARCH] Could not check total: %s", e)
+        snapshot = _serve_stale(key)
+        if snapshot is None and isinstance(e, DeadlineExceeded):
+            mark_partial("count")
+        return snapshot
+    if check_response.status_code != 200:
+        return _serve_stale(key)
+    
+    check_data = check_response.json()
+    snapshot = {
+        "keys": [issue["key"] for issue in check_data.get("issues", [])],
+        "is_last": check_data.get("isLast", True)
+    }
+    get_cache().set(key, snapshot, ttl=Config.CACHE_COUNT_TTL)
+    return snapshot
+
+
+def search_page(jql, fields, email, api_token, jira_instance, next_page_token=None, max_results=100):
+    """
+    Fetch one page of /search/jql results.
+    Returns tuple of (success: bool, data: dict) where data is the Jira
+    response (issues, isLast, nextPageToken) or an error description.
+    """
+    jira_instance = jira_instance.strip()
+    payload = {"jql": jql, "maxResults": max_results, "fields": fields}
+    if next_page_token:
+        payload["nextPageToken"] = next_page_token
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    }
+    
+    response = _make_request(
+        f"{_api_base(jira_instance)}/search/jql",
+        method="POST",
+        headers=headers,
+        auth=HTTPBasicAuth(email, api_token),
+        json=payload
+    )
+    if response.status_code != 200:
+        logger.error("[SEARCH] Page request failed: %s, %s", response.status_code, response.text)
+        return False, {
+            "message": "Jira search failed.",
+            "jira_response": response.text[:500],
+            "status_code": response.status_code
+        }
+    return True, response.json()
+
+
+def remember_labeled(jira_instance, email, filter_id, issue_key):
+    """
+    Record an issue labeled from a filter so the user's next-issue lookups
+    skip it for a while. Lists are per user: a user labels one issue at a
+    time, so the read-modify-write below does not race, and other users'
+    keys (which they may not be able to see) never end up in their JQL.
+    """
+    key = cache_key("recent_labels", jira_instance, email, filter_id)
+    now = time.time()
+    entries = [
+        entry for entry in get_cache().get(key, [])
+        if now - entry[1] < Config.RECENTLY_LABELED_SECONDS and entry[0] != issue_key
+    ]
+    entries.append([issue_key, now])
+    get_cache().set(key, entries[-MAX_KEYS_PER_CLAUSE:], ttl=Config.RECENTLY_LABELED_SECONDS)
+
+
+def recently_labeled_keys(jira_instance, email, filter_id):
+    """Issue keys the user labeled from a filter within RECENTLY_LABELED_SECONDS, oldest first."""
+    now = time.time()
+    entries = get_cache().get(cache_key("recent_labels", jira_instance, email, filter_id), [])
+    return [entry[0] for entry in entries if now - entry[1] < Config.RECENTLY_LABELED_SECONDS]
 
 
 def search_issue_by_filter(filter_id, email, api_token, jira_instance, exclude_issue_key=None):
@@ -434,19 +1101,43 @@ def search_issue_by_filter(filter_id, email, api_token, jira_instance, exclude_i
     Returns tuple of (issue_key, total_issues_count).
     
     Args:
-        exclude_issue_key: Optional issue key to exclude from results (for getting next issue)
+        exclude_issue_key: Optional issue key, or collection of keys, to exclude
+            from results (for getting next issue)
     """
     jira_instance = jira_instance.strip()
-    logger.info(f"[SEARCH] Starting search_issue_by_filter with filter_id={filter_id}, exclude_issue_key={exclude_issue_key}")
+    if isinstance(exclude_issue_key, str):
+        exclude_issue_key = [exclude_issue_key]
+    requested = [key for key in exclude_issue_key or () if ISSUE_KEY.match(key)]
+    # Recently labeled issues may still match the filter until Jira reindexes
+    exclude_list = [
+        key for key in recently_labeled_keys(jira_instance, email, filter_id)
+        if ISSUE_KEY.match(key) and key not in requested
+    ] + requested
+    logger.info(
+        "[SEARCH] Starting search_issue_by_filter with filter_id=%s, exclude_issue_key=%s",
+        filter_id, exclude_issue_key
+    )
+    # Identical concurrent lookups (e.g. a double-fired request) share one search
+    return single_flight(
+        "filter_search", (jira_instance, email, filter_id, tuple(exclude_list)),
+        _search_filter, filter_id, exclude_list, email, api_token, jira_instance, requested
+    )
+
+
+def _search_filter(filter_id, exclude_list, email, api_token, jira_instance, required_excludes=None):
+    """
+    Next issue and remaining count for a filter, skipping exclude_list.
+    If Jira rejects the JQL (400, e.g. an excluded issue was deleted or moved),
+    the search is retried excluding only required_excludes.
+    """
+    excluded_keys = set(exclude_list)
     jql = get_jql_from_filter(filter_id, email, api_token, jira_instance)
     
     if not jql:
-        logger.error(
-            f"Error: Could not load saved filter with ID {filter_id}."
-        )
+        logger.error("Error: Could not load saved filter with ID %s.", filter_id)
         return None, 0
     
-    logger.info(f"[SEARCH] JQL query retrieved: {jql[:100]}..." if len(jql) > 100 else f"[SEARCH] JQL query retrieved: {jql}")
+    logger.debug("[SEARCH] JQL query retrieved: %.100s", jql)
     
     auth = HTTPBasicAuth(email, api_token)
     headers = {
@@ -457,18 +1148,17 @@ def search_issue_by_filter(filter_id, email, api_token, jira_instance, exclude_i
     # Get issues and check count (no pagination)
     # If more than maxResults, show "maxResults+"
     max_results = 1000  # Jira's default max per page
-    search_url = f"https://{jira_instance}/rest/api/3/search/jql"
+    search_url = f"{_api_base(jira_instance)}/search/jql"
     
-    # Fetch multiple issues so we can filter out the excluded one in Python
-    # This avoids JQL syntax issues with exclusion
-    fetch_count = 100 if exclude_issue_key else 1
+    # Exclusions and a stable order are added to the filter's JQL, so the
+    # next issue is simply the first result
     payload = {
-        "jql": jql,
-        "maxResults": fetch_count,
+        "jql": build_filter_jql(jql, exclude_list, default_order_by=Config.JQL_DEFAULT_ORDER_BY),
+        "maxResults": 1,
         "fields": ["key"]
     }
     
-    logger.info(f"[SEARCH] Making POST request to search URL: {search_url} with maxResults={fetch_count}")
+    logger.debug("[SEARCH] Making POST request to search URL: %s with JQL: %.200s", search_url, payload["jql"])
     
     try:
         response = _make_request(
@@ -479,53 +1169,48 @@ def search_issue_by_filter(filter_id, email, api_token, jira_instance, exclude_i
             json=payload
         )
         
-        logger.info(f"[SEARCH] POST response status: {response.status_code}")
+        logger.debug("[SEARCH] POST response status: %s", response.status_code)
         if response.status_code == 200:
             data = response.json()
             issues = data.get("issues", [])
             
-            logger.info(f"[SEARCH] Found {len(issues)} issues in response")
+            logger.debug("[SEARCH] Found %d issues in response", len(issues))
             
-            # Filter out excluded issue if specified
-            if exclude_issue_key:
+            # Guard against exclusions Jira did not apply
+            if excluded_keys:
                 original_count = len(issues)
-                issues = [issue for issue in issues if issue["key"] != exclude_issue_key]
-                logger.info(f"[SEARCH] After excluding {exclude_issue_key}: {len(issues)} issues remaining (was {original_count})")
+                issues = [issue for issue in issues if issue["key"] not in excluded_keys]
+                logger.debug(
+                    "[SEARCH] After excluding %s: %d issues remaining (was %d)",
+                    sorted(excluded_keys), len(issues), original_count
+                )
             
             if not issues:
-                logger.warning(f"[SEARCH] No issues found after exclusion. Full response: {json.dumps(data)}")
+                logger.warning(
+                    "[SEARCH] No issues found after exclusion (isLast=%s)",
+                    data.get("isLast")
+                )
                 return (None, 0)
             
             issue_key = issues[0]["key"]
-            logger.info(f"[SEARCH] Selected next issue: {issue_key}")
+            logger.debug("[SEARCH] Selected next issue: %s", issue_key)
             
             # Check total count by requesting max_results (without exclusion for accurate count)
-            check_payload = {
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": ["key"]
-            }
-            check_response = _make_request(
-                search_url,
-                method="POST",
-                headers=headers,
-                auth=auth,
-                json=check_payload
+            snapshot = _filter_snapshot(
+                filter_id, jql, search_url, headers, auth, email, jira_instance, max_results
             )
             
-            if check_response.status_code == 200:
-                check_data = check_response.json()
-                check_issues = check_data.get("issues", [])
-                check_is_last = check_data.get("isLast", True)
+            if snapshot is not None:
+                check_issues = snapshot["keys"]
+                check_is_last = snapshot["is_last"]
                 
-                # If we excluded an issue, subtract 1 from the count
-                if exclude_issue_key:
-                    excluded_in_results = any(issue["key"] == exclude_issue_key for issue in check_issues)
+                # If we excluded issues, subtract those still matching the filter
+                if excluded_keys:
+                    excluded_in_results = sum(1 for key in check_issues if key in excluded_keys)
                     if excluded_in_results:
-                        # The excluded issue is in the results, so we need to subtract 1
-                        # But only if we're counting exactly, not if it's "max_results+"
+                        # Only subtract if we're counting exactly, not if it's "max_results+"
                         if check_is_last:
-                            total_issues = max(0, len(check_issues) - 1)
+                            total_issues = max(0, len(check_issues) - excluded_in_results)
                         else:
                             total_issues = f"{max_results}+"
                     else:
@@ -538,42 +1223,55 @@ def search_issue_by_filter(filter_id, email, api_token, jira_instance, exclude_i
                     if not check_is_last:
                         # More than max_results issues
                         total_issues = f"{max_results}+"
-                        logger.info(f"[SEARCH] More than {max_results} issues found, returning '{total_issues}'")
+                        logger.debug("[SEARCH] More than %d issues found, returning '%s'", max_results, total_issues)
                     else:
                         # Exact count (up to max_results)
                         total_issues = len(check_issues)
-                        logger.info(f"[SEARCH] Found exactly {total_issues} issues")
+                        logger.debug("[SEARCH] Found exactly %d issues", total_issues)
             else:
                 # Fallback: if we can't check, use the count from the first request
-                if exclude_issue_key:
-                    total_issues = len(issues)  # Already filtered
-                else:
-                    total_issues = len(issues) if issues else 1
-                logger.warning(f"[SEARCH] Could not check total, using {total_issues}")
+                # (a single result, so "1+" unless Jira says it was the last)
+                total_issues = len(issues) if data.get("isLast", False) else f"{len(issues)}+"
+                logger.warning("[SEARCH] Could not check total, using %s", total_issues)
             
-            logger.info(f"[SEARCH] Returning issue_key={issue_key}, total_issues={total_issues}")
+            logger.info("[SEARCH] Returning issue_key=%s, total_issues=%s", issue_key, total_issues)
             return (issue_key, total_issues)
         
+        if response.status_code == 400 and required_excludes is not None and \
+                len(required_excludes) < len(exclude_list):
+            logger.warning(
+                "[SEARCH] Jira rejected the exclusions (%s), retrying without recently labeled issues",
+                response.text
+            )
+            return _search_filter(filter_id, list(required_excludes), email, api_token, jira_instance)
+        
         logger.error(
-            f"[SEARCH] Error searching issues: {response.status_code}, {response.text}"
+            "[SEARCH] Error searching issues: %s, %s", response.status_code, response.text
         )
         # Try to parse error details if available
         try:
             error_data = response.json()
-            logger.error(f"[SEARCH] Error details: {json.dumps(error_data)}")
+            logger.error("[SEARCH] Error details: %s", error_data)
         except:
             pass
         return None, 0
     
+    except (CircuitOpenError, DeadlineExceeded):
+        # Let the route answer 503/504 instead of "no issues found"
+        raise
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error searching issues: {e}")
+        logger.error("Error searching issues: %s", e)
         return None, 0
 
 
-def update_issue(issue_key, research_project, chargeable, email, api_token, jira_instance):
+def update_issue(issue_key, research_project, chargeable, email, api_token, jira_instance, filter_id=None):
     """
     Update a Jira issue with research project and chargeable status.
     Returns tuple of (success: bool, response_data: dict).
+    
+    On success this user's cached copy of the issue (and their remaining
+    count for filter_id, if given) is dropped; other users' entries are left
+    to the Jira webhooks and their TTLs.
     """
     jira_instance = jira_instance.strip()
     update_data = {
@@ -586,7 +1284,7 @@ def update_issue(issue_key, research_project, chargeable, email, api_token, jira
     if chargeable:
         update_data["fields"][Config.CUSTOM_FIELD_CHARGEABLE] = {"id": chargeable}
     
-    url = f"https://{jira_instance}/rest/api/3/issue/{issue_key}"
+    url = f"{_api_base(jira_instance)}/issue/{issue_key}"
     auth = HTTPBasicAuth(email, api_token)
     headers = {
         "Accept": "application/json",
@@ -597,11 +1295,15 @@ def update_issue(issue_key, research_project, chargeable, email, api_token, jira
         response = _make_request(url, method="PUT", json=update_data, auth=auth, headers=headers)
         
         if response.status_code == 204:
+            # Drop cached copies so the next view and count show the new values
+            get_cache().delete(cache_key("issue", jira_instance, email, issue_key))
+            if filter_id is not None:
+                get_cache().delete(cache_key("filter_count", jira_instance, email, filter_id))
             return True, {"message": "Issue updated successfully"}
         else:
             logger.error(
-                f"Failed to update issue {issue_key}: "
-                f"{response.status_code} - {response.text}"
+                "Failed to update issue %s: %s - %s",
+                issue_key, response.status_code, response.text
             )
             return False, {
                 "message": "Failed to update issue.",
@@ -610,36 +1312,81 @@ def update_issue(issue_key, research_project, chargeable, email, api_token, jira
             }
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error updating issue {issue_key}: {e}")
+        logger.error("Error updating issue %s: %s", issue_key, e)
         return False, {
             "message": "Error updating issue.",
             "error": str(e),
-            "status_code": 500
+            "status_code": (
+                503 if isinstance(e, CircuitOpenError)
+                else 504 if isinstance(e, DeadlineExceeded)
+                else 500
+            )
         }
 
 
-def add_watcher(issue_key, email, api_token, jira_instance):
-    """Add the current user as a watcher to a Jira issue."""
+def get_myself(email, api_token, jira_instance):
+    """
+    Resolve the identity behind the given credentials.
+    Returns tuple of (identity dict or None, status_code); identity has
+    account_id, display_name, email and timezone.
+    """
+    jira_instance = jira_instance.strip()
+    url = f"{_api_base(jira_instance)}/myself"
+    auth = HTTPBasicAuth(email, api_token)
+    headers = {"Accept": "application/json"}
+    
+    try:
+        response = _make_request(url, headers=headers, auth=auth, max_retries=1)
+    except requests.exceptions.RequestException as e:
+        logger.error("Error resolving Jira identity for %s: %s", email, e)
+        return None, 503
+    
+    if response.status_code != 200:
+        logger.warning("Failed to get user info for %s: %s", email, response.status_code)
+        return None, response.status_code
+    
+    data = response.json()
+    if not data.get("accountId"):
+        logger.warning("Jira returned no accountId for %s", email)
+        return None, 502
+    
+    return {
+        "account_id": data["accountId"],
+        "display_name": data.get("displayName", email),
+        "email": data.get("emailAddress", email),
+        "timezone": data.get("timeZone")
+    }, 200
+
+
+def _is_permanent_failure(status_code):
+    """Client errors other than 429 will fail the same way when retried."""
+    return 400 <= status_code < 500 and status_code != 429
+
+
+def add_watcher(issue_key, email, api_token, jira_instance, account_id=None):
+    """
+    Add the current user as a watcher to a Jira issue.
+    Pass the accountId resolved at login to skip the /myself lookup.
+    Returns True on success (or if already watching), False on errors worth
+    retrying (429, 5xx, network). Raises PermanentJobError for other client
+    errors (401, 403, 404), which a retry will not fix.
+    """
     jira_instance = jira_instance.strip()
     auth = HTTPBasicAuth(email, api_token)
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
     
     try:
-        # First, get the user's accountId
-        user_url = f"https://{jira_instance}/rest/api/3/myself"
-        user_response = _make_request(user_url, headers=headers, auth=auth)
-        
-        if user_response.status_code != 200:
-            logger.warning(f"Failed to get user info: {user_response.status_code}")
-            return
-        
-        account_id = user_response.json().get("accountId")
         if not account_id:
-            logger.warning("Could not get accountId for watcher")
-            return
+            identity, status_code = get_myself(email, api_token, jira_instance)
+            if not identity:
+                logger.warning("Could not get accountId for watcher")
+                if _is_permanent_failure(status_code):
+                    raise PermanentJobError(f"Could not get accountId for watcher: {status_code}")
+                return False
+            account_id = identity["account_id"]
         
         # Add watcher using accountId
-        watcher_url = f"https://{jira_instance}/rest/api/3/issue/{issue_key}/watchers"
+        watcher_url = f"{_api_base(jira_instance)}/issue/{issue_key}/watchers"
         watcher_response = _make_request(
             watcher_url,
             method="POST",
@@ -651,10 +1398,15 @@ def add_watcher(issue_key, email, api_token, jira_instance):
         if watcher_response.status_code not in [204, 400]:
             # 400 if user is already a watcher
             logger.warning(
-                f"Failed to add watcher: {watcher_response.status_code} - "
-                f"{watcher_response.text}"
+                "Failed to add watcher: %s - %s",
+                watcher_response.status_code, watcher_response.text
             )
+            if _is_permanent_failure(watcher_response.status_code):
+                raise PermanentJobError(f"Jira refused to add watcher on {issue_key}: {watcher_response.status_code}")
+            return False
+        return True
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error adding watcher: {e}")
+        logger.error("Error adding watcher: %s", e)
+        return False
 
@@ -0,0 +1,160 @@
+"""
+Background queue for non-critical side effects of API requests.
+
+Jobs (e.g. adding the user as watcher after an update) run on a small pool
+of daemon worker threads after the request has been answered. Failed jobs
+are retried with exponential backoff, unless they raise PermanentJobError
+(e.g. Jira answered 403/404, which a retry will not change). The backlog
+is bounded: when it is full the job runs inline so side effects are
+delayed, never lost.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from app.config import Config
+from app.services.deadline_service import deadline_scope
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+JOB_BACKLOG = registry.gauge(
+    "background_jobs_backlog",
+    "Background jobs waiting to run.",
+)
+JOB_RESULTS = registry.counter(
+    "background_jobs_total",
+    "Background job outcomes (ok, retry, failed, dropped, inline).",
+    ("job", "outcome")
+)
+
+
+class PermanentJobError(Exception):
+    """Raised by a job whose failure a retry cannot fix; the job is dropped."""
+
+
+class JobQueue:
+    """Bounded background job queue with retries."""
+
+    def __init__(self, workers=2, max_backlog=1000, max_retries=3, retry_backoff=1.0):
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue = queue.Queue(maxsize=max_backlog)
+        self._workers = []
+        self._worker_count = workers
+        self._lock = threading.Lock()
+
+    def _ensure_workers(self):
+        if self._workers:
+            return
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(self._worker_count):
+                thread = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._workers.append(thread)
+
+    def submit(self, name, fn, *args, **kwargs):
+        """
+        Queue fn(*args, **kwargs) to run in the background.
+        A job fails when it raises or returns False; failures are retried
+        unless the job raised PermanentJobError.
+        Returns True if queued, False if it had to run inline.
+        """
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((name, fn, args, kwargs, 0))
+            JOB_BACKLOG.inc()
+            return True
+        except queue.Full:
+            logger.warning("Job backlog full, running %s inline", name)
+            JOB_RESULTS.inc(name, "inline")
+            self._execute(name, fn, args, kwargs)
+            return False
+
+    @staticmethod
+    def _execute(name, fn, args, kwargs):
+        """Run one attempt: True on success, False to retry, None if the job must not be retried."""
+        try:
+            # Each attempt gets its own budget, independent of the request that queued it
+            with deadline_scope(Config.JOB_DEADLINE_SECONDS):
+                return fn(*args, **kwargs) is not False
+        except PermanentJobError as e:
+            logger.warning("Background job %s failed permanently: %s", name, e)
+            return None
+        except Exception as e:
+            logger.warning("Background job %s failed: %s", name, e)
+            return False
+
+    def _run(self):
+        while True:
+            name, fn, args, kwargs, attempt = self._queue.get()
+            JOB_BACKLOG.dec()
+            try:
+                result = self._execute(name, fn, args, kwargs)
+                if result:
+                    JOB_RESULTS.inc(name, "ok")
+                elif result is None:
+                    JOB_RESULTS.inc(name, "dropped")
+                elif attempt < self.max_retries:
+                    JOB_RESULTS.inc(name, "retry")
+                    delay = self.retry_backoff * (2 ** attempt)
+                    timer = threading.Timer(delay, self._requeue, (name, fn, args, kwargs, attempt + 1))
+                    timer.daemon = True
+                    timer.start()
+                else:
+                    JOB_RESULTS.inc(name, "failed")
+                    logger.error("Background job %s failed after %d attempts", name, attempt + 1)
+            finally:
+                self._queue.task_done()
+
+    def _requeue(self, name, fn, args, kwargs, attempt):
+        try:
+            self._queue.put_nowait((name, fn, args, kwargs, attempt))
+            JOB_BACKLOG.inc()
+        except queue.Full:
+            JOB_RESULTS.inc(name, "failed")
+            logger.error("Job backlog full, dropping retry of %s", name)
+
+    def join(self, timeout=None):
+        """Wait until the backlog is drained (pending retries excluded)."""
+        deadline = time.monotonic() + timeout if timeout else None
+        while self._queue.unfinished_tasks:
+            if deadline and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Return the process-wide job queue, creating it on first use."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue(
+                    workers=Config.JOB_QUEUE_WORKERS,
+                    max_backlog=Config.JOB_QUEUE_MAX_BACKLOG,
+                    max_retries=Config.JOB_MAX_RETRIES,
+                    retry_backoff=Config.JOB_RETRY_BACKOFF
+                )
+    return _job_queue
+
+
+def submit_job(name, fn, *args, **kwargs):
+    """Queue a side effect on the process-wide job queue."""
+    return get_job_queue().submit(name, fn, *args, **kwargs)
+
+
+def _drain_on_exit():
+    if _job_queue is not None:
+        _job_queue.join(timeout=5)
+
+
+atexit.register(_drain_on_exit)
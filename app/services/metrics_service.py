@@ -0,0 +1,253 @@
+"""
+Lightweight in-process metrics with Prometheus text exposition.
+
+Only the standard library is used; every observation is a dict lookup and
+a few additions under a lock, which is cheap enough to leave enabled.
+"""
+import bisect
+import re
+import threading
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(label_names, label_values, extra=None):
+    pairs = list(zip(label_names, label_values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        '%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(v) for v in labels)
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+            for key, value in items
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+    type_name = "counter"
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+    type_name = "gauge"
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed bucket boundaries."""
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, *labels, value):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [per-bucket counts..., +Inf count], sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def snapshot(self, *labels):
+        """Return (count, sum) for a label set."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            if state is None:
+                return 0, 0.0
+            return sum(state[0]), state[1]
+
+    def _render_samples(self):
+        with self._lock:
+            items = [(key, (list(state[0]), state[1])) for key, state in self._values.items()]
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', repr(float(bound))))} {cumulative}"
+                )
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together on /metrics."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+JIRA_REQUEST_DURATION = registry.histogram(
+    "jira_request_duration_seconds",
+    "Latency of individual Jira REST calls (per attempt).",
+    ("family", "method")
+)
+JIRA_RESPONSES = registry.counter(
+    "jira_responses_total",
+    "Jira responses by endpoint family and status class (2xx, 4xx, 429, 5xx, error).",
+    ("family", "status")
+)
+JIRA_RETRIES = registry.counter(
+    "jira_retries_total",
+    "Retries performed by _make_request by endpoint family and reason.",
+    ("family", "reason")
+)
+POOL_QUEUE_DEPTH = registry.gauge(
+    "jira_pool_queue_depth",
+    "Tasks submitted to a Jira fan-out pool that have not started yet.",
+    ("pool",)
+)
+POOL_ACTIVE = registry.gauge(
+    "jira_pool_active_tasks",
+    "Tasks currently running in a Jira fan-out pool.",
+    ("pool",)
+)
+HIERARCHY_TRUNCATIONS = registry.counter(
+    "hierarchy_truncations_total",
+    "Issue hierarchies cut short by their traversal budget, by limit hit (depth, nodes).",
+    ("reason",)
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Latency of API requests served by this process.",
+    ("route", "method", "status")
+)
+
+_FAMILY_PATTERNS = (
+    ("filter", re.compile(r"/rest/api/\d+/filter/")),
+    ("search", re.compile(r"/rest/api/\d+/search")),
+    ("worklog", re.compile(r"/rest/api/\d+/issue/[^/?]+/worklog")),
+    ("watchers", re.compile(r"/rest/api/\d+/issue/[^/?]+/watchers")),
+    ("issue", re.compile(r"/rest/api/\d+/issue/")),
+    ("myself", re.compile(r"/rest/api/\d+/myself")),
+    ("user", re.compile(r"/rest/api/\d+/user")),
+    ("field", re.compile(r"/rest/api/\d+/field")),
+)
+
+
+def endpoint_family(url):
+    """Map a Jira REST URL to a low-cardinality endpoint family label."""
+    for family, pattern in _FAMILY_PATTERNS:
+        if pattern.search(url):
+            return family
+    return "other"
+
+
+def status_class(status_code):
+    """Map an HTTP status code to the label used by jira_responses_total."""
+    if status_code == 429:
+        return "429"
+    return f"{status_code // 100}xx"
+
+
+def track_pool_task(pool, fn):
+    """
+    Wrap a callable submitted to a fan-out pool so queue depth and active
+    task gauges are maintained. Call once per submit.
+    """
+    POOL_QUEUE_DEPTH.inc(pool)
+
+    def wrapper(*args, **kwargs):
+        POOL_QUEUE_DEPTH.dec(pool)
+        POOL_ACTIVE.inc(pool)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            POOL_ACTIVE.dec(pool)
+
+    return wrapper
@@ -0,0 +1,429 @@
+"""
+Local full-text index over a saved filter's issues.
+
+Issues of a filter are copied into a SQLite FTS5 table (summary, plain-text
+description, research project) so /api/filters/<id>/search can answer
+"the issue about X" without a Jira round trip. Each (instance, user,
+filter) is indexed separately, so results never include issues the user
+could not see in Jira.
+
+The first search starts the build in the background and waits up to
+SEARCH_INDEX_INLINE_WAIT_SECONDS for it, so small filters are answered
+right away while large ones report "indexing" instead of running into the
+request deadline. Later searches answer from the index and, once it is
+older than SEARCH_INDEX_REFRESH_SECONDS, start an incremental sync in the
+background. Syncs run one at a time on the index's own worker thread
+(see sync_worker.py); a sync requested while another runs is dropped and
+requested again by a later search. An incremental sync fetches only issues with
+`updated >= -<N>m` (relative to Jira's clock, so time zones do not matter)
+and drops issues that were updated out of the filter. A full rebuild every
+SEARCH_INDEX_REBUILD_SECONDS (or when the filter's JQL changes) catches
+anything else, e.g. deleted issues.
+"""
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import requests
+from app.config import Config
+from app.services.deadline_service import deadline_scope
+from app.services.jira_service import (
+    extract_plain_text_from_description,
+    get_jql_from_filter,
+    search_page
+)
+from app.services.metrics_service import registry
+from app.services.sync_worker import SyncWorker
+from app.utils.jql import ISSUE_KEY, build_filter_jql, format_keys, split_order_by
+
+logger = logging.getLogger(__name__)
+
+SYNCS = registry.counter(
+    "search_index_syncs_total",
+    "Local search index syncs by mode (full, incremental) and result.",
+    ("mode", "result")
+)
+QUERY_DURATION = registry.histogram(
+    "search_index_query_seconds",
+    "Latency of local full-text searches.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_filters (
+    jira_instance TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    filter_id TEXT NOT NULL,
+    jql TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    rebuilt_at REAL NOT NULL,
+    PRIMARY KEY (jira_instance, owner, filter_id)
+);
+CREATE TABLE IF NOT EXISTS indexed_issues (
+    id INTEGER PRIMARY KEY,
+    jira_instance TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    filter_id TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    updated TEXT,
+    generation INTEGER NOT NULL,
+    UNIQUE (jira_instance, owner, filter_id, issue_key)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS issue_text USING fts5(
+    summary, description, research_project,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+_FIELDS = ["summary", "description", "updated", Config.CUSTOM_FIELD_RESEARCH_PROJECT]
+
+# Relative `updated >= -Nm` window is widened by this many minutes for clock skew
+_SYNC_OVERLAP_MINUTES = 2
+
+# Indexed keys per `key in (...)` query when looking for issues that left a filter
+_LEFT_FILTER_BATCH = 100
+
+# bm25 column weights: summary, description, research project
+_RANK = "bm25(issue_text, 10.0, 1.0, 5.0)"
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class IndexSyncError(Exception):
+    """The filter could not be (re)indexed from Jira."""
+
+    def __init__(self, message, status_code=502):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def match_expression(query):
+    """
+    FTS5 MATCH expression for free text: every word must match, the last
+    one as a prefix (search-as-you-type). Returns None for empty queries.
+    """
+    tokens = _TOKEN.findall(query or "")
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _issue_text(issue):
+    fields = issue.get("fields", {})
+    description = fields.get("description")
+    research_project = fields.get(Config.CUSTOM_FIELD_RESEARCH_PROJECT)
+    return (
+        fields.get("summary") or "",
+        extract_plain_text_from_description(description) if description else "",
+        research_project.get("value", "") if isinstance(research_project, dict) else ""
+    )
+
+
+class SearchIndex:
+    """SQLite FTS5 index of filter issues, one scope per (instance, user, filter)."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self._syncing = {}  # scope -> Event set when the queued sync finished
+        self._errors = {}   # scope -> IndexSyncError of a failed background build
+        self._worker = SyncWorker("search_index")
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_db(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _scope_lock(self, scope):
+        with self._locks_lock:
+            lock = self._locks.get(scope)
+            if lock is None:
+                lock = self._locks[scope] = threading.Lock()
+            return lock
+
+    def state(self, jira_instance, owner, filter_id):
+        """Sync state of a filter's index: {"jql", "generation", "synced_at", "rebuilt_at", "issues"} or None."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT jql, generation, synced_at, rebuilt_at FROM indexed_filters "
+                "WHERE jira_instance = ? AND owner = ? AND filter_id = ?",
+                (jira_instance, owner, str(filter_id))
+            ).fetchone()
+            if row is None:
+                return None
+            count = conn.execute(
+                "SELECT COUNT(*) FROM indexed_issues WHERE jira_instance = ? AND owner = ? AND filter_id = ?",
+                (jira_instance, owner, str(filter_id))
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        return {"jql": row[0], "generation": row[1], "synced_at": row[2], "rebuilt_at": row[3], "issues": count}
+
+    def _upsert(self, conn, scope, issue, generation):
+        jira_instance, owner, filter_id = scope
+        key = issue.get("key")
+        updated = issue.get("fields", {}).get("updated")
+        row = conn.execute(
+            "SELECT id FROM indexed_issues WHERE jira_instance = ? AND owner = ? AND filter_id = ? AND issue_key = ?",
+            (jira_instance, owner, filter_id, key)
+        ).fetchone()
+        if row is None:
+            row_id = conn.execute(
+                "INSERT INTO indexed_issues (jira_instance, owner, filter_id, issue_key, updated, generation) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (jira_instance, owner, filter_id, key, updated, generation)
+            ).lastrowid
+        else:
+            row_id = row[0]
+            conn.execute(
+                "UPDATE indexed_issues SET updated = ?, generation = ? WHERE id = ?",
+                (updated, generation, row_id)
+            )
+            conn.execute("DELETE FROM issue_text WHERE rowid = ?", (row_id,))
+        conn.execute(
+            "INSERT INTO issue_text (rowid, summary, description, research_project) VALUES (?, ?, ?, ?)",
+            (row_id,) + _issue_text(issue)
+        )
+
+    def _delete(self, conn, scope, where, params):
+        ids = [row[0] for row in conn.execute(
+            f"SELECT id FROM indexed_issues WHERE jira_instance = ? AND owner = ? AND filter_id = ? AND {where}",
+            scope + tuple(params)
+        )]
+        for row_id in ids:
+            conn.execute("DELETE FROM issue_text WHERE rowid = ?", (row_id,))
+            conn.execute("DELETE FROM indexed_issues WHERE id = ?", (row_id,))
+        return len(ids)
+
+    def _pages(self, jql, fields, email, api_token, jira_instance):
+        """Yield the issues of a JQL search, page by page via nextPageToken."""
+        token = None
+        while True:
+            success, data = search_page(jql, fields, email, api_token, jira_instance, next_page_token=token)
+            if not success:
+                raise IndexSyncError(
+                    f"Jira search failed with {data['status_code']}",
+                    status_code=400 if data["status_code"] == 400 else 502
+                )
+            yield from data.get("issues", [])
+            token = data.get("nextPageToken")
+            if data.get("isLast", True) or not token:
+                return
+
+    def sync(self, filter_id, email, api_token, jira_instance, full=False):
+        """
+        Bring a filter's index up to date: incrementally by default, fully when
+        there is no index yet, the filter's JQL changed or the last rebuild is
+        older than SEARCH_INDEX_REBUILD_SECONDS. Returns the number of issues written.
+        Raises IndexSyncError (or a RequestException from Jira).
+        """
+        jira_instance = jira_instance.strip()
+        scope = (jira_instance, email, str(filter_id))
+        with self._scope_lock(scope):
+            jql = get_jql_from_filter(filter_id, email, api_token, jira_instance)
+            if not jql:
+                raise IndexSyncError(f"Could not load saved filter with ID {filter_id}.", status_code=404)
+
+            started = time.time()
+            state = self.state(*scope)
+            full = (
+                full or state is None or state["jql"] != jql
+                or started - state["rebuilt_at"] > Config.SEARCH_INDEX_REBUILD_SECONDS
+            )
+            mode = "full" if full else "incremental"
+            generation = (state["generation"] + 1) if state else 1
+            try:
+                written, removed = self._sync(scope, jql, state, full, generation, email, api_token)
+            except Exception:
+                SYNCS.inc(mode, "error")
+                raise
+
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO indexed_filters "
+                    "(jira_instance, owner, filter_id, jql, generation, synced_at, rebuilt_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    scope + (jql, generation, started, started if full else state["rebuilt_at"])
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            SYNCS.inc(mode, "ok")
+            logger.info(
+                "[INDEX] Filter %s (%s): %s sync wrote %d issues, removed %d in %.2fs",
+                filter_id, email, mode, written, removed, time.time() - started
+            )
+            return written
+
+    def _sync(self, scope, jql, state, full, generation, email, api_token):
+        jira_instance = scope[0]
+        if full:
+            search_jql = build_filter_jql(jql, default_order_by=Config.JQL_DEFAULT_ORDER_BY)
+        else:
+            minutes = math.ceil((time.time() - state["synced_at"]) / 60) + _SYNC_OVERLAP_MINUTES
+            search_jql = build_filter_jql(
+                jql, default_order_by=Config.JQL_DEFAULT_ORDER_BY,
+                extra_clauses=[f"updated >= -{minutes}m"]
+            )
+
+        written = removed = 0
+        conn = self._connect()
+        try:
+            for issue in self._pages(search_jql, _FIELDS, email, api_token, jira_instance):
+                self._upsert(conn, scope, issue, generation)
+                written += 1
+                if written % 500 == 0:
+                    conn.commit()
+
+            if full:
+                # Anything not seen in this rebuild has left the filter
+                removed = self._delete(conn, scope, "generation < ?", (generation,))
+            else:
+                condition, _ = split_order_by(jql)
+                if condition:
+                    # Indexed issues updated since the last sync that no longer match
+                    # the filter; asked per batch of indexed keys so Jira never has to
+                    # scan every recently updated issue on the instance.
+                    keys = [row[0] for row in conn.execute(
+                        "SELECT issue_key FROM indexed_issues WHERE jira_instance = ? AND owner = ? AND filter_id = ?",
+                        scope
+                    )]
+                    for start in range(0, len(keys), _LEFT_FILTER_BATCH):
+                        batch = format_keys(keys[start:start + _LEFT_FILTER_BATCH])
+                        left_jql = f"key in ({batch}) AND updated >= -{minutes}m AND NOT ({condition})"
+                        for issue in self._pages(left_jql, ["updated"], email, api_token, jira_instance):
+                            removed += self._delete(conn, scope, "issue_key = ?", (issue.get("key"),))
+            conn.commit()
+        finally:
+            conn.close()
+        return written, removed
+
+    def request_sync(self, filter_id, email, api_token, jira_instance):
+        """
+        Start a background sync of this filter on the index's own worker
+        thread. Returns True if a sync of the filter is running (just started
+        or already in progress), False if it was dropped because the worker
+        is busy with another filter; ask again later.
+        A failed sync is kept for pop_error instead of being retried.
+        """
+        scope = (jira_instance.strip(), email, str(filter_id))
+        with self._locks_lock:
+            if scope in self._syncing:
+                return True
+            done = self._syncing[scope] = threading.Event()
+
+        def run():
+            try:
+                # A first build may page through a large filter
+                with deadline_scope(Config.SEARCH_INDEX_SYNC_DEADLINE_SECONDS):
+                    self.sync(filter_id, email, api_token, jira_instance)
+            except IndexSyncError as e:
+                logger.warning("[INDEX] Sync of filter %s failed: %s", filter_id, e)
+                self._errors[scope] = e
+            except requests.exceptions.RequestException as e:
+                logger.error("[INDEX] Sync of filter %s failed: %s", filter_id, e)
+                self._errors[scope] = IndexSyncError("Could not index filter from Jira.")
+            finally:
+                with self._locks_lock:
+                    self._syncing.pop(scope, None)
+                done.set()
+
+        if not self._worker.submit(run):
+            with self._locks_lock:
+                self._syncing.pop(scope, None)
+            done.set()
+            return False
+        return True
+
+    def wait_for_sync(self, jira_instance, owner, filter_id, timeout):
+        """Wait up to timeout seconds for a queued sync; True if none is running anymore."""
+        with self._locks_lock:
+            done = self._syncing.get((jira_instance.strip(), owner, str(filter_id)))
+        return done is None or done.wait(timeout)
+
+    def pop_error(self, jira_instance, owner, filter_id):
+        """The error of the last failed background sync of a filter (once), or None."""
+        return self._errors.pop((jira_instance.strip(), owner, str(filter_id)), None)
+
+    def search(self, jira_instance, owner, filter_id, query, limit=20):
+        """Best matches for free text within a filter's index, best first."""
+        started = time.perf_counter()
+        scope = (jira_instance.strip(), owner, str(filter_id))
+        results = []
+        conn = self._connect()
+        try:
+            candidate = query.strip().upper()
+            if ISSUE_KEY.match(candidate):
+                row = conn.execute(
+                    "SELECT i.issue_key, t.summary, t.research_project, i.updated "
+                    "FROM indexed_issues i JOIN issue_text t ON t.rowid = i.id "
+                    "WHERE i.jira_instance = ? AND i.owner = ? AND i.filter_id = ? AND i.issue_key = ?",
+                    scope + (candidate,)
+                ).fetchone()
+                if row:
+                    results.append(_result(row, None))
+
+            expression = match_expression(query)
+            if expression:
+                rows = conn.execute(
+                    "SELECT i.issue_key, t.summary, t.research_project, i.updated, "
+                    "snippet(issue_text, -1, '[', ']', '...', 12) "
+                    "FROM issue_text t JOIN indexed_issues i ON i.id = t.rowid "
+                    "WHERE issue_text MATCH ? AND i.jira_instance = ? AND i.owner = ? AND i.filter_id = ? "
+                    f"ORDER BY {_RANK} LIMIT ?",
+                    (expression,) + scope + (int(limit),)
+                ).fetchall()
+                seen = {result["key"] for result in results}
+                results.extend(_result(row[:4], row[4]) for row in rows if row[0] not in seen)
+        finally:
+            conn.close()
+        QUERY_DURATION.observe(value=time.perf_counter() - started)
+        return results[:limit]
+
+
+def _result(row, snippet):
+    key, summary, research_project, updated = row
+    return {
+        "key": key,
+        "summary": summary,
+        "research_project": research_project or None,
+        "updated": updated,
+        "snippet": snippet
+    }
+
+
+_search_index = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """Return the process-wide search index, creating it on first use."""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = SearchIndex(Config.SEARCH_INDEX_DB)
+    return _search_index
@@ -18,7 +18,7 @@ def save_session():
         with open(Config.SESSION_FILE, "w") as f:
             json.dump(data_to_save, f)
     except Exception as e:
-        logger.error(f"Failed to save session: {e}")
+        logger.error("Failed to save session: %s", e)
 
 
 def load_session():
@@ -31,5 +31,5 @@ def load_session():
                     session.update(data)
                     logger.debug("Session loaded from disk.")
         except Exception as e:
-            logger.error(f"Failed to load session: {e}")
+            logger.error("Failed to load session: %s", e)
 
@@ -0,0 +1,102 @@
+"""
+Single-flight coalescing of identical concurrent Jira fetches.
+
+When several requests ask for the same thing at the same time (labelers
+opening the same epic, a double-fired frontend request), only the first
+caller (the leader) runs the upstream fetch; callers arriving while it is
+in flight wait for it and share its result or exception. Keys are
+(operation, instance, user, args), so results never cross users.
+
+Followers wait at most their own remaining deadline. Partial-result marks
+the leader set during the call (see deadline_service) are copied to each
+follower, so a hierarchy cut short is never cached or tagged by anyone.
+If the leader ran out of its own deadline, followers with budget left run
+the fetch again themselves.
+"""
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from app.services.deadline_service import (
+    DeadlineExceeded,
+    current_deadline,
+    deadline_expired,
+    mark_partial,
+    remaining
+)
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+SINGLE_FLIGHT_CALLS = registry.counter(
+    "single_flight_calls_total",
+    "Coalescable Jira fetches by operation and role (leader ran it, coalesced waited for it).",
+    ("op", "role")
+)
+SINGLE_FLIGHT_IN_FLIGHT = registry.gauge(
+    "single_flight_in_flight",
+    "Distinct coalescable Jira fetches currently in flight."
+)
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self):
+        self._calls = {}  # key -> Future of (result, partial reasons)
+        self._lock = threading.Lock()
+
+    def do(self, op, key, fn, *args, **kwargs):
+        """Return fn(*args, **kwargs), sharing an identical in-flight call for (op, key)."""
+        flight_key = (op,) + tuple(key)
+        while True:
+            with self._lock:
+                future = self._calls.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._calls[flight_key] = Future()
+                    SINGLE_FLIGHT_IN_FLIGHT.set(value=len(self._calls))
+
+            if leader:
+                return self._lead(op, flight_key, future, fn, args, kwargs)
+
+            SINGLE_FLIGHT_CALLS.inc(op, "coalesced")
+            try:
+                result, partial = future.result(timeout=remaining())
+            except FutureTimeout:
+                raise DeadlineExceeded(f"Request deadline exceeded waiting for in-flight {op}")
+            except DeadlineExceeded:
+                if deadline_expired():
+                    raise
+                # The leader's budget ran out, not ours: try again
+                logger.debug("[SINGLE-FLIGHT] Leader of %s ran out of time, retrying", op)
+                continue
+            for reason in partial:
+                mark_partial(reason)
+            return result
+
+    def _lead(self, op, flight_key, future, fn, args, kwargs):
+        SINGLE_FLIGHT_CALLS.inc(op, "leader")
+        deadline = current_deadline()
+        partial_before = set(deadline.partial) if deadline is not None else set()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            partial = set(deadline.partial) - partial_before if deadline is not None else set()
+            future.set_result((result, partial))
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(flight_key, None)
+                SINGLE_FLIGHT_IN_FLIGHT.set(value=len(self._calls))
+
+
+_single_flight = SingleFlight()
+
+
+def single_flight(op, key, fn, *args, **kwargs):
+    """Run fn through the process-wide single-flight group."""
+    return _single_flight.do(op, key, fn, *args, **kwargs)
@@ -0,0 +1,363 @@
+"""
+Research project suggestions from labeling history.
+
+Already-labeled issues (summary + plain-text description, labeled with
+customfield_10097) are kept in an in-memory sparse TF-IDF index per Jira
+instance: an inverted index term -> {issue: weight} with cached document
+norms. A suggestion is a nearest-neighbour vote: the SUGGEST_NEIGHBOURS
+most similar labeled issues (cosine similarity) vote for their research
+project, weighted by similarity, and the top SUGGEST_TOP_K projects are
+returned with their share of the vote.
+
+The index is built on the engine's own background thread (see
+sync_worker.py) the first time an instance is used, refreshed
+incrementally with `updated >= -<N>m` every SUGGEST_REFRESH_SECONDS, and
+learns each label written by update_issue immediately. A sync only counts
+once every page was read: a failed page fails the sync, which is tried
+again _SYNC_RETRY_SECONDS later, so an incomplete first build is never
+mistaken for a complete one.
+"""
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from app.config import Config
+from app.services.deadline_service import deadline_scope
+from app.services.jira_service import extract_plain_text_from_description, search_page
+from app.services.job_queue import submit_job
+from app.services.sync_worker import SyncWorker
+from app.services.metrics_service import registry
+from app.utils.jql import ISSUE_KEY
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_DURATION = registry.histogram(
+    "suggestion_seconds",
+    "Time to compute research project suggestions for an issue.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+)
+
+_TOKEN = re.compile(r"[^\W\d_][\w-]+", re.UNICODE)
+
+_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were will with
+not no be been can should would could we you i our your they them their there here when where which
+who what how all any if then than so do does did done also into out up down over under after before
+""".split())
+
+# Summary terms count this many times as much as description terms
+_SUMMARY_WEIGHT = 2
+
+# Only the highest-weighted query terms are looked up, to bound query time
+_MAX_QUERY_TERMS = 40
+
+# Document norms are recomputed once the corpus grew by this fraction
+_NORM_REFRESH_GROWTH = 0.1
+
+# Texts of recently viewed issues, so a label written right after can be learned without a Jira call
+_RECENT_TEXTS = 2000
+
+# After a failed sync, wait this long before syncing again
+_SYNC_RETRY_SECONDS = 30
+
+_DESCRIPTION_PLACEHOLDER = "No description available"
+
+
+class SuggestionSyncError(Exception):
+    """A page of labeled issues could not be read from Jira."""
+
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords and numbers."""
+    return [
+        token for token in _TOKEN.findall((text or "").lower())
+        if token not in _STOPWORDS
+    ]
+
+
+def term_counts(summary, description):
+    """Term frequencies of an issue's text, summary terms weighted up."""
+    counts = defaultdict(int)
+    for token in tokenize(summary):
+        counts[token] += _SUMMARY_WEIGHT
+    if description != _DESCRIPTION_PLACEHOLDER:
+        for token in tokenize(description):
+            counts[token] += 1
+    return dict(counts)
+
+
+def _tf(count):
+    return 1.0 + math.log(count)
+
+
+class SuggestionIndex:
+    """Sparse TF-IDF nearest-neighbour index over one instance's labeled issues."""
+
+    def __init__(self):
+        self._postings = defaultdict(dict)  # term -> {issue_key: tf weight}
+        self._terms = {}                    # issue_key -> {term: tf weight}
+        self._labels = {}                   # issue_key -> research project
+        self._norms = {}
+        self._norms_size = 0
+        self._lock = threading.RLock()
+        self.synced_at = None
+        self.failed_at = None
+        self.version = 0  # bumped on every change, for caching suggestions
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _idf(self, term):
+        return math.log((1 + len(self._terms)) / (1 + len(self._postings.get(term, ())))) + 1.0
+
+    def add(self, issue_key, research_project, counts):
+        """Add or replace a labeled issue."""
+        with self._lock:
+            self._remove_terms(issue_key)
+            terms = {term: _tf(count) for term, count in counts.items()}
+            self._terms[issue_key] = terms
+            self._labels[issue_key] = research_project
+            for term, weight in terms.items():
+                self._postings[term][issue_key] = weight
+            self._norms.pop(issue_key, None)
+            self.version += 1
+
+    def relabel(self, issue_key, research_project):
+        """Change the label of an indexed issue; False if it is not indexed."""
+        with self._lock:
+            if issue_key not in self._labels:
+                return False
+            self._labels[issue_key] = research_project
+            self.version += 1
+            return True
+
+    def remove(self, issue_key):
+        with self._lock:
+            self._remove_terms(issue_key)
+            if self._labels.pop(issue_key, None) is not None:
+                self.version += 1
+
+    def _remove_terms(self, issue_key):
+        for term in self._terms.pop(issue_key, {}):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(issue_key, None)
+                if not postings:
+                    del self._postings[term]
+        self._norms.pop(issue_key, None)
+
+    def _norm(self, issue_key):
+        # IDFs drift as issues are added; norms are refreshed in bulk when the corpus grew enough
+        if len(self._terms) > self._norms_size * (1 + _NORM_REFRESH_GROWTH):
+            self._norms = {}
+            self._norms_size = len(self._terms)
+        norm = self._norms.get(issue_key)
+        if norm is None:
+            norm = math.sqrt(sum(
+                (weight * self._idf(term)) ** 2 for term, weight in self._terms[issue_key].items()
+            )) or 1.0
+            self._norms[issue_key] = norm
+        return norm
+
+    def suggest(self, counts, top_k=3, neighbours=15, exclude=None):
+        """
+        Top research projects for a term-count vector:
+        [{"research_project", "score", "neighbours"}], best first.
+        """
+        with self._lock:
+            if not self._terms or not counts:
+                return []
+            query = {term: _tf(count) * self._idf(term) for term, count in counts.items() if term in self._postings}
+            if not query:
+                return []
+            query_terms = heapq.nlargest(_MAX_QUERY_TERMS, query.items(), key=lambda item: item[1])
+            query_norm = math.sqrt(sum(weight ** 2 for _, weight in query_terms))
+
+            scores = defaultdict(float)
+            for term, query_weight in query_terms:
+                idf = self._idf(term)
+                for issue_key, weight in self._postings[term].items():
+                    scores[issue_key] += query_weight * weight * idf
+            scores.pop(exclude, None)
+
+            nearest = heapq.nlargest(
+                neighbours,
+                ((score / (self._norm(key) * query_norm), key) for key, score in scores.items())
+            )
+            votes = defaultdict(float)
+            counts_by_project = defaultdict(int)
+            for similarity, key in nearest:
+                votes[self._labels[key]] += similarity
+                counts_by_project[self._labels[key]] += 1
+
+        total = sum(votes.values()) or 1.0
+        return [
+            {
+                "research_project": project,
+                "score": round(vote / total, 3),
+                "neighbours": counts_by_project[project]
+            }
+            for project, vote in heapq.nlargest(top_k, votes.items(), key=lambda item: item[1])
+        ]
+
+
+class SuggestionEngine:
+    """Suggestion indexes per Jira instance, with background sync."""
+
+    def __init__(self):
+        self._indexes = {}
+        self._syncing = set()
+        self._worker = SyncWorker("suggestion_sync")
+        # (instance, issue_key) -> (updated, term counts, index version, suggestions)
+        self._recent = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _index(self, jira_instance):
+        with self._lock:
+            index = self._indexes.get(jira_instance)
+            if index is None:
+                index = self._indexes[jira_instance] = SuggestionIndex()
+            return index
+
+    def _remember(self, jira_instance, issue_key, entry):
+        with self._lock:
+            self._recent[(jira_instance, issue_key)] = entry
+            self._recent.move_to_end((jira_instance, issue_key))
+            while len(self._recent) > _RECENT_TEXTS:
+                self._recent.popitem(last=False)
+
+    def suggest(self, issue, email, api_token, jira_instance):
+        """
+        Top-k research project suggestions for a parsed issue (as returned by
+        get_issue_hierarchy). Starts a background (re)sync when needed; returns
+        [] until the instance's index has been built.
+        """
+        started = time.perf_counter()
+        jira_instance = jira_instance.strip()
+        index = self._index(jira_instance)
+        now = time.time()
+        if (index.synced_at is None or now - index.synced_at > Config.SUGGEST_REFRESH_SECONDS) and \
+                (index.failed_at is None or now - index.failed_at > _SYNC_RETRY_SECONDS):
+            self.request_sync(email, api_token, jira_instance)
+
+        with self._lock:
+            cached = self._recent.get((jira_instance, issue["key"]))
+        if cached and cached[0] == issue.get("updated") and cached[2] == index.version:
+            # Same issue text and no new labels since: the suggestions still hold
+            return cached[3]
+
+        version = index.version
+        counts = term_counts(issue.get("name"), issue.get("description"))
+        suggestions = index.suggest(
+            counts,
+            top_k=Config.SUGGEST_TOP_K,
+            neighbours=Config.SUGGEST_NEIGHBOURS,
+            exclude=issue["key"]
+        )
+        self._remember(jira_instance, issue["key"], (issue.get("updated"), counts, version, suggestions))
+        SUGGEST_DURATION.observe(value=time.perf_counter() - started)
+        return suggestions
+
+    def learn(self, issue_key, research_project, email, api_token, jira_instance):
+        """Add a label written by update_issue to the index."""
+        jira_instance = jira_instance.strip()
+        index = self._index(jira_instance)
+        with self._lock:
+            cached = self._recent.get((jira_instance, issue_key))
+        if cached is not None:
+            index.add(issue_key, research_project, cached[1])
+        elif not index.relabel(issue_key, research_project) and ISSUE_KEY.match(issue_key):
+            # Text not seen yet: fetch it in the background
+            submit_job(
+                "suggestion_learn", self._sync_jql, f"key IN ({issue_key})",
+                email, api_token, jira_instance, 1
+            )
+
+    def request_sync(self, email, api_token, jira_instance):
+        """Start a background sync of the instance's labeled issues; False if none was started."""
+        with self._lock:
+            if jira_instance in self._syncing:
+                return False
+            self._syncing.add(jira_instance)
+        if not self._worker.submit(self._sync, email, api_token, jira_instance):
+            # Busy with another instance: the next suggest() asks again
+            with self._lock:
+                self._syncing.discard(jira_instance)
+            return False
+        return True
+
+    def _sync(self, email, api_token, jira_instance):
+        index = self._index(jira_instance)
+        started = time.time()
+        field = Config.CUSTOM_FIELD_RESEARCH_PROJECT.replace("customfield_", "cf[") + "]"
+        if index.synced_at is None:
+            jql = f"{field} is not EMPTY ORDER BY updated DESC"
+        else:
+            minutes = math.ceil((started - index.synced_at) / 60) + 2
+            jql = f"{field} is not EMPTY AND updated >= -{minutes}m ORDER BY updated DESC"
+        try:
+            # The first build may page through thousands of issues
+            with deadline_scope(Config.SUGGEST_SYNC_DEADLINE_SECONDS):
+                added = self._sync_jql(jql, email, api_token, jira_instance, Config.SUGGEST_MAX_TRAINING_ISSUES)
+        except Exception:
+            # Not marked synced: the retry (or the next sync) starts over from the same point
+            index.failed_at = time.time()
+            raise
+        else:
+            index.synced_at = started
+            index.failed_at = None
+            logger.info(
+                "[SUGGEST] %s: synced %d labeled issues in %.2fs (%d indexed)",
+                jira_instance, added, time.time() - started, len(index)
+            )
+        finally:
+            with self._lock:
+                self._syncing.discard(jira_instance)
+
+    def _sync_jql(self, jql, email, api_token, jira_instance, limit):
+        """
+        Index the labeled issues matching jql (at most limit); returns the count.
+        Raises SuggestionSyncError (or a RequestException) if a page fails.
+        """
+        index = self._index(jira_instance)
+        fields = ["summary", "description", Config.CUSTOM_FIELD_RESEARCH_PROJECT]
+        added = 0
+        token = None
+        while added < limit:
+            success, data = search_page(jql, fields, email, api_token, jira_instance, next_page_token=token)
+            if not success:
+                logger.warning("[SUGGEST] Sync query failed with %s", data["status_code"])
+                raise SuggestionSyncError(f"Labeled issue search failed with {data['status_code']}")
+            for issue in data.get("issues", []):
+                issue_fields = issue.get("fields", {})
+                project = issue_fields.get(Config.CUSTOM_FIELD_RESEARCH_PROJECT)
+                if not isinstance(project, dict) or not project.get("value"):
+                    index.remove(issue.get("key"))
+                    continue
+                counts = term_counts(
+                    issue_fields.get("summary"),
+                    extract_plain_text_from_description(issue_fields.get("description"))
+                )
+                index.add(issue["key"], project["value"], counts)
+                added += 1
+            token = data.get("nextPageToken")
+            if data.get("isLast", True) or not token:
+                break
+        return added
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_suggestion_engine():
+    """Return the process-wide suggestion engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SuggestionEngine()
+    return _engine
@@ -0,0 +1,59 @@
+"""
+Single-thread background worker for long-running index syncs.
+
+Index builds can page through a large filter for minutes, so they do not
+belong on the job queue (job_queue.py), whose few workers run short side
+effects such as adding watchers. Each SyncWorker runs at most one job at a
+time on its own daemon thread and drops work submitted while it is busy
+instead of queueing it. Callers re-request a sync whenever they next find
+their data missing or stale, so a dropped request only delays that sync.
+Jobs never run inline in the submitting request.
+"""
+import logging
+import threading
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+SYNC_JOBS = registry.counter(
+    "background_sync_jobs_total",
+    "Long-running sync jobs by worker and outcome (ok, failed, dropped).",
+    ("worker", "outcome")
+)
+
+
+class SyncWorker:
+    """Runs one job at a time on a dedicated thread; drops jobs while busy."""
+
+    def __init__(self, name):
+        self.name = name
+        self._busy = False
+        self._lock = threading.Lock()
+
+    def busy(self):
+        with self._lock:
+            return self._busy
+
+    def submit(self, fn, *args, **kwargs):
+        """Start fn(*args, **kwargs) in the background; False (dropped) if a job is running."""
+        with self._lock:
+            if self._busy:
+                SYNC_JOBS.inc(self.name, "dropped")
+                return False
+            self._busy = True
+        thread = threading.Thread(
+            target=self._run, args=(fn, args, kwargs), name=f"{self.name}-worker", daemon=True
+        )
+        thread.start()
+        return True
+
+    def _run(self, fn, args, kwargs):
+        try:
+            fn(*args, **kwargs)
+            SYNC_JOBS.inc(self.name, "ok")
+        except Exception as e:
+            SYNC_JOBS.inc(self.name, "failed")
+            logger.error("Background sync %s failed: %s", self.name, e)
+        finally:
+            with self._lock:
+                self._busy = False
@@ -0,0 +1,124 @@
+"""
+Per-request tracing of Jira calls.
+
+A RequestTrace is bound to the current context while an API request is
+served; _make_request records one span per Jira call into it. Work handed
+to thread pools must be wrapped with bind_context() so the pool threads
+record into the same trace.
+"""
+import contextvars
+import threading
+import time
+from urllib.parse import urlsplit
+
+_current_trace = contextvars.ContextVar("jira_request_trace", default=None)
+
+
+class RequestTrace:
+    """Collects Jira call spans for a single API request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def by_family(self):
+        """Aggregate spans into {family: (count, total_ms)} in first-seen order."""
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            count, total = totals.get(span["family"], (0, 0.0))
+            totals[span["family"]] = (count + 1, total + span["duration_ms"])
+        return totals
+
+    def jira_ms(self):
+        """
+        Wall time spent waiting on Jira: the union of span intervals, so calls
+        made in parallel are not counted twice (per-family totals are sums).
+        """
+        with self._lock:
+            intervals = sorted((span["start_ms"], span["start_ms"] + span["duration_ms"]) for span in self.spans)
+        total = 0.0
+        covered_until = None
+        for start, end in intervals:
+            if covered_until is None or start > covered_until:
+                total += end - start
+                covered_until = end
+            elif end > covered_until:
+                total += end - covered_until
+                covered_until = end
+        return total
+
+    def server_timing(self):
+        """Render a Server-Timing header value (one entry per endpoint family)."""
+        entries = []
+        for family, (count, total) in self.by_family().items():
+            entries.append(f'jira-{family};desc="{count} call{"s" if count != 1 else ""}";dur={total:.1f}')
+        entries.append(f"jira;dur={self.jira_ms():.1f}")
+        entries.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(entries)
+
+    def to_dict(self):
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "total_ms": round(self.elapsed_ms(), 1),
+            "jira_ms": round(self.jira_ms(), 1),
+            "jira_calls": spans
+        }
+
+
+def start_trace():
+    """Start a trace for the current request and return it."""
+    trace = RequestTrace()
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+def end_trace():
+    """Detach and return the current trace."""
+    trace = _current_trace.get()
+    _current_trace.set(None)
+    return trace
+
+
+def record_span(family, method, url, response, retries, duration):
+    """Record a finished Jira call on the active trace (no-op without one)."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    parts = urlsplit(url)
+    trace.add({
+        "start_ms": round((time.perf_counter() - duration - trace.started) * 1000, 1),
+        "call": f"{method} {parts.path}",
+        "family": family,
+        "status": response.status_code if response is not None else None,
+        "bytes": len(response.content) if response is not None else 0,
+        "duration_ms": round(duration * 1000, 1),
+        "retries": retries
+    })
+
+
+def bind_context(fn):
+    """
+    Wrap fn so it runs in a copy of the caller's context (and therefore
+    records into the caller's trace) when executed on a pool thread.
+    """
+    ctx = contextvars.copy_context()
+
+    def wrapper(*args, **kwargs):
+        return ctx.run(fn, *args, **kwargs)
+
+    return wrapper
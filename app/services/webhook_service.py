@@ -0,0 +1,194 @@
+"""
+Jira webhook handling: keeps cached Jira data fresh without polling.
+
+Supported events:
+    jira:issue_created   - remaining counts invalidated
+    jira:issue_updated   - cached issue nodes and hierarchy key lists dropped,
+                           remaining counts invalidated
+    jira:issue_deleted   - issue nodes dropped, key removed from remaining counts
+    worklog_created      - worklog aggregates of the author patched
+    worklog_updated      - worklog aggregates of the author invalidated
+    worklog_deleted      - worklog aggregates of the author patched
+
+Worklog events and deleted issues also drop the author's daily-bucket
+ledgers (see worklog_service), which are rebuilt on the next query.
+
+Remaining counts are invalidated rather than patched for created/updated
+issues because filter membership depends on JQL the backend cannot evaluate.
+Issue nodes are dropped rather than rebuilt from the payload: webhooks carry
+the v2 field representation (e.g. a plain-text description instead of ADF)
+while nodes are built from v3 responses.
+"""
+import hashlib
+import hmac
+import logging
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+from app.config import Config
+from app.services.cache_service import get_cache
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_EVENTS = registry.counter(
+    "jira_webhook_events_total",
+    "Jira webhook events received by event type and outcome.",
+    ("event", "outcome")
+)
+
+# Worklog aggregates cover the last 14 days (see get_recent_worklogs)
+WORKLOG_WINDOW_DAYS = 14
+
+
+def verify_signature(body, signature=None, token=None, secret=None):
+    """
+    Check a webhook request against the shared secret.
+    Accepts Jira's `X-Hub-Signature: sha256=<hex hmac of body>` header or,
+    for webhooks registered without signing, the secret passed as a token.
+    """
+    secret = secret if secret is not None else Config.JIRA_WEBHOOK_SECRET
+    if not secret:
+        return False
+    if signature:
+        algorithm, _, digest = signature.partition("=")
+        if algorithm.lower() != "sha256":
+            return False
+        expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, digest)
+    if token:
+        return hmac.compare_digest(secret, token)
+    return False
+
+
+def sign_payload(body, secret):
+    """Return the X-Hub-Signature header value for a request body."""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def _instance_of(resource):
+    """Jira instance host from a resource's `self` URL."""
+    self_url = (resource or {}).get("self")
+    if self_url:
+        return urlsplit(self_url).netloc
+    return Config.JIRA_INSTANCE.strip()
+
+
+def _within_window(started):
+    try:
+        started_at = datetime.fromisoformat(started.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return False
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    return started_at >= datetime.now(timezone.utc) - timedelta(days=WORKLOG_WINDOW_DAYS)
+
+
+def _on_issue_changed(cache, jira_instance, issue):
+    key = issue["key"]
+    dropped = cache.invalidate("issue", jira_instance, key)
+    # Hierarchies rooted at the issue are walked again (its links may have changed)
+    hierarchies = cache.invalidate("hierarchy_keys", jira_instance, key, "*")
+    invalidated = cache.invalidate("filter_count", jira_instance, "*")
+    return {"issues_dropped": dropped, "hierarchies_dropped": hierarchies, "counts_invalidated": invalidated}
+
+
+def _on_issue_created(cache, jira_instance, issue):
+    return {"counts_invalidated": cache.invalidate("filter_count", jira_instance, "*")}
+
+
+def _on_issue_deleted(cache, jira_instance, issue):
+    key = issue["key"]
+    dropped = cache.invalidate("issue", jira_instance, key)
+    patched = 0
+    for entry in cache.scan("filter_count", jira_instance, "*"):
+        snapshot = cache.get(entry)
+        if snapshot is None or key not in snapshot["keys"]:
+            continue
+        snapshot["keys"] = [k for k in snapshot["keys"] if k != key]
+        cache.set(entry, snapshot, ttl=Config.CACHE_COUNT_TTL)
+        patched += 1
+    # The deleted issue's worklogs no longer count for their authors
+    authors = {
+        (wl.get("author") or {}).get("accountId")
+        for wl in ((issue.get("fields") or {}).get("worklog") or {}).get("worklogs", [])
+    }
+    worklogs = sum(
+        cache.invalidate("worklogs", jira_instance, author) + cache.invalidate("worklog_ledger", jira_instance, author)
+        for author in authors if author
+    )
+    return {"issues_dropped": dropped, "counts_patched": patched, "worklogs_invalidated": worklogs}
+
+
+def _patch_worklog_aggregate(aggregate, issue_id, hours):
+    """Add hours to a cached worklog aggregate; False if the issue is not in it."""
+    for entry in aggregate["issues"]:
+        if entry.get("id") == issue_id:
+            break
+    else:
+        return False
+
+    entry["time_spent_hours"] = round(entry["time_spent_hours"] + hours, 2)
+    project = entry["research_project"]
+    aggregate["by_project"][project] = aggregate["by_project"].get(project, 0) + hours
+    if entry["time_spent_hours"] <= 0:
+        aggregate["issues"].remove(entry)
+    if aggregate["by_project"][project] <= 0:
+        del aggregate["by_project"][project]
+    return True
+
+
+def _on_worklog(cache, jira_instance, worklog, sign):
+    author = (worklog.get("author") or {}).get("accountId")
+    if not author:
+        return {}
+    patched = invalidated = 0
+    # Daily-bucket ledgers (see worklog_service) are rebuilt on the next query
+    invalidated += cache.invalidate("worklog_ledger", jira_instance, author)
+    for entry in cache.scan("worklogs", jira_instance, author):
+        aggregate = cache.get(entry)
+        if sign and aggregate is not None and not _within_window(worklog.get("started")):
+            continue
+        hours = sign * worklog.get("timeSpentSeconds", 0) / 3600
+        if sign and aggregate is not None and _patch_worklog_aggregate(aggregate, worklog.get("issueId"), hours):
+            cache.set(entry, aggregate, ttl=Config.CACHE_WORKLOG_TTL)
+            patched += 1
+        else:
+            cache.delete(entry)
+            invalidated += 1
+    return {"worklogs_patched": patched, "worklogs_invalidated": invalidated}
+
+
+def handle_event(payload):
+    """
+    Apply one Jira webhook event to the cache.
+    Returns (handled: bool, summary: dict).
+    """
+    event = payload.get("webhookEvent", "")
+    cache = get_cache()
+
+    if event.startswith("jira:issue_") and payload.get("issue", {}).get("key"):
+        issue = payload["issue"]
+        handlers = {
+            "jira:issue_created": _on_issue_created,
+            "jira:issue_updated": _on_issue_changed,
+            "jira:issue_deleted": _on_issue_deleted
+        }
+        handler = handlers.get(event)
+        if handler:
+            summary = handler(cache, _instance_of(issue), issue)
+            WEBHOOK_EVENTS.inc(event, "handled")
+            logger.debug("[WEBHOOK] %s %s: %s", event, issue["key"], summary)
+            return True, summary
+
+    if event.startswith("worklog_") and payload.get("worklog"):
+        worklog = payload["worklog"]
+        signs = {"worklog_created": 1, "worklog_updated": 0, "worklog_deleted": -1}
+        if event in signs:
+            summary = _on_worklog(cache, _instance_of(worklog), worklog, signs[event])
+            WEBHOOK_EVENTS.inc(event, "handled")
+            logger.debug("[WEBHOOK] %s for %s: %s", event, worklog.get("issueId"), summary)
+            return True, summary
+
+    WEBHOOK_EVENTS.inc(event or "unknown", "ignored")
+    logger.debug("[WEBHOOK] Ignoring event %r", event)
+    return False, {}
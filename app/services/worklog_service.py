@@ -0,0 +1,169 @@
+"""
+Worklog time windows from precomputed daily buckets.
+
+An author's worklogs are fetched once for a span of days and aggregated
+into a ledger of daily buckets keyed by (project, day), with a prefix-sum
+array per project. Any window inside the ledger's span (this week, last
+month, custom dates) is then answered without another Jira call: project
+totals cost O(1) per project (two prefix-sum lookups), daily totals for a
+heatmap O(1) per day. Issue totals for the treemap are summed from each
+issue's sparse daily entries.
+
+Days are the author's local calendar days, taken from the UTC offset of
+each worklog's `started` timestamp. Ledgers are cached per user and author
+for CACHE_WORKLOG_TTL and invalidated by worklog webhooks; a window that
+starts before the cached span or ends after it triggers one re-fetch.
+"""
+import logging
+from datetime import date, timedelta
+from app.config import Config
+from app.services.cache_service import cache_key, get_cache
+from app.services.jira_service import (
+    fetch_author_worklogs,
+    parse_worklog_started,
+    prepare_treemap_data,
+    research_project_of
+)
+
+logger = logging.getLogger(__name__)
+
+# Ledgers span at least this many days so the default view and small
+# shifts of the window are served from one fetch
+MIN_LEDGER_DAYS = 28
+
+
+def build_ledger(author_id, start, end, issues, worklogs_by_key):
+    """
+    Aggregate an author's worklogs between start and end (dates, inclusive):
+    {"author", "start", "end", "projects": {project: {"daily", "prefix"}},
+     "issues": {key: {"name", "research_project", "daily": {day index: hours}}}}
+    Day indexes count from start; keys are strings so ledgers survive JSON caches.
+    """
+    days = (end - start).days + 1
+    projects = {}
+    ledger_issues = {}
+    for issue in issues:
+        key = issue.get("key")
+        project = research_project_of(issue)
+        for worklog in worklogs_by_key.get(key, []):
+            if (worklog.get("author") or {}).get("accountId") != author_id:
+                continue
+            started = parse_worklog_started(worklog.get("started"))
+            if started is None:
+                continue
+            day = (started.date() - start).days
+            if not 0 <= day < days:
+                continue
+            hours = worklog.get("timeSpentSeconds", 0) / 3600
+            daily = projects.setdefault(project, {"daily": [0.0] * days})["daily"]
+            daily[day] += hours
+            entry = ledger_issues.setdefault(key, {
+                "name": issue.get("fields", {}).get("summary", "No Title"),
+                "research_project": project,
+                "daily": {}
+            })
+            entry["daily"][str(day)] = entry["daily"].get(str(day), 0.0) + hours
+
+    for buckets in projects.values():
+        prefix = [0.0]
+        for hours in buckets["daily"]:
+            prefix.append(prefix[-1] + hours)
+        buckets["prefix"] = prefix
+
+    return {
+        "author": author_id,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "projects": projects,
+        "issues": ledger_issues
+    }
+
+
+def covers(ledger, start, end):
+    return date.fromisoformat(ledger["start"]) <= start and end <= date.fromisoformat(ledger["end"])
+
+
+def get_ledger(author_id, start, end, email, api_token, jira_instance, today=None):
+    """
+    Ledger of author_id's worklogs covering start..end, from the cache or
+    fetched from Jira. If Jira cannot be queried, a stale ledger is served
+    only if it covers the window; otherwise returns None.
+    """
+    jira_instance = jira_instance.strip()
+    today = today or date.today()
+    key = cache_key("worklog_ledger", jira_instance, email, author_id)
+    ledger = get_cache().get(key)
+    if ledger is not None and covers(ledger, start, min(end, today)):
+        return ledger
+
+    # Fetch at least MIN_LEDGER_DAYS, and never less than the cached span
+    fetch_start = min(start, today - timedelta(days=MIN_LEDGER_DAYS - 1))
+    if ledger is not None:
+        fetch_start = min(fetch_start, date.fromisoformat(ledger["start"]))
+    fetch_end = max(end, today)
+
+    fetched = fetch_author_worklogs(author_id, fetch_start.isoformat(), email, api_token, jira_instance)
+    if fetched is None:
+        stale = get_cache().get_stale(key)
+        if stale is not None and covers(stale, start, min(end, today)):
+            return stale
+        # Days outside the stale span would be reported as 0 hours
+        logger.warning("[WORKLOGS] Jira unavailable and no cached ledger covers %s..%s", start, end)
+        return None
+    ledger = build_ledger(author_id, fetch_start, fetch_end, *fetched)
+    get_cache().set(key, ledger, ttl=Config.CACHE_WORKLOG_TTL)
+    logger.info(
+        "[WORKLOGS] Ledger for %s: %s..%s, %d projects, %d issues",
+        author_id, ledger["start"], ledger["end"], len(ledger["projects"]), len(ledger["issues"])
+    )
+    return ledger
+
+
+def summarize(ledger, start, end, top_n=None, layout=None):
+    """
+    Totals for start..end (inclusive) from a ledger covering that window:
+    hours per project, per day (heatmap) and the bounded issue treemap.
+    """
+    ledger_start = date.fromisoformat(ledger["start"])
+    first = (start - ledger_start).days
+    last = (end - ledger_start).days
+
+    by_project = {}
+    for project, buckets in ledger["projects"].items():
+        prefix = buckets["prefix"]
+        hours = prefix[min(last + 1, len(prefix) - 1)] - prefix[max(first, 0)]
+        if hours > 0:
+            by_project[project] = hours
+
+    daily = []
+    for day in range(first, last + 1):
+        hours_by_project = {
+            project: buckets["daily"][day]
+            for project, buckets in ledger["projects"].items()
+            if 0 <= day < len(buckets["daily"]) and buckets["daily"][day] > 0
+        }
+        daily.append({
+            "date": (ledger_start + timedelta(days=day)).isoformat(),
+            "hours": round(sum(hours_by_project.values()), 2),
+            "by_project": {project: round(hours, 2) for project, hours in hours_by_project.items()}
+        })
+
+    issues = []
+    for key, entry in ledger["issues"].items():
+        hours = sum(value for day, value in entry["daily"].items() if first <= int(day) <= last)
+        if hours > 0:
+            issues.append({
+                "key": key,
+                "name": entry["name"],
+                "research_project": entry["research_project"],
+                "time_spent_hours": round(hours, 2)
+            })
+
+    return {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "total_hours": round(sum(by_project.values()), 2),
+        "by_project": {project: round(hours, 2) for project, hours in by_project.items()},
+        "daily": daily,
+        "treemap_data": prepare_treemap_data(issues, by_project, top_n=top_n, layout=layout)
+    }
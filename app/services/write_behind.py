@@ -0,0 +1,278 @@
+"""
+Write-behind buffer for issue updates.
+
+Updates are accepted immediately and stored in a durable SQLite journal.
+Repeated writes to the same issue coalesce into one journal row (the latest
+values win); a background thread flushes rows to Jira once they have been
+quiet for the coalescing window. Each row carries a status (pending,
+committed, failed) the UI can poll.
+
+API tokens are never written to disk (same policy as session_service), so
+credentials are kept in memory only. Journal rows that survive a restart
+are flushed as soon as their user logs in or makes the next update.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from app.config import Config
+from app.services.jira_service import update_issue
+from app.services.metrics_service import registry
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_FLUSHES = registry.counter(
+    "write_behind_flushes_total",
+    "Write-behind flush outcomes (committed, superseded, retry, failed).",
+    ("outcome",)
+)
+WRITE_BEHIND_COALESCED = registry.counter(
+    "write_behind_coalesced_total",
+    "Updates merged into an already pending journal entry."
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_updates (
+    jira_instance TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    user TEXT NOT NULL,
+    research_project TEXT NOT NULL,
+    chargeable TEXT,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    committed_at REAL,
+    PRIMARY KEY (jira_instance, issue_key)
+);
+CREATE INDEX IF NOT EXISTS idx_pending_status ON pending_updates (status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_pending_user ON pending_updates (user, status);
+"""
+
+PENDING = "pending"
+COMMITTED = "committed"
+FAILED = "failed"
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds") if ts else None
+
+
+class WriteBehindBuffer:
+    """Durable, coalescing write-behind journal with a background flusher."""
+
+    def __init__(self, db_path, coalesce_window=5.0, flush_interval=1.0, max_attempts=5,
+                 retention=86400):
+        self.db_path = db_path
+        self.coalesce_window = coalesce_window
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.retention = retention
+        self._credentials = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def register_credentials(self, jira_instance, email, api_token):
+        """Make credentials available to the flusher (memory only)."""
+        with self._lock:
+            self._credentials[(jira_instance, email)] = api_token
+        self._wakeup.set()
+
+    def accept(self, jira_instance, issue_key, user, research_project, chargeable):
+        """Journal an update; coalesces with a pending write to the same issue."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM pending_updates WHERE jira_instance = ? AND issue_key = ?",
+                (jira_instance, issue_key)
+            ).fetchone()
+            if row is not None and row["status"] == PENDING:
+                WRITE_BEHIND_COALESCED.inc()
+            self._conn.execute(
+                """
+                INSERT INTO pending_updates (
+                    jira_instance, issue_key, user, research_project, chargeable,
+                    status, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (jira_instance, issue_key) DO UPDATE SET
+                    user = excluded.user,
+                    research_project = excluded.research_project,
+                    chargeable = excluded.chargeable,
+                    status = excluded.status,
+                    version = pending_updates.version + 1,
+                    attempts = 0,
+                    last_error = NULL,
+                    updated_at = excluded.updated_at,
+                    next_attempt_at = 0,
+                    committed_at = NULL
+                """,
+                (jira_instance, issue_key, user, research_project, chargeable or None,
+                 PENDING, now, now)
+            )
+            self._conn.commit()
+        return PENDING
+
+    def cancel(self, jira_instance, issue_key):
+        """Drop a pending write (e.g. superseded by a synchronous update)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pending_updates WHERE jira_instance = ? AND issue_key = ? AND status = ?",
+                (jira_instance, issue_key, PENDING)
+            )
+            self._conn.commit()
+
+    def pending_keys(self, jira_instance, user):
+        """Issue keys this user has written that are not committed yet."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT issue_key FROM pending_updates WHERE jira_instance = ? AND user = ? AND status = ?",
+                (jira_instance, user, PENDING)
+            ).fetchall()
+        return [row["issue_key"] for row in rows]
+
+    def status(self, jira_instance, issue_keys=None, user=None):
+        """Return {issue_key: status dict} for the given keys or the user's recent writes."""
+        query = (
+            "SELECT issue_key, user, research_project, chargeable, status, attempts, "
+            "last_error, updated_at, committed_at FROM pending_updates WHERE jira_instance = ?"
+        )
+        params = [jira_instance]
+        if issue_keys:
+            query += f" AND issue_key IN ({', '.join('?' for _ in issue_keys)})"
+            params.extend(issue_keys)
+        if user:
+            query += " AND user = ?"
+            params.append(user)
+        query += " ORDER BY updated_at DESC LIMIT 500"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return {
+            row["issue_key"]: {
+                "status": row["status"],
+                "research_project": row["research_project"],
+                "chargeable": row["chargeable"],
+                "attempts": row["attempts"],
+                "last_error": row["last_error"],
+                "updated_at": _iso(row["updated_at"]),
+                "committed_at": _iso(row["committed_at"])
+            }
+            for row in rows
+        }
+
+    def flush_now(self):
+        """Flush all pending rows that have credentials, ignoring the coalescing window."""
+        self._flush(time.time() + self.coalesce_window)
+
+    def _due_rows(self, now):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT * FROM pending_updates WHERE status = ? AND updated_at <= ? "
+                "AND next_attempt_at <= ? ORDER BY updated_at LIMIT 100",
+                (PENDING, now - self.coalesce_window, now)
+            ).fetchall()
+
+    def _flush(self, now):
+        for row in self._due_rows(now):
+            with self._lock:
+                api_token = self._credentials.get((row["jira_instance"], row["user"]))
+            if api_token is None:
+                # Restarted without credentials; wait for the user to come back
+                continue
+
+            success, response_data = update_issue(
+                row["issue_key"], row["research_project"], row["chargeable"],
+                row["user"], api_token, row["jira_instance"]
+            )
+            self._record_result(row, success, response_data)
+
+    def _record_result(self, row, success, response_data):
+        key = (row["jira_instance"], row["issue_key"], row["version"])
+        now = time.time()
+        with self._lock:
+            if success:
+                cursor = self._conn.execute(
+                    "UPDATE pending_updates SET status = ?, committed_at = ?, last_error = NULL "
+                    "WHERE jira_instance = ? AND issue_key = ? AND version = ?",
+                    (COMMITTED, now) + key
+                )
+                outcome = "committed" if cursor.rowcount else "superseded"
+            else:
+                status_code = response_data.get("status_code", 500)
+                attempts = row["attempts"] + 1
+                permanent = 400 <= status_code < 500 and status_code != 429
+                if permanent or attempts >= self.max_attempts:
+                    outcome = "failed"
+                    status = FAILED
+                else:
+                    outcome = "retry"
+                    status = PENDING
+                self._conn.execute(
+                    "UPDATE pending_updates SET status = ?, attempts = ?, last_error = ?, "
+                    "next_attempt_at = ? WHERE jira_instance = ? AND issue_key = ? AND version = ?",
+                    (status, attempts, str(response_data.get("jira_response") or response_data.get("message")),
+                     now + min(300, 2 ** attempts)) + key
+                )
+            self._conn.commit()
+        WRITE_BEHIND_FLUSHES.inc(outcome)
+        if outcome == "failed":
+            logger.error("Write-behind update of %s failed: %s", row["issue_key"], response_data)
+
+    def _prune(self, now):
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM pending_updates WHERE status = ? AND committed_at < ?",
+                (COMMITTED, now - self.retention)
+            )
+            self._conn.commit()
+
+    def _run(self):
+        last_prune = 0.0
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            now = time.time()
+            try:
+                self._flush(now)
+                if now - last_prune > 3600:
+                    self._prune(now)
+                    last_prune = now
+            except Exception as e:
+                logger.error("Write-behind flush failed: %s", e)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_write_buffer():
+    """Return the process-wide write-behind buffer, creating it on first use."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = WriteBehindBuffer(
+                    Config.WRITE_BEHIND_DB,
+                    coalesce_window=Config.WRITE_BEHIND_COALESCE_SECONDS,
+                    max_attempts=Config.WRITE_BEHIND_MAX_ATTEMPTS
+                )
+    return _buffer
+
+
+def write_buffer_active():
+    """True if write-behind is enabled or a journal from a previous run exists."""
+    return _buffer is not None or Config.WRITE_BEHIND_ENABLED or os.path.exists(Config.WRITE_BEHIND_DB)
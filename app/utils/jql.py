@@ -0,0 +1,92 @@
+"""
+Small JQL builder for wrapping saved filter queries.
+
+A saved filter's JQL is treated as an opaque condition: it is wrapped in
+parentheses before extra clauses are appended, and its ORDER BY clause (if
+any) is split off first and re-attached at the end, extended with `key` as
+a tie-breaker so paging and "next issue" lookups are deterministic.
+Issue keys are validated before they are inlined.
+"""
+import re
+
+ISSUE_KEY = re.compile(r"^[A-Za-z][A-Za-z0-9_]*-\d+$")
+
+# Keep generated queries well below Jira's URL/JQL length limits
+MAX_KEYS_PER_CLAUSE = 500
+
+_ORDER_BY = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+
+def _unquoted_spans(jql):
+    """Yield (start, end) ranges of jql that are outside string literals."""
+    start = 0
+    quote = None
+    i = 0
+    while i < len(jql):
+        char = jql[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+                start = i + 1
+        elif char in ("'", '"'):
+            yield start, i
+            quote = char
+        i += 1
+    if not quote:
+        yield start, len(jql)
+
+
+def split_order_by(jql):
+    """
+    Split JQL into (condition, order_by). order_by is the text after the
+    last top-level ORDER BY keyword (without the keyword), or "".
+    """
+    jql = (jql or "").strip()
+    position = None
+    for start, end in _unquoted_spans(jql):
+        for match in _ORDER_BY.finditer(jql, start, end):
+            position = match
+    if position is None:
+        return jql, ""
+    return jql[:position.start()].strip(), jql[position.end():].strip()
+
+
+def format_keys(keys):
+    """Render validated issue keys as a JQL list body: `A-1, B-2`."""
+    keys = [key.strip().upper() for key in keys]
+    for key in keys:
+        if not ISSUE_KEY.match(key):
+            raise ValueError(f"Invalid issue key: {key!r}")
+    return ", ".join(keys)
+
+
+def _with_key_tiebreak(order_by):
+    fields = [part.split()[0].strip('"').lower() for part in order_by.split(",") if part.strip()]
+    if "key" in fields or "issuekey" in fields:
+        return order_by
+    return f"{order_by}, key ASC"
+
+
+def build_filter_jql(filter_jql, exclude_keys=(), default_order_by="key ASC", extra_clauses=()):
+    """
+    Wrap a saved filter's JQL: `(<filter condition>) AND <extra clauses>
+    AND key NOT IN (...) ORDER BY <filter order or default>, key ASC`.
+
+    Only the most recent MAX_KEYS_PER_CLAUSE exclusions are kept (callers
+    pass the most relevant keys last). Extra clauses are trusted JQL.
+    """
+    condition, order_by = split_order_by(filter_jql)
+    clauses = [f"({condition})"] if condition else []
+    clauses.extend(extra_clauses)
+
+    excluded = list(dict.fromkeys(exclude_keys or ()))[-MAX_KEYS_PER_CLAUSE:]
+    if excluded:
+        clauses.append(f"key NOT IN ({format_keys(excluded)})")
+
+    jql = " AND ".join(clauses)
+    order_by = _with_key_tiebreak(order_by) if order_by else default_order_by
+    if order_by:
+        jql = f"{jql} ORDER BY {order_by}" if jql else f"ORDER BY {order_by}"
+    return jql
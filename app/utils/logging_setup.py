@@ -0,0 +1,80 @@
+"""
+Non-blocking logging setup.
+
+Request threads only push records onto an in-memory queue; a background
+listener thread formats them and writes to a size-rotated log file.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_listener = None
+
+
+def parse_logger_levels(spec):
+    """
+    Parse a per-logger level spec such as
+    "app.services.jira_service=DEBUG,urllib3=WARNING" into a dict.
+    """
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if not sep or not name.strip() or not level.strip():
+            continue
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(config):
+    """Route all logging through a queue to a rotating file handler."""
+    global _listener
+
+    if _listener is not None:
+        # create_app() may be called more than once (e.g. tests, reloader)
+        _listener.stop()
+        _listener = None
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(
+            config.LOG_FILE,
+            maxBytes=config.LOG_MAX_BYTES,
+            backupCount=config.LOG_BACKUP_COUNT
+        )
+    except OSError:
+        # Log directory not available (e.g. outside Docker), fall back to stderr
+        file_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(config.LOG_LEVEL.upper())
+
+    for name, level in parse_logger_levels(config.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
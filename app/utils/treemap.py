@@ -0,0 +1,64 @@
+"""
+Squarified treemap layout (Bruls, Huizing and van Wijk).
+
+Rectangles are laid out row by row along the shorter side of the remaining
+area, and a value joins the current row only while that does not make the
+row's worst aspect ratio worse. Values must be sorted in descending order.
+"""
+
+
+def _worst(row_sum, row_max, row_min, length):
+    """Worst aspect ratio of a row of areas laid along a side of the given length."""
+    side = length * length
+    total = row_sum * row_sum
+    return max(side * row_max / total, total / (side * row_min))
+
+
+def squarify(values, x, y, width, height):
+    """
+    Lay out values (descending) in the rectangle (x, y, width, height).
+    Returns one (x, y, width, height) tuple per value, in input order.
+    Non-positive values get empty rectangles.
+    """
+    rects = [(x, y, 0.0, 0.0)] * len(values)
+    total = sum(value for value in values if value > 0)
+    if total <= 0 or width <= 0 or height <= 0:
+        return rects
+    scale = width * height / total
+    areas = [(index, value * scale) for index, value in enumerate(values) if value > 0]
+
+    start = 0
+    while start < len(areas):
+        length = min(width, height)
+        end = start + 1
+        row_sum = row_max = row_min = areas[start][1]
+        while end < len(areas):
+            area = areas[end][1]
+            if _worst(row_sum + area, max(row_max, area), min(row_min, area), length) > \
+                    _worst(row_sum, row_max, row_min, length):
+                break
+            row_sum += area
+            row_max = max(row_max, area)
+            row_min = min(row_min, area)
+            end += 1
+
+        if width >= height:
+            # Column along the left edge
+            column_width = row_sum / height
+            offset = y
+            for index, area in areas[start:end]:
+                rects[index] = (x, offset, column_width, area / column_width)
+                offset += area / column_width
+            x += column_width
+            width -= column_width
+        else:
+            # Row along the top edge
+            row_height = row_sum / width
+            offset = x
+            for index, area in areas[start:end]:
+                rects[index] = (offset, y, area / row_height, row_height)
+                offset += area / row_height
+            y += row_height
+            height -= row_height
+        start = end
+    return rects
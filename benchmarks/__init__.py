@@ -0,0 +1 @@
+"""Benchmarks and load tests against a local fake Jira server."""
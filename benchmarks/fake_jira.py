@@ -0,0 +1,492 @@
+"""
+Local fake Jira server for benchmarks and load tests.
+
+Serves synthetic (or recorded) payloads for the Jira REST endpoints the
+backend uses, with configurable latency and 429 injection, and counts
+every call per endpoint family so upstream amplification can be measured.
+Changes made through the fake (PUTs, add_worklog, delete_issue) are
+recorded as Jira webhook payloads for benchmarks/webhook_replayer.py.
+
+Run standalone:
+    python -m benchmarks.fake_jira --port 8089 --latency-ms 20
+
+and point the backend at it with JIRA_SCHEME=http JIRA_INSTANCE=127.0.0.1:8089.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+RESEARCH_PROJECT_FIELD = "customfield_10097"
+CHARGEABLE_FIELD = "customfield_10384"
+
+QUEUE_PROJECT = "LAB"
+HIERARCHY_SIZES = (1, 30, 300)
+RESEARCH_PROJECTS = ("Atlas", "Borealis", "Cygnus", "Draco", "Eridanus")
+ACCOUNT_IDS = tuple(f"bench-user-{i}" for i in range(5))
+CHARGEABLE_OPTIONS = (("10396", "Yes"), ("10397", "No"))
+
+_WORDS = (
+    "network monitoring alarm topology inventory discovery report dashboard "
+    "performance latency threshold backup restore upgrade migration license "
+    "customer ticket integration api export import sensor snmp syslog netflow "
+    "cloud kubernetes container database index query cache release patch "
+    "security certificate firewall vpn router switch interface bandwidth"
+).split()
+
+_ISSUE_PATH = re.compile(r"^/rest/api/3/issue/([^/]+)$")
+_WORKLOG_PATH = re.compile(r"^/rest/api/3/issue/([^/]+)/worklog$")
+_WATCHERS_PATH = re.compile(r"^/rest/api/3/issue/([^/]+)/watchers$")
+_FILTER_PATH = re.compile(r"^/rest/api/3/filter/([^/]+)$")
+_FIELD_CONTEXT_PATH = re.compile(r"^/rest/api/3/field/([^/]+)/context(?:/([^/]+)/option)?$")
+_EDITMETA_PATH = re.compile(r"^/rest/api/3/issue/([^/]+)/editmeta$")
+_KEY_NOT_IN = re.compile(r"\bkey\s+NOT\s+IN\s*\(([^)]*)\)", re.IGNORECASE)
+_KEY_IN = re.compile(r"\bkey\s+IN\s*\(([^)]*)\)", re.IGNORECASE)
+_WORKLOG_AUTHOR = re.compile(r"\bworklogAuthor\s*=\s*\"?([\w:-]+)\"?", re.IGNORECASE)
+_UPDATED_SINCE = re.compile(r"\bupdated\s*>=\s*-(\d+)m\b", re.IGNORECASE)
+_NOT_GROUP = re.compile(r"\bNOT\s*\(", re.IGNORECASE)
+
+
+def _split_keys(text):
+    return [k.strip().strip('"').strip("'") for k in text.split(",") if k.strip()]
+
+
+def _adf(text):
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    }
+
+
+class FakeJira:
+    """In-memory issue store plus request accounting."""
+
+    def __init__(self, queue_size=2000, labeled_size=500, latency_ms=0.0, jitter_ms=0.0,
+                 rate_limit_ratio=0.0, retry_after=0, fixtures_dir=None, seed=42):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = {}
+        self.issues = {}
+        self.filters = {}
+        self.events = []
+        self.base_url = "http://127.0.0.1"
+        self._now = datetime.now(timezone.utc)
+        self._build_dataset(queue_size, labeled_size)
+        if fixtures_dir:
+            self.load_fixtures(fixtures_dir)
+
+    # -- dataset -----------------------------------------------------------
+
+    def _text(self, words):
+        return " ".join(self._rng.choice(_WORDS) for _ in range(words))
+
+    def _worklogs(self, assignee):
+        worklogs = []
+        for i in range(self._rng.randint(1, 3)):
+            started = self._now - timedelta(days=self._rng.randint(0, 20), hours=i)
+            worklogs.append({
+                "id": str(self._rng.randint(1, 10 ** 9)),
+                "author": {"accountId": assignee},
+                "started": started.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                "timeSpentSeconds": self._rng.choice((900, 1800, 3600, 7200))
+            })
+        return worklogs
+
+    def _make_issue(self, key, research_project=None, links=(), parent=None):
+        assignee = self._rng.choice(ACCOUNT_IDS)
+        fields = {
+            "summary": self._text(6),
+            "description": _adf(self._text(40)),
+            "assignee": {"accountId": assignee, "displayName": assignee.replace("-", " ").title()},
+            "worklog": {"worklogs": self._worklogs(assignee)},
+            "updated": (self._now - timedelta(minutes=self._rng.randint(0, 10000))).strftime(
+                "%Y-%m-%dT%H:%M:%S.000+0000"
+            ),
+            RESEARCH_PROJECT_FIELD: {"value": research_project} if research_project else None,
+            "issuelinks": list(links)
+        }
+        if parent:
+            fields["parent"] = {"key": parent}
+        return {"id": str(len(self.issues) + 10000), "key": key, "fields": fields}
+
+    def _build_dataset(self, queue_size, labeled_size):
+        for i in range(1, queue_size + 1):
+            key = f"{QUEUE_PROJECT}-{i}"
+            self.issues[key] = self._make_issue(key)
+        for i in range(queue_size + 1, queue_size + labeled_size + 1):
+            key = f"{QUEUE_PROJECT}-{i}"
+            self.issues[key] = self._make_issue(key, research_project=self._rng.choice(RESEARCH_PROJECTS))
+
+        # Hierarchies: H<size>-1 is the root; node i links to children 2i and 2i+1
+        for size in HIERARCHY_SIZES:
+            prefix = f"H{size}"
+            for i in range(1, size + 1):
+                links = []
+                for child in (2 * i, 2 * i + 1):
+                    if child <= size:
+                        links.append({
+                            "type": {"name": "Relates", "inward": "relates to", "outward": "relates to"},
+                            "outwardIssue": {"key": f"{prefix}-{child}"}
+                        })
+                parent = f"{prefix}-{i // 2}" if i > 1 else None
+                key = f"{prefix}-{i}"
+                self.issues[key] = self._make_issue(key, links=links, parent=parent)
+
+        self.filters["10456"] = f'project = {QUEUE_PROJECT} AND "Research Project[Select List (cascading)]" is EMPTY'
+        self.filters["10457"] = f'project = {QUEUE_PROJECT} AND "Research Project[Select List (cascading)]" is not EMPTY'
+
+    def load_fixtures(self, fixtures_dir):
+        """Load recorded issue payloads (<KEY>.json) and filters (filters.json)."""
+        for name in os.listdir(fixtures_dir):
+            path = os.path.join(fixtures_dir, name)
+            if name == "filters.json":
+                with open(path) as f:
+                    self.filters.update(json.load(f))
+            elif name.endswith(".json"):
+                with open(path) as f:
+                    issue = json.load(f)
+                self.issues[issue["key"]] = issue
+
+    # -- accounting --------------------------------------------------------
+
+    def count(self, family):
+        with self._lock:
+            self.calls[family] = self.calls.get(family, 0) + 1
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls = {}
+
+    def snapshot_counts(self):
+        with self._lock:
+            return dict(self.calls)
+
+    def should_rate_limit(self):
+        return self.rate_limit_ratio and self._rng.random() < self.rate_limit_ratio
+
+    def delay(self):
+        if self.latency_ms or self.jitter_ms:
+            time.sleep(max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+
+    # -- queries -----------------------------------------------------------
+
+    def search(self, jql, max_results=50, fields=None, next_page_token=None):
+        """
+        Very small JQL subset: key IN/NOT IN, worklogAuthor, labeled/unlabeled
+        queue (inverted by a NOT (...) group, also applied within key IN) and
+        `updated >= -Nm`.
+        """
+        jql = jql or ""
+        key_in = _KEY_IN.search(_KEY_NOT_IN.sub("", jql))
+        want_labeled = ("is not empty" in jql.lower()) != bool(_NOT_GROUP.search(jql))
+        if key_in:
+            keys = [k for k in _split_keys(key_in.group(1)) if k in self.issues]
+            if "research project" in jql.lower():
+                keys = [k for k in keys if bool(self.issues[k]["fields"].get(RESEARCH_PROJECT_FIELD)) == want_labeled]
+        elif _WORKLOG_AUTHOR.search(jql):
+            author = _WORKLOG_AUTHOR.search(jql).group(1)
+            keys = [
+                key for key, issue in self.issues.items()
+                if any(wl["author"]["accountId"] == author for wl in issue["fields"]["worklog"]["worklogs"])
+            ]
+        else:
+            keys = [
+                key for key, issue in self.issues.items()
+                if key.startswith(QUEUE_PROJECT + "-")
+                and bool(issue["fields"].get(RESEARCH_PROJECT_FIELD)) == want_labeled
+            ]
+
+        excluded = set()
+        for match in _KEY_NOT_IN.finditer(jql):
+            excluded.update(_split_keys(match.group(1)))
+        if excluded:
+            keys = [k for k in keys if k not in excluded]
+        since = _UPDATED_SINCE.search(jql)
+        if since:
+            cutoff = (datetime.now(timezone.utc) - timedelta(minutes=int(since.group(1)))).strftime(
+                "%Y-%m-%dT%H:%M:%S.000+0000"
+            )
+            keys = [k for k in keys if (self.issues[k]["fields"].get("updated") or "") >= cutoff]
+
+        start = int(next_page_token or 0)
+        page = keys[start:start + max_results]
+        is_last = start + max_results >= len(keys)
+        result = {
+            "issues": [self._project(self.issues[key], fields) for key in page],
+            "isLast": is_last
+        }
+        if not is_last:
+            result["nextPageToken"] = str(start + max_results)
+        return result
+
+    @staticmethod
+    def _project(issue, fields):
+        if not fields or "*all" in fields:
+            return issue
+        return {
+            "id": issue["id"],
+            "key": issue["key"],
+            "fields": {f: issue["fields"].get(f) for f in fields if f != "key"}
+        }
+
+    def field_options(self, field_id):
+        if field_id == RESEARCH_PROJECT_FIELD:
+            return [{"id": str(10500 + i), "value": name, "disabled": False}
+                    for i, name in enumerate(RESEARCH_PROJECTS)]
+        if field_id == CHARGEABLE_FIELD:
+            return [{"id": option_id, "value": value, "disabled": False} for option_id, value in CHARGEABLE_OPTIONS]
+        return None
+
+    def field_metadata(self, path):
+        """Field contexts/options, or edit metadata (status, payload)."""
+        editmeta = _EDITMETA_PATH.match(path)
+        if editmeta:
+            if editmeta.group(1) not in self.issues:
+                return 404, {"errorMessages": ["Issue does not exist"]}
+            return 200, {"fields": {
+                field_id: {"allowedValues": self.field_options(field_id)}
+                for field_id in (RESEARCH_PROJECT_FIELD, CHARGEABLE_FIELD)
+            }}
+        field_id, context_id = _FIELD_CONTEXT_PATH.match(path).groups()
+        options = self.field_options(field_id)
+        if options is None:
+            return 404, {"errorMessages": ["Field not found"]}
+        if context_id is None:
+            return 200, {"values": [{"id": "10001", "name": "Default context"}], "isLast": True}
+        return 200, {"values": options, "isLast": True}
+
+    def update(self, key, body):
+        issue = self.issues.get(key)
+        if issue is None:
+            return False
+        issue["fields"].update(body.get("fields", {}))
+        issue["fields"]["updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        self._emit("jira:issue_updated", issue=issue)
+        return True
+
+    def add_worklog(self, key, account_id, seconds, started=None):
+        """Log work on an issue (as another Jira client would) and record the event."""
+        issue = self.issues[key]
+        worklog = {
+            "id": str(self._rng.randint(1, 10 ** 9)),
+            "issueId": issue["id"],
+            "author": {"accountId": account_id},
+            "started": (started or datetime.now(timezone.utc)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            "timeSpentSeconds": seconds
+        }
+        issue["fields"]["worklog"]["worklogs"].append(worklog)
+        issue["fields"]["updated"] = worklog["started"]
+        self._emit("worklog_created", worklog=worklog)
+        return worklog
+
+    def delete_issue(self, key):
+        issue = self.issues.pop(key)
+        self._emit("jira:issue_deleted", issue=issue)
+
+    # -- webhooks ----------------------------------------------------------
+
+    def _emit(self, event, issue=None, worklog=None):
+        payload = {"timestamp": int(time.time() * 1000), "webhookEvent": event}
+        if issue is not None:
+            payload["issue"] = dict(issue, self=f"{self.base_url}/rest/api/3/issue/{issue['id']}")
+        if worklog is not None:
+            payload["worklog"] = dict(
+                worklog, self=f"{self.base_url}/rest/api/3/issue/{worklog['issueId']}/worklog/{worklog['id']}"
+            )
+        with self._lock:
+            self.events.append(json.loads(json.dumps(payload)))
+
+    def drain_events(self):
+        """Return and clear the recorded webhook payloads."""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under fan-out and adds
+    # 1 s SYN retransmits to the measurements.
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # Clients that gave up (deadline, timeout) close the socket mid-response
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeJira/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def jira(self):
+        return self.server.jira
+
+    def _send(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"null") if length else None
+
+    def _route(self, method):
+        parts = urlsplit(self.path)
+        path = parts.path
+        query = parse_qs(parts.query)
+        body = self._body() if method in ("POST", "PUT") else None
+
+        if path == "/_stats":
+            return self._send(200, self.jira.snapshot_counts())
+        if path == "/_reset":
+            self.jira.reset_counts()
+            return self._send(204)
+        if path == "/_events":
+            return self._send(200, self.jira.drain_events())
+
+        family = "other"
+        if _FILTER_PATH.match(path):
+            family = "filter"
+        elif path.startswith("/rest/api/3/search"):
+            family = "search"
+        elif _WORKLOG_PATH.match(path):
+            family = "worklog"
+        elif _WATCHERS_PATH.match(path):
+            family = "watchers"
+        elif _ISSUE_PATH.match(path):
+            family = "issue"
+        elif path == "/rest/api/3/myself":
+            family = "myself"
+        elif _FIELD_CONTEXT_PATH.match(path) or _EDITMETA_PATH.match(path):
+            family = "field"
+        self.jira.count(family)
+
+        self.jira.delay()
+        if self.jira.should_rate_limit():
+            return self._send(429, {"errorMessages": ["Rate limit exceeded"]},
+                              {"Retry-After": str(self.jira.retry_after)})
+
+        if family == "filter":
+            filter_id = _FILTER_PATH.match(path).group(1)
+            jql = self.jira.filters.get(filter_id)
+            if jql is None:
+                return self._send(404, {"errorMessages": ["Filter not found"]})
+            return self._send(200, {"id": filter_id, "jql": jql})
+
+        if family == "search" and method == "POST":
+            body = body or {}
+            return self._send(200, self.jira.search(
+                body.get("jql"),
+                max_results=int(body.get("maxResults", 50)),
+                fields=body.get("fields"),
+                next_page_token=body.get("nextPageToken")
+            ))
+
+        if family == "worklog":
+            issue = self.jira.issues.get(_WORKLOG_PATH.match(path).group(1))
+            if issue is None:
+                return self._send(404, {"errorMessages": ["Issue does not exist"]})
+            worklogs = issue["fields"]["worklog"]["worklogs"]
+            return self._send(200, {"startAt": 0, "maxResults": len(worklogs),
+                                    "total": len(worklogs), "worklogs": worklogs})
+
+        if family == "watchers":
+            return self._send(204)
+
+        if family == "field":
+            return self._send(*self.jira.field_metadata(path))
+
+        if family == "myself":
+            return self._send(200, {"accountId": ACCOUNT_IDS[0], "displayName": "Bench User",
+                                    "emailAddress": "bench@example.com", "timeZone": "Europe/Berlin"})
+
+        if family == "issue":
+            key = _ISSUE_PATH.match(path).group(1)
+            if method == "PUT":
+                return self._send(204) if self.jira.update(key, body or {}) else self._send(
+                    404, {"errorMessages": ["Issue does not exist"]})
+            issue = self.jira.issues.get(key)
+            if issue is None:
+                return self._send(404, {"errorMessages": ["Issue does not exist"]})
+            fields = query.get("fields", [None])[0]
+            return self._send(200, FakeJira._project(issue, fields.split(",") if fields else None))
+
+        return self._send(404, {"errorMessages": [f"Unsupported fake endpoint {method} {path}"]})
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+
+def start_fake_jira(jira=None, host="127.0.0.1", port=0):
+    """Start a fake Jira server on a daemon thread. Returns (server, "host:port")."""
+    server = _Server((host, port), _Handler)
+    server.jira = jira or FakeJira()
+    server.jira.base_url = f"http://{host}:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, name="fake-jira", daemon=True)
+    thread.start()
+    return server, f"{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake Jira server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0,
+                        help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--queue-size", type=int, default=2000)
+    parser.add_argument("--fixtures", help="directory with recorded issue payloads")
+    args = parser.parse_args()
+
+    jira = FakeJira(
+        queue_size=args.queue_size,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after,
+        fixtures_dir=args.fixtures
+    )
+    server = _Server((args.host, args.port), _Handler)
+    server.jira = jira
+    jira.base_url = f"http://{args.host}:{args.port}"
+    print(f"Fake Jira listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Multi-user load test that simulates concurrent labelers.
+
+Each virtual user logs in via /api/login and repeats the real labeling
+loop against the fake Jira:
+
+    /api/search_issue -> /api/fetch_issue -> (think) -> /api/update_issue -> /api/fetch_issue(next) ...
+
+For every concurrency step the harness reports label throughput, tail
+latency per endpoint and upstream amplification (Jira calls per label
+action).
+
+Usage:
+    python -m benchmarks.load_test --users 1 5 10 20 --duration 30 --think-ms 2000
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.fake_jira import FakeJira, start_fake_jira
+from benchmarks.run_benchmarks import configure_environment, percentile, login
+
+ENDPOINTS = ("search_issue", "fetch_issue", "update_issue")
+
+
+class _Recorder:
+    """Thread-safe latency and action accounting for one concurrency step."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {name: [] for name in ENDPOINTS}
+        self.errors = {name: 0 for name in ENDPOINTS}
+        self.label_actions = 0
+
+    def record(self, endpoint, elapsed, status):
+        with self._lock:
+            self.latencies[endpoint].append(elapsed)
+            if status >= 400:
+                self.errors[endpoint] += 1
+
+    def labeled(self):
+        with self._lock:
+            self.label_actions += 1
+
+
+def _timed(recorder, endpoint, call):
+    started = time.perf_counter()
+    response = call()
+    recorder.record(endpoint, time.perf_counter() - started, response.status_code)
+    return response
+
+
+def virtual_user(app, user_id, stop_at, think_ms, filter_id, recorder, rng):
+    """Run the labeling loop until stop_at (monotonic seconds)."""
+    client = login(app, email=f"labeler{user_id}@example.com", api_token=f"token-{user_id}")
+    issue_key, total = None, 1
+
+    while time.monotonic() < stop_at:
+        if not issue_key:
+            response = _timed(recorder, "search_issue", lambda: client.post(
+                "/api/search_issue", json={"filter_id": filter_id}))
+            if response.status_code != 200:
+                time.sleep(0.5)
+                continue
+            body = response.get_json()
+            issue_key, total = body["issue_key"], body["total_issues"]
+
+        _timed(recorder, "fetch_issue", lambda: client.get(
+            f"/api/fetch_issue?issue_key={issue_key}&total_issues={total}"))
+
+        # Reading the issue and choosing a research project
+        if think_ms:
+            time.sleep(max(0.0, rng.gauss(think_ms, think_ms / 4)) / 1000)
+        if time.monotonic() >= stop_at:
+            break
+
+        response = _timed(recorder, "update_issue", lambda: client.post("/api/update_issue", json={
+            "issue_key": issue_key,
+            "research_project": rng.choice(("Atlas", "Borealis", "Cygnus")),
+            "chargeable": "10396"
+        }))
+        if response.status_code == 200:
+            recorder.labeled()
+            body = response.get_json()
+            issue_key, total = body.get("next_issue"), body.get("total_issues", total)
+        else:
+            issue_key = None
+
+
+def run_step(app, jira, users, duration, think_ms, filter_id, seed):
+    """Run one concurrency step and return its report."""
+    recorder = _Recorder()
+    jira.reset_counts()
+    stop_at = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=virtual_user,
+            args=(app, i, stop_at, think_ms, filter_id, recorder, random.Random(seed + i)),
+            name=f"labeler-{i}"
+        )
+        for i in range(users)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    upstream = jira.snapshot_counts()
+    actions = recorder.label_actions
+    report = {
+        "users": users,
+        "duration_s": round(wall, 1),
+        "label_actions": actions,
+        "labels_per_minute": round(actions / wall * 60, 1) if wall else 0.0,
+        "jira_calls_total": sum(upstream.values()),
+        "jira_calls_per_label": round(sum(upstream.values()) / actions, 2) if actions else None,
+        "jira_calls_by_family": upstream,
+        "endpoints": {}
+    }
+    for endpoint in ENDPOINTS:
+        values = recorder.latencies[endpoint]
+        report["endpoints"][endpoint] = {
+            "requests": len(values),
+            "errors": recorder.errors[endpoint],
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+        }
+    return report
+
+
+def print_report(report):
+    print(
+        f"users={report['users']:<4} labels/min={report['labels_per_minute']:<8} "
+        f"jira calls/label={report['jira_calls_per_label']}"
+    )
+    for endpoint, stats in report["endpoints"].items():
+        print(
+            f"    {endpoint:<14} n={stats['requests']:<6} err={stats['errors']:<4} "
+            f"p50={stats['p50_ms']:>8.1f} ms  p95={stats['p95_ms']:>8.1f} ms  p99={stats['p99_ms']:>8.1f} ms"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent labelers against a fake Jira.")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 5, 10, 20],
+                        help="concurrency steps (virtual users)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per step")
+    parser.add_argument("--think-ms", type=float, default=2000.0, help="mean think time per issue")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="fake Jira latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=15.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--queue-size", type=int, default=20000)
+    parser.add_argument("--filter-id", default="10456")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    jira = FakeJira(
+        queue_size=args.queue_size,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=0
+    )
+    server, instance = start_fake_jira(jira)
+    configure_environment(instance, tempfile.mkdtemp(prefix="jira-load-"))
+
+    from app import create_app
+    from app.config import Config
+    app = create_app(Config)
+
+    reports = []
+    try:
+        for users in args.users:
+            report = run_step(app, jira, users, args.duration, args.think_ms, args.filter_id, args.seed)
+            reports.append(report)
+            print_report(report)
+    finally:
+        server.shutdown()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "steps": reports}, f, indent=2)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
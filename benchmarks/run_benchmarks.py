@@ -0,0 +1,271 @@
+"""
+End-to-end benchmarks for the Flask API against a local fake Jira.
+
+Measures throughput and p50/p99 latency of /api/search_issue,
+/api/fetch_issue (hierarchies of 1, 30 and 300 issues) and
+/api/update_issue, plus the number of upstream Jira calls per request.
+The fetch_issue_*_cold variants run without the Jira data cache and with
+one user per client (so nothing is coalesced), measuring the full
+hierarchy traversal on every request.
+
+Usage:
+    python -m benchmarks.run_benchmarks                       # print results
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from benchmarks.fake_jira import FakeJira, start_fake_jira, QUEUE_PROJECT
+
+SCENARIOS = (
+    "search_issue",
+    "fetch_issue_1",
+    "fetch_issue_30",
+    "fetch_issue_300",
+    "fetch_issue_1_cold",
+    "fetch_issue_30_cold",
+    "fetch_issue_300_cold",
+    "update_issue",
+)
+
+
+def configure_environment(jira_instance, workdir, log_level="WARNING"):
+    """
+    Point the app configuration at the fake Jira and a scratch directory.
+    Must run before anything under app/ is imported, because Config reads
+    the environment at import time.
+    """
+    os.environ.update({
+        "JIRA_SCHEME": "http",
+        "JIRA_INSTANCE": jira_instance,
+        "LOG_FILE": os.path.join(workdir, "app.log"),
+        "LOG_LEVEL": log_level,
+        "SESSION_FILE": os.path.join(workdir, "session_data.json"),
+        "AUDIT_DB": os.path.join(workdir, "audit_log.db"),
+        "WRITE_BEHIND_DB": os.path.join(workdir, "write_behind.db"),
+        "CACHE_SQLITE_PATH": os.path.join(workdir, "cache.db"),
+        "SEARCH_INDEX_DB": os.path.join(workdir, "search_index.db"),
+    })
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def login(app, email="bench@example.com", api_token="bench-token"):
+    """Return a test client with an authenticated session."""
+    client = app.test_client()
+    response = client.post("/api/login", json={"email": email, "api_token": api_token})
+    if response.status_code != 200:
+        raise RuntimeError(f"Login failed: {response.status_code} {response.get_data(as_text=True)}")
+    return client
+
+
+class _KeySource:
+    """Thread-safe supply of unlabeled queue issues for update benchmarks."""
+
+    def __init__(self, start=1):
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            return f"{QUEUE_PROJECT}-{next(self._counter)}"
+
+
+def make_operation(name, keys):
+    """Return a callable(client) -> status_code for a scenario."""
+    if name == "search_issue":
+        return lambda client: client.post("/api/search_issue", json={"filter_id": "10456"}).status_code
+    if name.startswith("fetch_issue_"):
+        root = f"H{name.split('_')[2]}-1"
+        return lambda client: client.get(f"/api/fetch_issue?issue_key={root}&total_issues=1").status_code
+    if name == "update_issue":
+        def update(client):
+            return client.post("/api/update_issue", json={
+                "issue_key": keys.next(),
+                "research_project": "Atlas",
+                "chargeable": "10396"
+            }).status_code
+        return update
+    raise ValueError(f"Unknown scenario {name}")
+
+
+@contextmanager
+def cold_cache():
+    """Run a block with the Jira data cache disabled (NullCache)."""
+    from app.services import cache_service
+    previous = cache_service.get_cache()
+    cache_service._cache = cache_service.create_cache("none")
+    try:
+        yield
+    finally:
+        cache_service._cache = previous
+
+
+def run_scenario(app, jira, name, iterations, concurrency, keys):
+    """Run one scenario and return its statistics."""
+    if name.endswith("_cold"):
+        with cold_cache():
+            return _run_scenario(app, jira, name, iterations, concurrency, keys, cold=True)
+    return _run_scenario(app, jira, name, iterations, concurrency, keys)
+
+
+def _run_scenario(app, jira, name, iterations, concurrency, keys, cold=False):
+    operation = make_operation(name, keys)
+    if cold:
+        # Distinct users, so concurrent identical fetches are not coalesced either
+        clients = [login(app, email=f"bench{i}@example.com") for i in range(concurrency)]
+    else:
+        clients = [login(app) for _ in range(concurrency)]
+    # Warm-up (connection pools, imports, first-request setup)
+    operation(clients[0])
+
+    jira.reset_counts()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    remaining = itertools.count()
+
+    def worker(client):
+        while next(remaining) < iterations:
+            started = time.perf_counter()
+            status = operation(client)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                if status >= 400:
+                    errors.append(status)
+
+    wall_started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(client,)) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_started
+
+    upstream = jira.snapshot_counts()
+    total_upstream = sum(upstream.values())
+    return {
+        "iterations": len(latencies),
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        "jira_calls_per_request": round(total_upstream / len(latencies), 2) if latencies else 0.0,
+        "jira_calls_by_family": upstream,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print a comparison table; return True if any latency regressed beyond tolerance."""
+    regressed = False
+    print(f"{'scenario':<22}{'metric':<10}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p99_ms", "throughput_rps"):
+            before, after = previous.get(metric, 0.0), current.get(metric, 0.0)
+            change = (after - before) / before if before else 0.0
+            worse = change > tolerance if metric != "throughput_rps" else -change > tolerance
+            regressed = regressed or worse
+            flag = "  !" if worse else ""
+            print(f"{name:<22}{metric:<10}{before:>12.2f}{after:>12.2f}{change:>+10.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the API against a local fake Jira.")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fake Jira latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0,
+                        help="fraction of fake Jira calls answered with 429 (Retry-After: 0)")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--save-baseline", help="store results as the baseline at this path")
+    parser.add_argument("--compare", help="compare against a stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative regression before failing --compare")
+    args = parser.parse_args(argv)
+
+    jira = FakeJira(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=0
+    )
+    server, instance = start_fake_jira(jira)
+    workdir = tempfile.mkdtemp(prefix="jira-bench-")
+    configure_environment(instance, workdir)
+
+    from app import create_app
+    from app.config import Config
+    app = create_app(Config)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "rate_limit_ratio": args.rate_limit_ratio,
+        },
+        "results": {}
+    }
+    keys = _KeySource()
+    try:
+        for name in args.scenarios:
+            iterations = (
+                max(args.concurrency, args.iterations // 3) if name.startswith("fetch_issue_300")
+                else args.iterations
+            )
+            stats = run_scenario(app, jira, name, iterations, args.concurrency, keys)
+            results["results"][name] = stats
+            print(
+                f"{name:<22} {stats['throughput_rps']:>8.2f} req/s  p50 {stats['p50_ms']:>9.2f} ms  "
+                f"p99 {stats['p99_ms']:>9.2f} ms  jira calls/req {stats['jira_calls_per_request']:>6.2f}  "
+                f"errors {stats['errors']}"
+            )
+    finally:
+        server.shutdown()
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
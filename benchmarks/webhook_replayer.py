@@ -0,0 +1,139 @@
+"""
+Local replayer for Jira webhooks.
+
+Sends recorded Jira webhook payloads to /api/webhooks/jira, signed with the
+shared secret the way Jira does (X-Hub-Signature: sha256=<hmac>).
+
+Sources:
+    FILE                  JSON array or JSON-lines file of webhook payloads
+    --from-fake URL       events recorded by a running fake Jira (GET /_events)
+
+Usage:
+    python -m benchmarks.webhook_replayer events.jsonl --url http://localhost:5000/api/webhooks/jira --secret s3cret
+    python -m benchmarks.webhook_replayer --from-fake http://127.0.0.1:8089 --url ... --secret s3cret
+    python -m benchmarks.webhook_replayer --demo       # in-process end-to-end check
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+
+import requests
+
+from benchmarks.fake_jira import FakeJira, start_fake_jira, ACCOUNT_IDS
+from benchmarks.run_benchmarks import configure_environment, login
+
+
+def load_events(path):
+    """Read webhook payloads from a JSON array or JSON-lines file."""
+    with open(path) as f:
+        text = f.read().strip()
+    if text.startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def replay(events, send, secret, delay=0.0):
+    """
+    Sign and send each event with send(body, headers) -> (status, json).
+    Returns a list of (event name, status, response body).
+    """
+    from app.services.webhook_service import sign_payload
+    results = []
+    for event in events:
+        body = json.dumps(event).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-Hub-Signature": sign_payload(body, secret)}
+        status, response = send(body, headers)
+        results.append((event.get("webhookEvent"), status, response))
+        if delay:
+            time.sleep(delay)
+    return results
+
+
+def http_sender(url):
+    def send(body, headers):
+        response = requests.post(url, data=body, headers=headers, timeout=10)
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, response.text
+    return send
+
+
+def client_sender(client):
+    def send(body, headers):
+        response = client.post("/api/webhooks/jira", data=body, headers=headers)
+        return response.status_code, response.get_json()
+    return send
+
+
+def demo():
+    """Warm the cache, change data behind the backend's back, replay the events, re-read."""
+    secret = "replayer-secret"
+    jira = FakeJira(latency_ms=5)
+    server, instance = start_fake_jira(jira)
+    configure_environment(instance, tempfile.mkdtemp(prefix="jira-webhooks-"))
+    import os
+    os.environ["JIRA_WEBHOOK_SECRET"] = secret
+
+    from app import create_app
+    from app.config import Config
+    app = create_app(Config)
+    client = login(app)
+    send = client_sender(client)
+
+    try:
+        client.get("/api/fetch_issue?issue_key=H30-1&total_issues=1")
+        client.post("/api/search_issue", json={"filter_id": "10456"})
+
+        # Another Jira client edits, logs work and deletes issues
+        jira.update("H30-5", {"fields": {"summary": "Edited outside the labeling tool"}})
+        jira.add_worklog("H30-5", ACCOUNT_IDS[0], 1800)
+        jira.delete_issue("LAB-1")
+
+        for name, status, response in replay(jira.drain_events(), send, secret):
+            print(f"{name:<22} {status}  {response}")
+
+        jira.reset_counts()
+        body = client.get("/api/fetch_issue?issue_key=H30-1&total_issues=1").get_json()
+        summary = next(issue["name"] for issue in body["issues"] if issue["key"] == "H30-5")
+        search = client.post("/api/search_issue", json={"filter_id": "10456"}).get_json()
+        print(f"H30-5 summary after replay: {summary!r}")
+        print(f"next issue after replay: {search['issue_key']} ({search['total_issues']} remaining)")
+        print(f"Jira calls after replay: {jira.snapshot_counts()}")
+    finally:
+        server.shutdown()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay Jira webhook payloads against the backend.")
+    parser.add_argument("events", nargs="?", help="JSON or JSON-lines file with webhook payloads")
+    parser.add_argument("--from-fake", help="base URL of a running fake Jira to pull recorded events from")
+    parser.add_argument("--url", default="http://localhost:5000/api/webhooks/jira")
+    parser.add_argument("--secret", help="shared secret (JIRA_WEBHOOK_SECRET of the backend)")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds between events")
+    parser.add_argument("--demo", action="store_true", help="run an in-process end-to-end check")
+    args = parser.parse_args(argv)
+
+    if args.demo:
+        return demo()
+    if not args.secret:
+        parser.error("--secret is required")
+    if args.from_fake:
+        events = requests.get(f"{args.from_fake.rstrip('/')}/_events", timeout=10).json()
+    elif args.events:
+        events = load_events(args.events)
+    else:
+        parser.error("give an events file or --from-fake")
+
+    failures = 0
+    for name, status, response in replay(events, http_sender(args.url), args.secret, args.delay):
+        print(f"{name:<22} {status}  {response}")
+        failures += status != 200
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
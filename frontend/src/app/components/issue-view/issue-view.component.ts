@@ -4,7 +4,7 @@ import { FormsModule } from '@angular/forms';
 import { ActivatedRoute, Router } from '@angular/router';
 import { ApiService } from '../../services/api.service';
 import { IssueResponse, Issue } from '../../models/issue.model';
-import { combineLatest, EMPTY } from 'rxjs';
+import { combineLatest, EMPTY, of } from 'rxjs';
 import { takeUntil, switchMap, map } from 'rxjs/operators';
 import { Subject } from 'rxjs';
 
@@ -547,6 +547,8 @@ export class IssueViewComponent implements OnInit, OnDestroy {
 
   // For cleanup of subscriptions
   private destroy$ = new Subject<void>();
+  // Next issue hierarchy returned inline by updateIssue (advance mode)
+  private prefetchedIssue: { key: string; data: IssueResponse } | null = null;
 
   // Keyword mapping for auto-detection
   private readonly keywordMapping: { [key: string]: string[] } = {
@@ -609,7 +611,12 @@ export class IssueViewComponent implements OnInit, OnDestroy {
         this.updating = false;
         this.selectedProject = '';
 
-        if (issueKey) {
+        if (issueKey && this.prefetchedIssue?.key === issueKey) {
+          // Already delivered with the update response, skip the round trip
+          const data = this.prefetchedIssue.data;
+          this.prefetchedIssue = null;
+          return of({ data, issueKey });
+        } else if (issueKey) {
           // Use switchMap to cancel previous request if a new one comes in
           return this.apiService.fetchIssue(issueKey, this.totalIssues).pipe(
             map(data => ({ data, issueKey }))
@@ -872,6 +879,9 @@ export class IssueViewComponent implements OnInit, OnDestroy {
             this.updating = false;
             this.updateError = '';
             this.updateSuccess = '';
+            this.prefetchedIssue = response.next_issue_data
+              ? { key: response.next_issue, data: response.next_issue_data }
+              : null;
 
             // Navigate immediately to next issue
             this.router.navigate(['/issue', response.next_issue], {
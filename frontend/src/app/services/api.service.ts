@@ -51,11 +51,13 @@ export class ApiService {
     );
   }
 
-  updateIssue(issueKey: string, researchProject: string, chargeable: string): Observable<any> {
+  updateIssue(issueKey: string, researchProject: string, chargeable: string, advance = true): Observable<any> {
+    // advance: backend returns the next issue's hierarchy inline (next_issue_data)
     return this.http.post(`${this.apiUrl}/update_issue`, {
       issue_key: issueKey,
       research_project: researchProject,
-      chargeable
+      chargeable,
+      advance
     }, this.httpOptions);
   }
 }